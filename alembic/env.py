@@ -24,6 +24,11 @@ from db.db import Base
 from models.user import User
 from models.ticket import Ticket
 from models.comment import TicketComment
+from models.outbox import OutboxEvent
+from models.ticket_stat import TicketStat
+from models.ticket_history import TicketStatusHistory
+from models.sla_digest import SlaDigest, RollupWatermark
+from models.token_revocation import TokenRevocation
 
 target_metadata = Base.metadata
 
@@ -0,0 +1,104 @@
+"""add status history and sla digests
+
+Revision ID: 0a5c7e93d1b6
+Revises: e2d6a0c47f18
+Create Date: 2026-10-18 18:12:55.271940
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0a5c7e93d1b6'
+down_revision: Union[str, Sequence[str], None] = 'e2d6a0c47f18'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Records every status change, whichever code path made it. Time in the old
+# status runs from the ticket's previous history row (or its creation).
+HISTORY_FUNCTION = """
+CREATE OR REPLACE FUNCTION ticket_status_history_apply() RETURNS trigger
+LANGUAGE plpgsql AS $$
+BEGIN
+    IF TG_OP = 'INSERT' THEN
+        INSERT INTO ticket_status_history
+            (ticket_id, from_status, to_status, priority, assignee_id, changed_at, in_status_seconds, age_seconds)
+        SELECT id, NULL, status, priority, assigned_to, coalesce(created_at, now()), NULL, 0
+        FROM new_rows
+        ORDER BY id;
+    ELSE
+        INSERT INTO ticket_status_history
+            (ticket_id, from_status, to_status, priority, assignee_id, changed_at, in_status_seconds, age_seconds)
+        SELECT n.id, o.status, n.status, n.priority, coalesce(n.assigned_to, o.assigned_to), now(),
+               extract(epoch FROM now() - coalesce(
+                   (SELECT h.changed_at FROM ticket_status_history h
+                    WHERE h.ticket_id = n.id ORDER BY h.id DESC LIMIT 1),
+                   n.created_at)),
+               extract(epoch FROM now() - n.created_at)
+        FROM new_rows n
+        JOIN old_rows o ON o.id = n.id
+        WHERE n.status IS DISTINCT FROM o.status
+        ORDER BY n.id;
+    END IF;
+    RETURN NULL;
+END
+$$
+"""
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('ticket_status_history',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('ticket_id', sa.Integer(), nullable=False),
+    sa.Column('from_status', sa.String(length=20), nullable=True),
+    sa.Column('to_status', sa.String(length=20), nullable=False),
+    sa.Column('priority', sa.String(length=20), nullable=False),
+    sa.Column('assignee_id', sa.Integer(), nullable=True),
+    sa.Column('changed_at', sa.DateTime(), nullable=False),
+    sa.Column('in_status_seconds', sa.Float(), nullable=True),
+    sa.Column('age_seconds', sa.Float(), nullable=False),
+    sa.ForeignKeyConstraint(['ticket_id'], ['tickets.id'], ),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index('ix_ticket_status_history_ticket_id_id', 'ticket_status_history', ['ticket_id', 'id'])
+    op.create_table('sla_digests',
+    sa.Column('day', sa.Date(), nullable=False),
+    sa.Column('metric', sa.String(length=20), nullable=False),
+    sa.Column('status', sa.String(length=20), nullable=False),
+    sa.Column('dimension', sa.String(length=10), nullable=False),
+    sa.Column('group_value', sa.String(length=20), nullable=False),
+    sa.Column('count', sa.BigInteger(), nullable=False),
+    sa.Column('digest', sa.JSON(), nullable=False),
+    sa.PrimaryKeyConstraint('day', 'metric', 'status', 'dimension', 'group_value')
+    )
+    op.create_table('rollup_watermarks',
+    sa.Column('name', sa.String(length=50), nullable=False),
+    sa.Column('position', sa.BigInteger(), nullable=False),
+    sa.PrimaryKeyConstraint('name')
+    )
+    op.execute(HISTORY_FUNCTION)
+    op.execute("""
+        CREATE TRIGGER ticket_status_history_insert AFTER INSERT ON tickets
+        REFERENCING NEW TABLE AS new_rows
+        FOR EACH STATEMENT EXECUTE FUNCTION ticket_status_history_apply()
+    """)
+    op.execute("""
+        CREATE TRIGGER ticket_status_history_update AFTER UPDATE ON tickets
+        REFERENCING OLD TABLE AS old_rows NEW TABLE AS new_rows
+        FOR EACH STATEMENT EXECUTE FUNCTION ticket_status_history_apply()
+    """)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.execute("DROP TRIGGER IF EXISTS ticket_status_history_update ON tickets")
+    op.execute("DROP TRIGGER IF EXISTS ticket_status_history_insert ON tickets")
+    op.execute("DROP FUNCTION IF EXISTS ticket_status_history_apply()")
+    op.drop_table('rollup_watermarks')
+    op.drop_table('sla_digests')
+    op.drop_index('ix_ticket_status_history_ticket_id_id', table_name='ticket_status_history')
+    op.drop_table('ticket_status_history')
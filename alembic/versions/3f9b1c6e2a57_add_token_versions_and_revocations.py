@@ -0,0 +1,40 @@
+"""add token versions and revocations
+
+Revision ID: 3f9b1c6e2a57
+Revises: 0a5c7e93d1b6
+Create Date: 2026-10-18 16:41:09.502117
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '3f9b1c6e2a57'
+down_revision: Union[str, Sequence[str], None] = '0a5c7e93d1b6'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # A constant default is stored in the catalog, so this does not rewrite users
+    op.add_column('users', sa.Column('token_version', sa.Integer(), server_default='0', nullable=False))
+    op.create_table('token_revocations',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('user_id', sa.Integer(), nullable=False),
+    sa.Column('token_version', sa.Integer(), nullable=False),
+    sa.Column('created_at', sa.DateTime(), server_default=sa.text('now()'), nullable=False),
+    sa.ForeignKeyConstraint(['user_id'], ['users.id'], ),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index('ix_token_revocations_created_at', 'token_revocations', ['created_at'])
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_token_revocations_created_at', table_name='token_revocations')
+    op.drop_table('token_revocations')
+    op.drop_column('users', 'token_version')
@@ -0,0 +1,54 @@
+"""add hot path indexes
+
+Revision ID: 5e1b9c4d7a20
+Revises: 7c3c43e81635
+Create Date: 2026-10-18 09:12:40.118204
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '5e1b9c4d7a20'
+down_revision: Union[str, Sequence[str], None] = '7c3c43e81635'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # CREATE INDEX CONCURRENTLY cannot run inside a transaction block
+    with op.get_context().autocommit_block():
+        op.create_index('ix_tickets_created_by_id', 'tickets', ['created_by', 'id'],
+                        postgresql_concurrently=True, if_not_exists=True)
+        op.create_index('ix_tickets_assigned_to_status', 'tickets', ['assigned_to', 'status'],
+                        postgresql_concurrently=True, if_not_exists=True)
+        op.create_index('ix_tickets_status_priority_created_at', 'tickets',
+                        ['status', 'priority', 'created_at'],
+                        postgresql_concurrently=True, if_not_exists=True)
+        op.create_index('ix_tickets_updated_at_id', 'tickets', ['updated_at', 'id'],
+                        postgresql_concurrently=True, if_not_exists=True)
+        op.create_index('ix_ticket_comments_ticket_id_id', 'ticket_comments', ['ticket_id', 'id'],
+                        postgresql_concurrently=True, if_not_exists=True)
+        op.create_index('ix_users_email_lower', 'users', [sa.text('lower(email)')],
+                        postgresql_concurrently=True, if_not_exists=True)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        op.drop_index('ix_users_email_lower', table_name='users',
+                      postgresql_concurrently=True, if_exists=True)
+        op.drop_index('ix_ticket_comments_ticket_id_id', table_name='ticket_comments',
+                      postgresql_concurrently=True, if_exists=True)
+        op.drop_index('ix_tickets_updated_at_id', table_name='tickets',
+                      postgresql_concurrently=True, if_exists=True)
+        op.drop_index('ix_tickets_status_priority_created_at', table_name='tickets',
+                      postgresql_concurrently=True, if_exists=True)
+        op.drop_index('ix_tickets_assigned_to_status', table_name='tickets',
+                      postgresql_concurrently=True, if_exists=True)
+        op.drop_index('ix_tickets_created_by_id', table_name='tickets',
+                      postgresql_concurrently=True, if_exists=True)
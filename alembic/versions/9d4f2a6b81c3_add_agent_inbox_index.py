@@ -0,0 +1,37 @@
+"""add agent inbox index
+
+Revision ID: 9d4f2a6b81c3
+Revises: 5e1b9c4d7a20
+Create Date: 2026-10-18 10:02:17.530611
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '9d4f2a6b81c3'
+down_revision: Union[str, Sequence[str], None] = '5e1b9c4d7a20'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Partial index: only open work is indexed, so it stays small as closed history grows
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_tickets_agent_inbox', 'tickets',
+            ['assigned_to', sa.text('priority DESC'), 'created_at', 'id'],
+            postgresql_where=sa.text("status IN ('assigned', 'in_progress')"),
+            postgresql_concurrently=True, if_not_exists=True,
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        op.drop_index('ix_tickets_agent_inbox', table_name='tickets',
+                      postgresql_concurrently=True, if_exists=True)
@@ -0,0 +1,57 @@
+"""add ticket search vectors
+
+Revision ID: b7e3d915c2a4
+Revises: f4a8c2d19b37
+Create Date: 2026-10-18 15:37:12.640551
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b7e3d915c2a4'
+down_revision: Union[str, Sequence[str], None] = 'f4a8c2d19b37'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Stored generated columns: Postgres keeps them current on every write.
+    # Adding one rewrites the table, so run this in a maintenance window on large installs.
+    op.add_column('tickets', sa.Column(
+        'search_vector', postgresql.TSVECTOR(),
+        sa.Computed(
+            "setweight(to_tsvector('english', coalesce(title, '')), 'A') || "
+            "setweight(to_tsvector('english', coalesce(description, '')), 'B')",
+            persisted=True,
+        ),
+        nullable=True,
+    ))
+    op.add_column('ticket_comments', sa.Column(
+        'search_vector', postgresql.TSVECTOR(),
+        sa.Computed("to_tsvector('english', comment)", persisted=True),
+        nullable=True,
+    ))
+    with op.get_context().autocommit_block():
+        op.create_index('ix_tickets_search_vector', 'tickets', ['search_vector'],
+                        postgresql_using='gin',
+                        postgresql_concurrently=True, if_not_exists=True)
+        op.create_index('ix_ticket_comments_search_vector', 'ticket_comments', ['search_vector'],
+                        postgresql_using='gin',
+                        postgresql_concurrently=True, if_not_exists=True)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        op.drop_index('ix_ticket_comments_search_vector', table_name='ticket_comments',
+                      postgresql_concurrently=True, if_exists=True)
+        op.drop_index('ix_tickets_search_vector', table_name='tickets',
+                      postgresql_concurrently=True, if_exists=True)
+    op.drop_column('ticket_comments', 'search_vector')
+    op.drop_column('tickets', 'search_vector')
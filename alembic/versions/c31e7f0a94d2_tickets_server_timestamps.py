@@ -0,0 +1,42 @@
+"""tickets server timestamps
+
+Revision ID: c31e7f0a94d2
+Revises: 9d4f2a6b81c3
+Create Date: 2026-10-18 11:26:05.402913
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c31e7f0a94d2'
+down_revision: Union[str, Sequence[str], None] = '9d4f2a6b81c3'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.alter_column('tickets', 'created_at',
+               existing_type=sa.DateTime(),
+               server_default=sa.text('now()'),
+               existing_nullable=True)
+    op.alter_column('tickets', 'updated_at',
+               existing_type=sa.DateTime(),
+               server_default=sa.text('now()'),
+               existing_nullable=True)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.alter_column('tickets', 'updated_at',
+               existing_type=sa.DateTime(),
+               server_default=None,
+               existing_nullable=True)
+    op.alter_column('tickets', 'created_at',
+               existing_type=sa.DateTime(),
+               server_default=None,
+               existing_nullable=True)
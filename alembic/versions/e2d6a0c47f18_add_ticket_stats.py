@@ -0,0 +1,107 @@
+"""add ticket stats
+
+Revision ID: e2d6a0c47f18
+Revises: b7e3d915c2a4
+Create Date: 2026-10-18 16:48:29.905127
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e2d6a0c47f18'
+down_revision: Union[str, Sequence[str], None] = 'b7e3d915c2a4'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Statement-level triggers with transition tables: every write path, including
+# bulk updates and imports, applies one aggregated delta per statement inside
+# its own transaction. Keys are upserted in sorted order to avoid deadlocks.
+APPLY_FUNCTION = """
+CREATE OR REPLACE FUNCTION ticket_stats_apply() RETURNS trigger
+LANGUAGE plpgsql AS $$
+DECLARE
+    slot smallint := floor(random() * 8);  -- models.ticket_stat.STATS_SHARDS
+BEGIN
+    IF TG_OP = 'INSERT' THEN
+        INSERT INTO ticket_stats AS s (status, priority, assignee_id, shard, count)
+        SELECT status, priority, coalesce(assigned_to, 0), slot, count(*)
+        FROM new_rows
+        GROUP BY 1, 2, 3
+        ORDER BY 1, 2, 3
+        ON CONFLICT (status, priority, assignee_id, shard)
+        DO UPDATE SET count = s.count + EXCLUDED.count;
+    ELSIF TG_OP = 'UPDATE' THEN
+        INSERT INTO ticket_stats AS s (status, priority, assignee_id, shard, count)
+        SELECT status, priority, assignee_id, slot, sum(delta)
+        FROM (
+            SELECT status, priority, coalesce(assigned_to, 0) AS assignee_id, 1 AS delta FROM new_rows
+            UNION ALL
+            SELECT status, priority, coalesce(assigned_to, 0), -1 FROM old_rows
+        ) AS changes
+        GROUP BY 1, 2, 3
+        HAVING sum(delta) <> 0
+        ORDER BY 1, 2, 3
+        ON CONFLICT (status, priority, assignee_id, shard)
+        DO UPDATE SET count = s.count + EXCLUDED.count;
+    ELSE
+        INSERT INTO ticket_stats AS s (status, priority, assignee_id, shard, count)
+        SELECT status, priority, coalesce(assigned_to, 0), slot, -count(*)
+        FROM old_rows
+        GROUP BY 1, 2, 3
+        ORDER BY 1, 2, 3
+        ON CONFLICT (status, priority, assignee_id, shard)
+        DO UPDATE SET count = s.count + EXCLUDED.count;
+    END IF;
+    RETURN NULL;
+END
+$$
+"""
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('ticket_stats',
+    sa.Column('status', sa.String(length=20), nullable=False),
+    sa.Column('priority', sa.String(length=20), nullable=False),
+    sa.Column('assignee_id', sa.Integer(), nullable=False),
+    sa.Column('shard', sa.SmallInteger(), nullable=False),
+    sa.Column('count', sa.BigInteger(), nullable=False),
+    sa.PrimaryKeyConstraint('status', 'priority', 'assignee_id', 'shard')
+    )
+    op.execute(APPLY_FUNCTION)
+    op.execute("""
+        CREATE TRIGGER ticket_stats_insert AFTER INSERT ON tickets
+        REFERENCING NEW TABLE AS new_rows
+        FOR EACH STATEMENT EXECUTE FUNCTION ticket_stats_apply()
+    """)
+    op.execute("""
+        CREATE TRIGGER ticket_stats_update AFTER UPDATE ON tickets
+        REFERENCING OLD TABLE AS old_rows NEW TABLE AS new_rows
+        FOR EACH STATEMENT EXECUTE FUNCTION ticket_stats_apply()
+    """)
+    op.execute("""
+        CREATE TRIGGER ticket_stats_delete AFTER DELETE ON tickets
+        REFERENCING OLD TABLE AS old_rows
+        FOR EACH STATEMENT EXECUTE FUNCTION ticket_stats_apply()
+    """)
+    # The triggers hold a lock on tickets until this transaction commits, so
+    # the backfill cannot miss or double count a concurrent write
+    op.execute("""
+        INSERT INTO ticket_stats (status, priority, assignee_id, shard, count)
+        SELECT status, priority, coalesce(assigned_to, 0), 0, count(*)
+        FROM tickets
+        GROUP BY 1, 2, 3
+    """)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.execute("DROP TRIGGER IF EXISTS ticket_stats_delete ON tickets")
+    op.execute("DROP TRIGGER IF EXISTS ticket_stats_update ON tickets")
+    op.execute("DROP TRIGGER IF EXISTS ticket_stats_insert ON tickets")
+    op.execute("DROP FUNCTION IF EXISTS ticket_stats_apply()")
+    op.drop_table('ticket_stats')
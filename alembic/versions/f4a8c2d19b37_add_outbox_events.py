@@ -0,0 +1,46 @@
+"""add outbox events
+
+Revision ID: f4a8c2d19b37
+Revises: c31e7f0a94d2
+Create Date: 2026-10-18 14:02:41.118304
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f4a8c2d19b37'
+down_revision: Union[str, Sequence[str], None] = 'c31e7f0a94d2'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('outbox_events',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('event_type', sa.String(length=50), nullable=False),
+    sa.Column('ticket_id', sa.Integer(), nullable=False),
+    sa.Column('payload', sa.JSON(), nullable=False),
+    sa.Column('attempts', sa.Integer(), nullable=False),
+    sa.Column('last_error', sa.Text(), nullable=True),
+    sa.Column('created_at', sa.DateTime(), nullable=False),
+    sa.Column('available_at', sa.DateTime(), nullable=False),
+    sa.Column('delivered_at', sa.DateTime(), nullable=True),
+    sa.Column('failed_at', sa.DateTime(), nullable=True),
+    sa.PrimaryKeyConstraint('id')
+    )
+    # Partial index: the dispatcher only ever scans rows still waiting for delivery
+    op.create_index('ix_outbox_events_pending', 'outbox_events', ['available_at', 'id'],
+                    postgresql_where=sa.text('delivered_at IS NULL AND failed_at IS NULL'))
+    op.create_index('ix_outbox_events_delivered_at', 'outbox_events', ['delivered_at'])
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_outbox_events_delivered_at', table_name='outbox_events')
+    op.drop_index('ix_outbox_events_pending', table_name='outbox_events')
+    op.drop_table('outbox_events')
@@ -1,20 +1,30 @@
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, Request
 from sqlalchemy.orm import Session
 
-from db.db import get_db
+from db.db import get_db, run_db
 from schemas.user import UserCreate, UserLogin
 from services.auth_service import register_employee, login_user
 from core.security import get_current_user
+from core.ratelimit import login_by_ip, login_by_email, register_by_ip, register_by_email
 
 router = APIRouter( tags=["Auth"])
 
+def _client_ip(request: Request) -> str:
+    # Behind a proxy, run uvicorn with --proxy-headers so this is the real client
+    return request.client.host if request.client else "unknown"
+
 @router.post("/register")
-def register(
+async def register(
     payload: UserCreate,
+    request: Request,
     db: Session = Depends(get_db),
 ) -> dict:
-    user = register_employee(
+    # Before any DB or bcrypt work, so throttled callers cost almost nothing
+    register_by_ip.check(_client_ip(request))
+    register_by_email.check(payload.email.lower())
+    user = await run_db(
         db,
+        register_employee,
         name=payload.name,
         email=payload.email,
         password=payload.password,
@@ -23,12 +33,16 @@ def register(
 
 
 @router.post("/login")
-def login(
+async def login(
     payload: UserLogin,
+    request: Request,
     db: Session = Depends(get_db),
 ) -> dict:
-    token = login_user(
+    login_by_ip.check(_client_ip(request))
+    login_by_email.check(payload.email.lower())
+    token = await run_db(
         db,
+        login_user,
         email=payload.email,
         password=payload.password,
     )
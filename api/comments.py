@@ -1,28 +1,41 @@
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, Header, Query, Response
 from sqlalchemy.orm import Session
 
-from db.db import get_db
+from db.db import get_db, run_db
+from core.config import settings
+from core.etag import etag_matches
 from schemas.comment import CommentCreate
 from api.deps import employee_dep,current_user_dep
-from services.comment_service import add_comment, list_comments
+from services.comment_service import add_comment, list_comments, get_comments_etag
 
 router = APIRouter(tags=["Comments"])
 
 @router.post("/{ticket_id}/comments")
-def create_comment(
+async def create_comment(
     ticket_id: int,
     payload: CommentCreate,
     db: Session = Depends(get_db),
     current_user: dict = Depends(employee_dep),
 ) -> dict:
-    comment = add_comment(db, current_user, ticket_id, payload)
+    comment = await run_db(db, add_comment, current_user, ticket_id, payload)
     return {"success": True, "message": "Comment added", "data": comment}
 
 @router.get("/{ticket_id}/comments")
-def get_comments(
+async def get_comments(
     ticket_id: int,
+    response: Response,
+    limit: int = Query(default=settings.PAGE_SIZE_DEFAULT, ge=1, le=settings.PAGE_SIZE_MAX),
+    after_id: int | None = Query(default=None, ge=0),
+    before_id: int | None = Query(default=None, ge=1),
+    if_none_match: str | None = Header(default=None),
     db: Session = Depends(get_db),
     current_user: dict = Depends(current_user_dep),
-) -> dict:
-    comments = list_comments(db, current_user, ticket_id)
-    return {"success": True, "message": "Comments fetched", "data": {"comments": comments}}
+):
+    # The tag is read before the list, so a comment landing in between only
+    # makes the next conditional request miss; it never pins a stale body.
+    etag = await run_db(db, get_comments_etag, current_user, ticket_id)
+    if etag_matches(if_none_match, etag):
+        return Response(status_code=304, headers={"ETag": etag})
+    page = await run_db(db, list_comments, current_user, ticket_id, limit, after_id, before_id)
+    response.headers["ETag"] = etag
+    return {"success": True, "message": "Comments fetched", "data": page}
@@ -0,0 +1,53 @@
+import asyncio
+import time
+from fastapi import APIRouter, Depends, Header, Query
+from fastapi.responses import StreamingResponse
+
+from api.deps import current_user_dep
+from core.config import settings
+from core.events import hub, format_sse
+from services.ticket_service import _can_access_ticket
+
+router = APIRouter(tags=["Events"])
+
+async def _event_stream(current_user: dict, last_event_id: str | None):
+    sub, replay, reset_id = hub.subscribe(
+        lambda event: _can_access_ticket(current_user, event), last_event_id
+    )
+    # The stream ends when the token does; the client reconnects with a fresh
+    # token and its Last-Event-ID and picks up where it left off.
+    expires_at = current_user.get("exp")
+    try:
+        yield "retry: 3000\n\n"
+        if reset_id is not None:
+            yield format_sse(reset_id, "reset", {"reason": "missed events, refetch state"})
+        for event in replay:
+            yield format_sse(hub.event_id(event), event.type, event.data)
+        while not sub.overflowed:
+            timeout = settings.EVENTS_KEEPALIVE_SECONDS
+            if expires_at is not None:
+                remaining = expires_at - time.time()
+                if remaining <= 0:
+                    break
+                timeout = min(timeout, remaining)
+            try:
+                event = await asyncio.wait_for(sub.queue.get(), timeout)
+            except asyncio.TimeoutError:
+                # Comment line keeps proxies from closing an idle connection
+                yield ": keepalive\n\n"
+                continue
+            yield format_sse(hub.event_id(event), event.type, event.data)
+    finally:
+        hub.unsubscribe(sub)
+
+@router.get("/stream")
+async def stream(
+    last_event_id: str | None = Header(default=None),
+    resume_from: str | None = Query(default=None, alias="last_event_id"),
+    current_user: dict = Depends(current_user_dep),
+) -> StreamingResponse:
+    return StreamingResponse(
+        _event_stream(current_user, last_event_id or resume_from),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
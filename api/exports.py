@@ -0,0 +1,34 @@
+from datetime import datetime
+from typing import Literal
+from fastapi import APIRouter, Depends
+from fastapi.responses import StreamingResponse
+
+from api.deps import admin_dep
+from services.export_service import export_tickets, export_comments
+
+router = APIRouter(tags=["Exports"])
+
+MEDIA_TYPES = {"ndjson": "application/x-ndjson", "csv": "text/csv"}
+
+def _stream(chunks, name: str, fmt: str) -> StreamingResponse:
+    return StreamingResponse(
+        chunks,
+        media_type=MEDIA_TYPES[fmt],
+        headers={"Content-Disposition": f'attachment; filename="{name}.{fmt}"'},
+    )
+
+@router.get("/tickets")
+def export_all_tickets(
+    format: Literal["ndjson", "csv"] = "ndjson",
+    updated_since: datetime | None = None,
+    current_user: dict = Depends(admin_dep),
+) -> StreamingResponse:
+    return _stream(export_tickets(format, updated_since), "tickets", format)
+
+@router.get("/comments")
+def export_all_comments(
+    format: Literal["ndjson", "csv"] = "ndjson",
+    updated_since: datetime | None = None,
+    current_user: dict = Depends(admin_dep),
+) -> StreamingResponse:
+    return _stream(export_comments(format, updated_since), "comments", format)
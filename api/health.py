@@ -0,0 +1,76 @@
+from fastapi import APIRouter, Depends, Response
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.orm import Session
+
+from api.deps import admin_dep
+from db.db import get_db, run_db, engine, async_engine
+from db.pool import pool_status
+from core.hashing import hashing_status
+from core.ratelimit import rate_limit_status
+from core.security import claims_cache
+from core.events import hub
+from core.jobs import jobs_status
+from core.revocation import token_revocations
+from services.similarity_service import similarity_index
+from services.assignment_service import assignment_status
+from services.user_service import user_cache
+from services.health_service import db_round_trip_ms
+from services.outbox_service import outbox_enabled, outbox_status
+
+router = APIRouter(tags=["Health"])
+
+async def _db_latency(db: Session) -> float | None:
+    try:
+        return await run_db(db, db_round_trip_ms)
+    except SQLAlchemyError:
+        return None
+
+# Unauthenticated, for load balancers and orchestrators: only whether this
+# instance can serve, never how it is doing inside
+@router.get("/ready")
+async def ready(
+    response: Response,
+    db: Session = Depends(get_db),
+) -> dict:
+    is_ready = await _db_latency(db) is not None
+    if not is_ready:
+        response.status_code = 503
+    return {
+        "success": is_ready,
+        "message": "Ready" if is_ready else "Database unavailable",
+        "data": None,
+    }
+
+@router.get("/details")
+async def details(
+    response: Response,
+    db: Session = Depends(get_db),
+    current_user: dict = Depends(admin_dep),
+) -> dict:
+    latency = await _db_latency(db)
+    outbox = None
+    if latency is not None and outbox_enabled():
+        outbox = await run_db(db, outbox_status)
+    pools = {"sync": pool_status(engine)}
+    if async_engine is not None:
+        pools["async"] = pool_status(async_engine.sync_engine)
+    is_ready = latency is not None
+    if not is_ready:
+        response.status_code = 503
+    return {
+        "success": is_ready,
+        "message": "Ready" if is_ready else "Database unavailable",
+        "data": {
+            "db_latency_ms": latency,
+            "pools": pools,
+            "hashing": hashing_status(),
+            "rate_limits": rate_limit_status(),
+            "caches": {"jwt_claims": claims_cache.stats(), "users": user_cache.stats()},
+            "similarity": similarity_index.stats(),
+            "assignment": assignment_status(),
+            "revocations": token_revocations.status(),
+            "events": hub.status(),
+            "outbox": outbox,
+            "jobs": jobs_status(),
+        },
+    }
@@ -0,0 +1,26 @@
+import tempfile
+from typing import Literal
+from fastapi import APIRouter, Depends, Request
+from starlette.concurrency import run_in_threadpool
+
+from api.deps import admin_dep
+from services.import_service import open_text, run_import
+
+router = APIRouter(tags=["Imports"])
+
+SPOOL_MAX_MEMORY = 8 * 1024 * 1024
+
+@router.post("/tickets")
+async def import_ticket_rows(
+    request: Request,
+    format: Literal["ndjson", "csv"] = "ndjson",
+    current_user: dict = Depends(admin_dep),
+) -> dict:
+    # The body is streamed to a spooled temp file, so large imports
+    # spill to disk instead of being held in memory
+    with tempfile.SpooledTemporaryFile(max_size=SPOOL_MAX_MEMORY) as spool:
+        async for chunk in request.stream():
+            spool.write(chunk)
+        spool.seek(0)
+        report = await run_in_threadpool(run_import, open_text(spool), format)
+    return {"success": True, "message": "Tickets imported", "data": report}
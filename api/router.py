@@ -4,6 +4,10 @@ from api.auth import router as auth_router
 from api.users import router as users_router
 from api.tickets import router as tickets_router
 from api.comments import router as comments_router
+from api.exports import router as exports_router
+from api.imports import router as imports_router
+from api.events import router as events_router
+from api.health import router as health_router
 
 router = APIRouter()
 
@@ -11,4 +15,8 @@ router.include_router(auth_router,prefix="/api")
 router.include_router(users_router, prefix="/api/User")
 router.include_router(tickets_router, prefix="/api/Ticket")
 router.include_router(comments_router,prefix="/api/Comment")
+router.include_router(exports_router, prefix="/api/Export")
+router.include_router(imports_router, prefix="/api/Import")
+router.include_router(events_router, prefix="/api/Events")
+router.include_router(health_router, prefix="/health")
 
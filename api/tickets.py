@@ -1,96 +1,229 @@
-from fastapi import APIRouter, Depends
+from datetime import date
+from typing import Literal
+from fastapi import APIRouter, Depends, Query, Header, Response
 from sqlalchemy.orm import Session
 
-from db.db import get_db
+from db.db import get_db, run_db
+from core.config import settings
+from core.etag import ticket_etag, etag_matches, if_match_versions
+from core.responses import FastJSONResponse
 from api.deps import employee_dep,admin_dep,agent_dep,agent_or_admin_dep,current_user_dep
 from schemas.ticket import (
     TicketCreate,
     TicketUpdate,
     TicketAssign,
     TicketStatusUpdate,
+    TicketFilters,
+    TicketBulkAssign,
+    TicketBulkStatusUpdate,
 )
+from models.enums import TicketStatus
 from services.ticket_service import (
     create_ticket,
     get_my_tickets,
     get_all_tickets,
+    get_agent_inbox,
     get_ticket_by_id,
+    get_ticket_etag,
+    get_ticket_duplicates,
     update_ticket,
     assign_ticket,
     update_ticket_status,
     close_ticket,
+    bulk_assign_tickets,
+    bulk_update_ticket_status,
+    auto_assign_backlog,
 )
+from services.search_service import search_tickets
+from services.stats_service import get_ticket_stats
+from services.sla_service import get_sla_report
 
 router = APIRouter( tags=["Tickets"])
 
 @router.post("/")
-def create(
+async def create(
     payload: TicketCreate,
     db: Session = Depends(get_db),
     current_user: dict = Depends(employee_dep),
 ) -> dict:
-    ticket = create_ticket(db, current_user, payload)
+    ticket = await run_db(db, create_ticket, current_user, payload)
     return {"success": True, "message": "Ticket created", "data": ticket}
 
 @router.get("/me")
-def my_tickets(
+async def my_tickets(
+    filters: TicketFilters = Depends(),
+    limit: int = Query(default=settings.PAGE_SIZE_DEFAULT, ge=1, le=settings.PAGE_SIZE_MAX),
+    cursor: str | None = None,
+    sort: Literal["id", "updated_at"] = "id",
+    fields: str | None = Query(default=None, description="Comma-separated ticket fields; description is left out by default"),
     db: Session = Depends(get_db),
     current_user: dict = Depends(current_user_dep),
-) -> dict:
-    tickets = get_my_tickets(db, current_user)
-    return {"success": True, "message": "My tickets", "data": {"tickets": tickets}}
+) -> FastJSONResponse:
+    page = await run_db(db, get_my_tickets, current_user, filters, limit, cursor, sort, fields)
+    return FastJSONResponse({"success": True, "message": "My tickets", "data": page})
 
 @router.get("/")
-def all_tickets(
+async def all_tickets(
+    filters: TicketFilters = Depends(),
+    limit: int = Query(default=settings.PAGE_SIZE_DEFAULT, ge=1, le=settings.PAGE_SIZE_MAX),
+    cursor: str | None = None,
+    sort: Literal["id", "updated_at"] = "id",
+    fields: str | None = Query(default=None, description="Comma-separated ticket fields; description is left out by default"),
+    db: Session = Depends(get_db),
+    current_user: dict = Depends(admin_dep),
+) -> FastJSONResponse:
+    page = await run_db(db, get_all_tickets, filters, limit, cursor, sort, fields)
+    return FastJSONResponse({"success": True, "message": "All tickets", "data": page})
+
+@router.get("/inbox")
+async def agent_inbox(
+    status: TicketStatus | None = None,
+    limit: int = Query(default=settings.PAGE_SIZE_DEFAULT, ge=1, le=settings.PAGE_SIZE_MAX),
+    cursor: str | None = None,
+    fields: str | None = Query(default=None, description="Comma-separated ticket fields; description is left out by default"),
+    db: Session = Depends(get_db),
+    current_user: dict = Depends(agent_dep),
+) -> FastJSONResponse:
+    page = await run_db(db, get_agent_inbox, current_user, status, limit, cursor, fields)
+    return FastJSONResponse({"success": True, "message": "Agent inbox", "data": page})
+
+@router.get("/stats")
+async def stats(
     db: Session = Depends(get_db),
     current_user: dict = Depends(admin_dep),
 ) -> dict:
-    tickets = get_all_tickets(db)
-    return {"success": True, "message": "All tickets", "data": {"tickets": tickets}}
+    data = await run_db(db, get_ticket_stats)
+    return {"success": True, "message": "Ticket stats fetched", "data": data}
+
+@router.get("/sla")
+async def sla(
+    metric: Literal["time_in_status", "time_to_reach"] = "time_in_status",
+    group_by: Literal["none", "priority", "agent"] = "none",
+    date_from: date | None = None,
+    date_to: date | None = None,
+    db: Session = Depends(get_db),
+    current_user: dict = Depends(admin_dep),
+) -> dict:
+    data = await run_db(db, get_sla_report, metric, group_by, date_from, date_to)
+    return {"success": True, "message": "SLA report fetched", "data": data}
+
+@router.get("/search")
+async def search(
+    q: str = Query(min_length=1, max_length=200),
+    limit: int = Query(default=settings.PAGE_SIZE_DEFAULT, ge=1, le=settings.PAGE_SIZE_MAX),
+    cursor: str | None = None,
+    db: Session = Depends(get_db),
+    current_user: dict = Depends(current_user_dep),
+) -> dict:
+    page = await run_db(db, search_tickets, current_user, q, limit, cursor)
+    return {"success": True, "message": "Search results fetched", "data": page}
+
+def _set_etag(response: Response, ticket: dict) -> None:
+    response.headers["ETag"] = ticket_etag(ticket["id"], ticket["updated_at"])
 
 @router.get("/{ticket_id}")
-def get_by_id(
+async def get_by_id(
     ticket_id: int,
+    response: Response,
+    if_none_match: str | None = Header(default=None),
     db: Session = Depends(get_db),
     current_user: dict = Depends(current_user_dep),
-) -> dict:
-    ticket = get_ticket_by_id(db, current_user, ticket_id)
+):
+    if if_none_match:
+        etag = await run_db(db, get_ticket_etag, current_user, ticket_id)
+        if etag_matches(if_none_match, etag):
+            return Response(status_code=304, headers={"ETag": etag})
+    ticket = await run_db(db, get_ticket_by_id, current_user, ticket_id)
+    _set_etag(response, ticket)
     return {"success": True, "message": "Ticket fetched", "data": ticket}
 
+@router.get("/{ticket_id}/duplicates")
+async def duplicates(
+    ticket_id: int,
+    db: Session = Depends(get_db),
+    current_user: dict = Depends(current_user_dep),
+) -> dict:
+    result = await run_db(db, get_ticket_duplicates, current_user, ticket_id)
+    return {"success": True, "message": "Likely duplicates fetched", "data": result}
+
+@router.patch("/bulk/assign")
+async def bulk_assign(
+    payload: TicketBulkAssign,
+    db: Session = Depends(get_db),
+    current_user: dict = Depends(admin_dep),
+) -> dict:
+    result = await run_db(db, bulk_assign_tickets, current_user, payload.ticket_ids, payload.agent_id)
+    return {"success": True, "message": "Bulk assignment processed", "data": result}
+
+@router.patch("/bulk/status")
+async def bulk_change_status(
+    payload: TicketBulkStatusUpdate,
+    db: Session = Depends(get_db),
+    current_user: dict = Depends(agent_or_admin_dep),
+) -> dict:
+    result = await run_db(db, bulk_update_ticket_status, current_user, payload.ticket_ids, payload.status)
+    return {"success": True, "message": "Bulk status update processed", "data": result}
+
+@router.patch("/bulk/auto-assign")
+async def bulk_auto_assign(
+    limit: int = Query(default=100, ge=1, le=1000),
+    db: Session = Depends(get_db),
+    current_user: dict = Depends(admin_dep),
+) -> dict:
+    result = await run_db(db, auto_assign_backlog, current_user, limit)
+    return {"success": True, "message": "Backlog auto-assigned", "data": result}
+
 @router.patch("/{ticket_id}")
-def edit_ticket(
+async def edit_ticket(
     ticket_id: int,
     payload: TicketUpdate,
+    response: Response,
+    if_match: str | None = Header(default=None),
     db: Session = Depends(get_db),
     current_user: dict = Depends(current_user_dep),
 ) -> dict:
-    ticket = update_ticket(db, current_user, ticket_id, payload)
+    versions = if_match_versions(if_match, ticket_id)
+    ticket = await run_db(db, update_ticket, current_user, ticket_id, payload, versions)
+    _set_etag(response, ticket)
     return {"success": True, "message": "Ticket updated", "data": ticket}
 
 @router.patch("/{ticket_id}/assign")
-def assign(
+async def assign(
     ticket_id: int,
     payload: TicketAssign,
+    response: Response,
+    if_match: str | None = Header(default=None),
     db: Session = Depends(get_db),
     current_user: dict = Depends(admin_dep),
 ) -> dict:
-    ticket = assign_ticket(db, current_user, ticket_id, payload.agent_id)
+    versions = if_match_versions(if_match, ticket_id)
+    ticket = await run_db(db, assign_ticket, current_user, ticket_id, payload.agent_id, versions)
+    _set_etag(response, ticket)
     return {"success": True, "message": "Ticket assigned", "data": ticket}
 
 @router.patch("/{ticket_id}/status")
-def change_status(
+async def change_status(
     ticket_id: int,
     payload: TicketStatusUpdate,
+    response: Response,
+    if_match: str | None = Header(default=None),
     db: Session = Depends(get_db),
     current_user: dict = Depends(agent_dep),
 ) -> dict:
-    ticket = update_ticket_status(db, current_user, ticket_id, payload.status)
+    versions = if_match_versions(if_match, ticket_id)
+    ticket = await run_db(db, update_ticket_status, current_user, ticket_id, payload.status, versions)
+    _set_etag(response, ticket)
     return {"success": True, "message": "Status updated", "data": ticket}
 
 @router.patch("/{ticket_id}/close")
-def close(
+async def close(
     ticket_id: int,
+    response: Response,
+    if_match: str | None = Header(default=None),
     db: Session = Depends(get_db),
     current_user: dict = Depends(agent_or_admin_dep),
 ) -> dict:
-    ticket = close_ticket(db, current_user, ticket_id)
+    versions = if_match_versions(if_match, ticket_id)
+    ticket = await run_db(db, close_ticket, current_user, ticket_id, versions)
+    _set_etag(response, ticket)
     return {"success": True, "message": "Ticket closed", "data": ticket}
@@ -1,9 +1,10 @@
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, Query
 from sqlalchemy.orm import Session
 
-from db.db import get_db
+from db.db import get_db, run_db
 from schemas.user import AdminUserCreate, UserRoleUpdate,AdminResetPasswordIn
 from api.deps import admin_dep
+from core.responses import FastJSONResponse
 from services.user_service import (
     list_users,
     get_user_by_id,
@@ -15,30 +16,32 @@ from services.user_service import (
 router = APIRouter(tags=["Users"])
 
 @router.get("/")
-def admin_list_users(
+async def admin_list_users(
+    fields: str | None = Query(default=None, description="Comma-separated user fields to return"),
     db: Session = Depends(get_db),
     current_user: dict = Depends(admin_dep),
-) -> dict:
-    users = list_users(db)
-    return {"success": True, "message": "Users fetched", "data": {"users": users}}
+) -> FastJSONResponse:
+    users = await run_db(db, list_users, fields)
+    return FastJSONResponse({"success": True, "message": "Users fetched", "data": {"users": users}})
 
 @router.get("/{user_id}")
-def admin_get_user(
+async def admin_get_user(
     user_id: int,
     db: Session = Depends(get_db),
     current_user: dict = Depends(admin_dep),
 ) -> dict:
-    user = get_user_by_id(db, user_id)
+    user = await run_db(db, get_user_by_id, user_id)
     return {"success": True, "message": "User fetched", "data": user}
 
 @router.post("/create-user")
-def admin_create_user(
+async def admin_create_user(
     payload: AdminUserCreate,
     db: Session = Depends(get_db),
     current_user: dict = Depends(admin_dep),
 ) -> dict:
-    user = create_user_by_admin(
+    user = await run_db(
         db,
+        create_user_by_admin,
         name=payload.name,
         email=payload.email,
         password=payload.password,
@@ -47,21 +50,21 @@ def admin_create_user(
     return {"success": True, "message": "User created", "data": user}
 
 @router.patch("/{user_id}/role")
-def admin_update_user_role(
+async def admin_update_user_role(
     user_id: int,
     payload: UserRoleUpdate,
     db: Session = Depends(get_db),
     current_user: dict = Depends(admin_dep),
 ) -> dict:
-    user = update_user_role(db, user_id, payload.role)
+    user = await run_db(db, update_user_role, user_id, payload.role)
     return {"success": True, "message": "User role updated", "data": user}
 
 @router.patch("/users/{user_id}/reset-password")
-def admin_reset_password(
+async def admin_reset_password(
     user_id: int,
     data: AdminResetPasswordIn,
     db: Session = Depends(get_db),
     current_user: dict = Depends(admin_dep),
 ) -> dict:
-    result=  admin_pwd_update(db,user_id,data.new_password)
+    result = await run_db(db, admin_pwd_update, user_id, data.new_password)
     return {"message": "Password reset successful", "data":result}
@@ -0,0 +1,133 @@
+import argparse
+import os
+import time
+
+from fastapi.encoders import jsonable_encoder
+from starlette.responses import JSONResponse
+from sqlalchemy import create_engine, insert
+from sqlalchemy.orm import Session
+
+from core.responses import FastJSONResponse
+from core.security import hash_password
+from models.ticket import Ticket
+from models.user import User
+from models.enums import Role, TicketPriority, TicketStatus
+from schemas.ticket import TicketFilters
+from services.ticket_service import _ticket_dict, get_all_tickets
+
+# Compares the ticket list pipeline before and after column projection:
+#   orm:  full Ticket objects -> _ticket_dict -> jsonable_encoder -> json
+#   fast: column tuples -> dicts -> orjson
+#   list: as fast, with the default list fields (no description)
+# Each pipeline walks many consecutive pages of a realistic size, following
+# the cursor as a client would, and reports the mean cost per page. Rows are
+# inserted inside a transaction that is rolled back at the end, so nothing is
+# left behind, but for the whole run that transaction holds the ticket_stats
+# rows the statement triggers update. It therefore never falls back to the
+# app's DATABASE_URL: the target comes from --database-url or
+# BENCH_DATABASE_URL and should be a scratch database.
+
+_ALL_FIELDS = "id,title,description,priority,status,created_by,assigned_to,created_at,updated_at"
+
+def _seed(db, rows: int) -> None:
+    user = User(name="bench", email="bench@example.invalid", password_hash=hash_password("bench"), role=Role.EMPLOYEE)
+    db.add(user)
+    db.flush()
+    priorities = list(TicketPriority)
+    batch = []
+    for i in range(rows):
+        batch.append({
+            "title": f"Benchmark ticket {i}",
+            "description": "Printer on floor 3 shows a paper jam after every second page. " * 4,
+            "priority": priorities[i % len(priorities)],
+            "status": TicketStatus.OPEN,
+            "created_by": user.id,
+        })
+        if len(batch) == 5000:
+            db.execute(insert(Ticket), batch)
+            batch = []
+    if batch:
+        db.execute(insert(Ticket), batch)
+
+def _orm(db, page_size: int, after):
+    # The pre-projection handler: keyset on id, whole entities per row
+    query = db.query(Ticket).order_by(Ticket.id.asc())
+    if after is not None:
+        query = query.filter(Ticket.id > after)
+    tickets = query.limit(page_size + 1).all()
+    more = len(tickets) > page_size
+    tickets = tickets[:page_size]
+    data = [_ticket_dict(t) for t in tickets]
+    after = tickets[-1].id if more else None
+    body = {"success": True, "message": "All tickets", "data": {"tickets": data, "next_cursor": after}}
+    return JSONResponse(jsonable_encoder(body)).body, after
+
+def _fast(db, page_size: int, cursor):
+    # Same columns as the ORM path, description included
+    page = get_all_tickets(db, TicketFilters(), page_size, cursor, fields=_ALL_FIELDS)
+    return FastJSONResponse({"success": True, "message": "All tickets", "data": page}).body, page["next_cursor"]
+
+def _list(db, page_size: int, cursor):
+    page = get_all_tickets(db, TicketFilters(), page_size, cursor)
+    return FastJSONResponse({"success": True, "message": "All tickets", "data": page}).body, page["next_cursor"]
+
+def _walk(fn, db, page_size: int, pages: int) -> tuple[float, int]:
+    elapsed = 0.0
+    size = 0
+    walked = 0
+    position = None
+    while walked < pages:
+        # A fresh identity map per page, as a new request would have
+        db.expunge_all()
+        start = time.perf_counter()
+        body, position = fn(db, page_size, position)
+        elapsed += time.perf_counter() - start
+        size += len(body)
+        walked += 1
+        if position is None:
+            break
+    return elapsed / walked, size // walked
+
+def _best(fn, db, page_size: int, pages: int, repeat: int) -> tuple[float, int]:
+    best = float("inf")
+    size = 0
+    for _ in range(repeat):
+        per_page, size = _walk(fn, db, page_size, pages)
+        best = min(best, per_page)
+    return best, size
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Benchmark ticket list serialization")
+    parser.add_argument("--page-size", type=int, nargs="+", default=[50, 200])
+    parser.add_argument("--pages", type=int, default=200, help="consecutive pages walked per run")
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument(
+        "--database-url",
+        default=os.environ.get("BENCH_DATABASE_URL"),
+        help="scratch database to seed and read (default: $BENCH_DATABASE_URL)",
+    )
+    args = parser.parse_args(argv)
+    if not args.database_url:
+        parser.error("refusing to run without --database-url or BENCH_DATABASE_URL")
+
+    engine = create_engine(args.database_url)
+    db = Session(engine, autoflush=False)
+    try:
+        _seed(db, max(args.page_size) * args.pages)
+        print(f"{'page':>6} {'orm ms':>10} {'fast ms':>10} {'speedup':>8} {'list ms':>10} {'bytes':>10} {'list bytes':>11}")
+        for page_size in args.page_size:
+            orm, _ = _best(_orm, db, page_size, args.pages, args.repeat)
+            fast, fast_size = _best(_fast, db, page_size, args.pages, args.repeat)
+            listed, list_size = _best(_list, db, page_size, args.pages, args.repeat)
+            print(
+                f"{page_size:>6} {orm * 1000:>10.2f} {fast * 1000:>10.2f} {orm / fast:>7.1f}x"
+                f" {listed * 1000:>10.2f} {fast_size:>10} {list_size:>11}"
+            )
+    finally:
+        db.rollback()
+        db.close()
+        engine.dispose()
+    return 0
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,33 @@
+import argparse
+import json
+import sys
+
+from db.db import SessionLocal
+from services.import_service import import_tickets, open_text
+
+def _print_progress(report: dict) -> None:
+    print(
+        f"rows={report['rows']} inserted={report['inserted']} rows/s={report['rows_per_second']}",
+        file=sys.stderr,
+    )
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Bulk import tickets from NDJSON or CSV")
+    parser.add_argument("path", help="file to import, or - for stdin")
+    parser.add_argument("--format", choices=["ndjson", "csv"], help="defaults to the file extension")
+    args = parser.parse_args(argv)
+
+    fmt = args.format or ("csv" if args.path.endswith(".csv") else "ndjson")
+    source = open_text(sys.stdin.buffer if args.path == "-" else open(args.path, "rb"))
+    db = SessionLocal()
+    try:
+        report = import_tickets(db, source, fmt, progress=_print_progress)
+    finally:
+        db.close()
+        if args.path != "-":
+            source.close()
+    print(json.dumps(report, indent=2))
+    return 0 if report["failed"] == 0 else 1
+
+if __name__ == "__main__":
+    sys.exit(main())
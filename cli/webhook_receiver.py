@@ -0,0 +1,46 @@
+import argparse
+import json
+import sys
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+class _Handler(BaseHTTPRequestHandler):
+    # Stand-in for a downstream webhook consumer: prints each delivery and
+    # can be told to fail, to exercise the dispatcher's retries.
+    fail_every = 0
+    received = 0
+
+    def do_POST(self) -> None:
+        body = self.rfile.read(int(self.headers.get("Content-Length", 0)))
+        type(self).received += 1
+        if self.fail_every and self.received % self.fail_every == 0:
+            self.send_response(503)
+            self.end_headers()
+            return
+        event = json.loads(body)
+        print(json.dumps({"idempotency_key": self.headers.get("Idempotency-Key"), **event}), flush=True)
+        self.send_response(204)
+        self.end_headers()
+
+    def log_message(self, format: str, *args) -> None:
+        print(format % args, file=sys.stderr)
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Print outbox webhook deliveries")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=9000)
+    parser.add_argument("--fail-every", type=int, default=0, help="answer every Nth delivery with 503")
+    args = parser.parse_args(argv)
+
+    _Handler.fail_every = args.fail_every
+    server = ThreadingHTTPServer((args.host, args.port), _Handler)
+    print(f"listening on http://{args.host}:{args.port}/", file=sys.stderr)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -3,10 +3,73 @@ from pydantic_settings import BaseSettings, SettingsConfigDict
 class Settings(BaseSettings):
     APP_NAME: str = "Smart-Helpdesk-Ticket-System"
     DATABASE_URL: str
+    ASYNC_DB: bool = False
+    ASYNC_DATABASE_URL: str | None = None
+
+    DB_POOL_SIZE: int = 5
+    DB_MAX_OVERFLOW: int = 10
+    DB_POOL_TIMEOUT: float = 30
+    DB_POOL_RECYCLE: int = -1
+    DB_POOL_PRE_PING: bool = False
+    DB_NULL_POOL: bool = False
 
     SECRET_KEY: str
     ALGORITHM: str = "HS256"
     ACCESS_TOKEN_EXPIRE_MINUTES: int = 120
+    JWT_CACHE_SIZE: int = 10000
+    USER_CACHE_SIZE: int = 10000
+    USER_CACHE_TTL_SECONDS: float = 60
+    REVOCATION_REFRESH_SECONDS: float = 2
+    REVOCATION_GRACE_SECONDS: float = 60
+
+    HASH_WORKERS: int = 2
+    HASH_QUEUE_SIZE: int = 32
+
+    # Token buckets in front of bcrypt: per-minute refill rate and burst size
+    RATE_LIMIT_ENABLED: bool = True
+    RATE_LIMIT_MAX_KEYS: int = 100000
+    LOGIN_RATE_PER_MINUTE_IP: float = 30
+    LOGIN_BURST_IP: float = 20
+    LOGIN_RATE_PER_MINUTE_EMAIL: float = 5
+    LOGIN_BURST_EMAIL: float = 10
+    REGISTER_RATE_PER_MINUTE_IP: float = 5
+    REGISTER_BURST_IP: float = 10
+    REGISTER_RATE_PER_MINUTE_EMAIL: float = 2
+    REGISTER_BURST_EMAIL: float = 3
+
+    PAGE_SIZE_DEFAULT: int = 50
+    PAGE_SIZE_MAX: int = 200
+
+    EVENTS_HISTORY: int = 1000
+    EVENTS_QUEUE_SIZE: int = 100
+    EVENTS_KEEPALIVE_SECONDS: float = 15
+
+    OUTBOX_WEBHOOK_URL: str | None = None
+    OUTBOX_BATCH_SIZE: int = 100
+    OUTBOX_POLL_SECONDS: float = 1
+    OUTBOX_LEASE_MARGIN_SECONDS: float = 30
+    OUTBOX_TIMEOUT_SECONDS: float = 5
+    OUTBOX_MAX_ATTEMPTS: int = 10
+    OUTBOX_BACKOFF_MAX_SECONDS: float = 300
+    OUTBOX_RETENTION_HOURS: int = 24
+
+    SIMILARITY_ENABLED: bool = True
+    SIMILARITY_THRESHOLD: float = 0.5
+    SIMILARITY_MAX_RESULTS: int = 5
+    SIMILARITY_WINDOW_DAYS: int = 14
+    SIMILARITY_MAX_TICKETS: int = 50000
+
+    STATS_RECONCILE_SECONDS: float = 3600
+
+    SLA_ROLLUP_SECONDS: float = 60
+    SLA_ROLLUP_BATCH: int = 10000
+    SLA_ROLLUP_GRACE_SECONDS: float = 300
+    SLA_DIGEST_COMPRESSION: int = 200
+
+    AUTO_ASSIGN_ON_CREATE: bool = False
+    # Load an open ticket adds to its agent, by priority
+    AUTO_ASSIGN_WEIGHTS: dict[str, float] = {"low": 1, "medium": 2, "high": 4, "critical": 8}
+    AUTO_ASSIGN_RESYNC_SECONDS: float = 300
 
     model_config = SettingsConfigDict(
         env_file=".env",
@@ -0,0 +1,51 @@
+from datetime import datetime
+
+from fastapi import HTTPException
+
+_VERSION_FORMAT = "%Y%m%dT%H%M%S%f"
+# updated_at is nullable (rows written before it had a server default, or by
+# hand); such a ticket still gets a stable tag until its next write stamps it
+_UNSTAMPED = "0"
+
+def ticket_etag(ticket_id: int, updated_at: datetime | None) -> str:
+    version = _UNSTAMPED if updated_at is None else updated_at.strftime(_VERSION_FORMAT)
+    return f'"t{ticket_id}-{version}"'
+
+def comments_etag(ticket_id: int, last_comment_id: int | None) -> str:
+    return f'"c{ticket_id}-{last_comment_id or 0}"'
+
+def _split(header: str) -> list[str]:
+    return [tag.strip() for tag in header.split(",") if tag.strip()]
+
+def etag_matches(if_none_match: str | None, etag: str) -> bool:
+    # If-None-Match uses weak comparison, so a W/ prefix is ignored
+    if not if_none_match:
+        return False
+    for tag in _split(if_none_match):
+        if tag == "*" or tag.removeprefix("W/") == etag:
+            return True
+    return False
+
+def if_match_versions(if_match: str | None, ticket_id: int) -> list[datetime | None] | None:
+    # Turns an If-Match header into the updated_at values the ticket may still
+    # have, so the precondition can ride along in the conditional UPDATE.
+    if not if_match:
+        return None
+    tags = _split(if_match)
+    if "*" in tags:
+        return None
+    prefix = f'"t{ticket_id}-'
+    versions = []
+    for tag in tags:
+        if tag.startswith(prefix) and tag.endswith('"'):
+            version = tag[len(prefix):-1]
+            if version == _UNSTAMPED:
+                versions.append(None)
+                continue
+            try:
+                versions.append(datetime.strptime(version, _VERSION_FORMAT))
+            except ValueError:
+                continue
+    if not versions:
+        raise HTTPException(status_code=412, detail="Precondition failed: ticket has changed")
+    return versions
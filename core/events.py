@@ -0,0 +1,121 @@
+import asyncio
+import json
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Callable
+
+from core.config import settings
+
+@dataclass(frozen=True)
+class Event:
+    id: int
+    type: str
+    ticket_id: int
+    created_by: int
+    assigned_to: int | None
+    data: dict
+
+def _json_default(value):
+    if isinstance(value, datetime):
+        return value.isoformat()
+    raise TypeError(f"Cannot serialize {type(value).__name__}")
+
+def format_sse(event_id: str, type: str, data: dict) -> str:
+    payload = json.dumps(data, default=_json_default)
+    return f"id: {event_id}\nevent: {type}\ndata: {payload}\n\n"
+
+class Subscription:
+    def __init__(self, loop: asyncio.AbstractEventLoop, can_see: Callable[[Event], bool], maxsize: int):
+        self.loop = loop
+        self.can_see = can_see
+        self.queue: asyncio.Queue = asyncio.Queue(maxsize=maxsize)
+        # Set when the subscriber fell a full buffer behind; the stream then
+        # ends so the client reconnects and resumes from the history buffer.
+        self.overflowed = False
+
+    def _deliver(self, event: Event) -> None:
+        if self.overflowed:
+            return
+        try:
+            self.queue.put_nowait(event)
+        except asyncio.QueueFull:
+            self.overflowed = True
+
+class EventHub:
+    # In-process fan-out. Publishers may be threadpool workers or the event
+    # loop itself, so delivery always hops onto the subscriber's loop.
+    def __init__(self, history: int, queue_size: int):
+        self._lock = threading.Lock()
+        self._history: deque[Event] = deque(maxlen=history)
+        self._subscribers: set[Subscription] = set()
+        self._queue_size = queue_size
+        self._next_id = 1
+        # Ids restart with the process; the epoch lets a resuming client's
+        # Last-Event-ID from an earlier process be recognised as a gap.
+        self.epoch = str(int(time.time() * 1000))
+        self.published = 0
+        self.dropped = 0
+
+    def publish(self, type: str, ticket_id: int, created_by: int, assigned_to: int | None, data: dict) -> None:
+        with self._lock:
+            event = Event(self._next_id, type, ticket_id, created_by, assigned_to, data)
+            self._next_id += 1
+            self._history.append(event)
+            self.published += 1
+            targets = [sub for sub in self._subscribers if sub.can_see(event)]
+        for sub in targets:
+            try:
+                sub.loop.call_soon_threadsafe(sub._deliver, event)
+            except RuntimeError:
+                # Loop already closed, the subscriber is going away
+                pass
+
+    def event_id(self, event: Event) -> str:
+        return f"{self.epoch}-{event.id}"
+
+    def _parse_event_id(self, last_event_id: str) -> int | None:
+        epoch, _, seq = last_event_id.strip().rpartition("-")
+        if epoch != self.epoch or not seq.isdigit():
+            return None
+        return int(seq)
+
+    def subscribe(self, can_see: Callable[[Event], bool], last_event_id: str | None = None) -> tuple[Subscription, list[Event], str | None]:
+        # Registering and reading the replay happen under one lock, so an event
+        # is either replayed or delivered live, never both and never neither.
+        # When the client missed events that can no longer be replayed, the
+        # third value is the id to resume from once it has refetched its state.
+        sub = Subscription(asyncio.get_running_loop(), can_see, self._queue_size)
+        with self._lock:
+            self._subscribers.add(sub)
+            if not last_event_id:
+                return sub, [], None
+            seq = self._parse_event_id(last_event_id)
+            oldest = self._history[0].id if self._history else self._next_id
+            if seq is None or seq < oldest - 1:
+                return sub, [], f"{self.epoch}-{self._next_id - 1}"
+            replay = [e for e in self._history if e.id > seq and can_see(e)]
+        return sub, replay, None
+
+    def unsubscribe(self, sub: Subscription) -> None:
+        with self._lock:
+            self._subscribers.discard(sub)
+            if sub.overflowed:
+                self.dropped += 1
+
+    def status(self) -> dict:
+        with self._lock:
+            return {
+                "subscribers": len(self._subscribers),
+                "published": self.published,
+                "dropped_subscribers": self.dropped,
+                "last_event_id": self._next_id - 1,
+                "history": len(self._history),
+            }
+
+hub = EventHub(history=settings.EVENTS_HISTORY, queue_size=settings.EVENTS_QUEUE_SIZE)
+
+def publish_ticket_event(type: str, ticket: dict) -> None:
+    hub.publish(type, ticket["id"], ticket["created_by"], ticket["assigned_to"], ticket)
@@ -0,0 +1,14 @@
+from fastapi import HTTPException
+
+def parse_fields(raw: str | None, allowed, default: tuple[str, ...]) -> tuple[str, ...]:
+    # ?fields=id,title,status -> ("id", "title", "status"), in request order
+    if raw is None:
+        return default
+    fields = tuple(dict.fromkeys(f.strip() for f in raw.split(",") if f.strip()))
+    unknown = [f for f in fields if f not in allowed]
+    if not fields or unknown:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Unknown fields: {', '.join(unknown)}" if unknown else "fields must not be empty",
+        )
+    return fields
@@ -0,0 +1,132 @@
+import asyncio
+import multiprocessing
+import threading
+import time
+from concurrent.futures import Future, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+
+from fastapi import HTTPException
+from passlib.context import CryptContext
+from sqlalchemy.util import await_only
+
+from core.config import settings
+
+pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+
+_pool: ProcessPoolExecutor | None = None
+_pool_lock = threading.Lock()
+# Bounds work running in the pool plus work queued for it
+_slots = threading.BoundedSemaphore(settings.HASH_WORKERS + settings.HASH_QUEUE_SIZE)
+_in_flight = 0
+_rejected = 0
+_restarts = 0
+_last_broken_at: float | None = None
+
+def _bcrypt_hash(password: str) -> str:
+    return pwd_context.hash(password)
+
+def _bcrypt_verify(password: str, password_hash: str) -> bool:
+    return pwd_context.verify(password, password_hash)
+
+def _get_pool() -> ProcessPoolExecutor:
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            # spawn, not fork: the API process is multi-threaded by the time the first login arrives
+            _pool = ProcessPoolExecutor(
+                max_workers=settings.HASH_WORKERS,
+                mp_context=multiprocessing.get_context("spawn"),
+            )
+        return _pool
+
+def _release(_future: Future) -> None:
+    global _in_flight
+    with _pool_lock:
+        _in_flight -= 1
+    _slots.release()
+
+def _busy() -> HTTPException:
+    return HTTPException(
+        status_code=503,
+        detail="Authentication service busy, retry shortly",
+        headers={"Retry-After": "1"},
+    )
+
+def _discard_pool(pool: ProcessPoolExecutor) -> None:
+    # A worker died (OOM kill, segfault) and the executor refuses all further
+    # work; drop it so the next call builds a fresh one
+    global _pool, _restarts, _last_broken_at
+    with _pool_lock:
+        if _pool is not pool:
+            return
+        _pool = None
+        _restarts += 1
+        _last_broken_at = time.time()
+    pool.shutdown(wait=False, cancel_futures=True)
+
+def _submit(fn, *args) -> tuple[Future, ProcessPoolExecutor]:
+    global _in_flight, _rejected
+    if not _slots.acquire(blocking=False):
+        with _pool_lock:
+            _rejected += 1
+        raise _busy()
+    pool = _get_pool()
+    try:
+        future = pool.submit(fn, *args)
+    except BrokenProcessPool:
+        _slots.release()
+        _discard_pool(pool)
+        raise _busy()
+    except Exception:
+        _slots.release()
+        raise
+    with _pool_lock:
+        _in_flight += 1
+    future.add_done_callback(_release)
+    return future, pool
+
+def _wait(future: Future):
+    # Called from the threadpool on the sync path, and from inside an
+    # AsyncSession.run_sync greenlet on the async path, where the event loop
+    # must keep serving other requests while bcrypt runs.
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return future.result()
+    return await_only(asyncio.wrap_future(future))
+
+def _run(fn, *args):
+    future, pool = _submit(fn, *args)
+    try:
+        return _wait(future)
+    except BrokenProcessPool:
+        # The slot was already released by the done callback
+        _discard_pool(pool)
+        raise _busy()
+
+def hash_password(password: str) -> str:
+    return _run(_bcrypt_hash, password)
+
+def verify_password(password: str, password_hash: str) -> bool:
+    return _run(_bcrypt_verify, password, password_hash)
+
+def hashing_status() -> dict:
+    with _pool_lock:
+        return {
+            "workers": settings.HASH_WORKERS,
+            "capacity": settings.HASH_WORKERS + settings.HASH_QUEUE_SIZE,
+            "in_flight": _in_flight,
+            "rejected": _rejected,
+            # CPython sets _broken once a worker has died; the pool is only
+            # replaced on the next hash call, so report it in the meantime
+            "broken": bool(_pool is not None and getattr(_pool, "_broken", False)),
+            "restarts": _restarts,
+            "last_broken_at": _last_broken_at,
+        }
+
+def shutdown_hash_pool() -> None:
+    global _pool
+    with _pool_lock:
+        pool, _pool = _pool, None
+    if pool is not None:
+        pool.shutdown(wait=True, cancel_futures=True)
@@ -0,0 +1,74 @@
+import asyncio
+import time
+from typing import Callable
+
+from starlette.concurrency import run_in_threadpool
+
+class PeriodicJob:
+    # Runs a sync function on the threadpool every `interval` seconds for the
+    # lifetime of the app. A run that returns True has more work queued and
+    # is repeated straight away instead of waiting for the next tick.
+    def __init__(self, name: str, interval: float, fn: Callable[[], bool | None], initial_delay: float = 0):
+        self.name = name
+        self.interval = interval
+        self.fn = fn
+        self.initial_delay = initial_delay
+        self._task: asyncio.Task | None = None
+        self.runs = 0
+        self.errors = 0
+        self.last_run_at: float | None = None
+        self.last_error: str | None = None
+
+    async def _loop(self) -> None:
+        await asyncio.sleep(self.initial_delay)
+        while True:
+            more = False
+            try:
+                more = await run_in_threadpool(self.fn)
+            except Exception as e:
+                self.errors += 1
+                self.last_error = f"{type(e).__name__}: {e}"
+            self.runs += 1
+            self.last_run_at = time.time()
+            if not more:
+                await asyncio.sleep(self.interval)
+
+    def start(self) -> None:
+        if self._task is None:
+            self._task = asyncio.create_task(self._loop(), name=self.name)
+
+    async def stop(self) -> None:
+        task, self._task = self._task, None
+        if task is not None:
+            task.cancel()
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
+
+    def status(self) -> dict:
+        return {
+            "running": self._task is not None and not self._task.done(),
+            "interval_seconds": self.interval,
+            "runs": self.runs,
+            "errors": self.errors,
+            "last_run_at": self.last_run_at,
+            "last_error": self.last_error,
+        }
+
+jobs: list[PeriodicJob] = []
+
+def register_job(job: PeriodicJob) -> PeriodicJob:
+    jobs.append(job)
+    return job
+
+def start_jobs() -> None:
+    for job in jobs:
+        job.start()
+
+async def stop_jobs() -> None:
+    for job in jobs:
+        await job.stop()
+
+def jobs_status() -> dict:
+    return {job.name: job.status() for job in jobs}
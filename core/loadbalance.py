@@ -0,0 +1,95 @@
+import heapq
+import threading
+
+class AgentLoadHeap:
+    # Min-heap of agents by weighted open load. Load changes push a fresh
+    # entry instead of re-sifting the old one; stale entries are skipped when
+    # they reach the top (lazy deletion), so every update and pick is O(log n).
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._loads: dict[int, float] = {}
+        self._heap: list[tuple[float, int]] = []
+        # ticket id -> (agent id, weight) for the open work each agent holds,
+        # so repeated or out-of-order updates for a ticket never double count
+        self._tickets: dict[int, tuple[int, float]] = {}
+        self.picks = 0
+
+    def rebuild(self, agent_ids: list[int], tickets: dict[int, tuple[int, float]]) -> None:
+        loads = {agent_id: 0.0 for agent_id in agent_ids}
+        for agent_id, weight in tickets.values():
+            if agent_id in loads:
+                loads[agent_id] += weight
+        with self._lock:
+            self._loads = loads
+            self._tickets = dict(tickets)
+            self._heap = [(load, agent_id) for agent_id, load in loads.items()]
+            heapq.heapify(self._heap)
+
+    def _adjust_locked(self, agent_id: int, delta: float) -> None:
+        load = self._loads.get(agent_id)
+        if load is None:
+            return
+        load = max(load + delta, 0.0)
+        self._loads[agent_id] = load
+        heapq.heappush(self._heap, (load, agent_id))
+        # Bound the garbage left behind by superseded entries
+        if len(self._heap) > 4 * len(self._loads) + 64:
+            self._heap = [(l, a) for a, l in self._loads.items()]
+            heapq.heapify(self._heap)
+
+    def _untrack_locked(self, ticket_id: int) -> None:
+        held = self._tickets.pop(ticket_id, None)
+        if held is not None:
+            self._adjust_locked(held[0], -held[1])
+
+    def track(self, ticket_id: int, agent_id: int | None, weight: float = 0.0) -> None:
+        with self._lock:
+            if self._tickets.get(ticket_id) == (agent_id, weight):
+                return
+            self._untrack_locked(ticket_id)
+            if agent_id is not None:
+                self._tickets[ticket_id] = (agent_id, weight)
+                self._adjust_locked(agent_id, weight)
+
+    def claim(self, ticket_id: int, weight: float) -> int | None:
+        # Picks the least loaded agent and charges the ticket to it in one step,
+        # so concurrent claims spread out instead of landing on the same agent
+        with self._lock:
+            self._untrack_locked(ticket_id)
+            while self._heap:
+                load, agent_id = self._heap[0]
+                if self._loads.get(agent_id) == load:
+                    break
+                heapq.heappop(self._heap)
+            else:
+                return None
+            self._tickets[ticket_id] = (agent_id, weight)
+            self._adjust_locked(agent_id, weight)
+            self.picks += 1
+            return agent_id
+
+    def add_agent(self, agent_id: int) -> None:
+        with self._lock:
+            if agent_id in self._loads:
+                return
+            load = sum(w for a, w in self._tickets.values() if a == agent_id)
+            self._loads[agent_id] = load
+            heapq.heappush(self._heap, (load, agent_id))
+
+    def remove_agent(self, agent_id: int) -> None:
+        # Its heap entries become stale and are dropped on the next pick
+        with self._lock:
+            self._loads.pop(agent_id, None)
+
+    def load(self, agent_id: int) -> float | None:
+        with self._lock:
+            return self._loads.get(agent_id)
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "agents": len(self._loads),
+                "open_tickets": len(self._tickets),
+                "heap_entries": len(self._heap),
+                "picks": self.picks,
+            }
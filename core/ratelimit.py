@@ -0,0 +1,93 @@
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+
+from fastapi import HTTPException
+
+from core.config import settings
+
+class RateLimitBackend(ABC):
+    # Storage for token buckets. The in-memory backend limits per worker;
+    # a shared store (e.g. Redis running the same refill logic in a script)
+    # can be installed with set_rate_limit_backend for a global limit.
+
+    # Takes one token for key: returns 0 if allowed, else the seconds until
+    # a token is available
+    @abstractmethod
+    def acquire(self, key: str, rate: float, burst: float) -> float:
+        ...
+
+    def stats(self) -> dict:
+        return {}
+
+class MemoryBackend(RateLimitBackend):
+    def __init__(self, max_keys: int, clock=time.monotonic):
+        self.max_keys = max_keys
+        self.clock = clock
+        # key -> (tokens, last refill time), least recently used first
+        self._buckets: OrderedDict[str, tuple[float, float]] = OrderedDict()
+        self._lock = threading.Lock()
+        self.evictions = 0
+
+    def acquire(self, key: str, rate: float, burst: float) -> float:
+        now = self.clock()
+        with self._lock:
+            tokens, last = self._buckets.get(key, (burst, now))
+            tokens = min(burst, tokens + (now - last) * rate)
+            if tokens >= 1:
+                tokens -= 1
+                wait = 0.0
+            else:
+                wait = (1 - tokens) / rate
+            self._buckets[key] = (tokens, now)
+            self._buckets.move_to_end(key)
+            # The idlest keys go first; a bucket evicted while idle would
+            # have refilled anyway, so eviction rarely loses anything
+            while len(self._buckets) > self.max_keys:
+                self._buckets.popitem(last=False)
+                self.evictions += 1
+            return wait
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {"keys": len(self._buckets), "max_keys": self.max_keys, "evictions": self.evictions}
+
+_backend: RateLimitBackend = MemoryBackend(settings.RATE_LIMIT_MAX_KEYS)
+
+def set_rate_limit_backend(backend: RateLimitBackend) -> None:
+    global _backend
+    _backend = backend
+
+class RateLimiter:
+    def __init__(self, name: str, per_minute: float, burst: float):
+        self.name = name
+        self.rate = per_minute / 60
+        self.burst = burst
+        self.rejected = 0
+
+    def check(self, key: str) -> None:
+        if not settings.RATE_LIMIT_ENABLED:
+            return
+        wait = _backend.acquire(f"{self.name}:{key}", self.rate, self.burst)
+        if wait:
+            self.rejected += 1
+            raise HTTPException(
+                status_code=429,
+                detail="Too many attempts, retry later",
+                headers={"Retry-After": str(max(1, int(wait + 0.999)))},
+            )
+
+login_by_ip = RateLimiter("login_ip", settings.LOGIN_RATE_PER_MINUTE_IP, settings.LOGIN_BURST_IP)
+login_by_email = RateLimiter("login_email", settings.LOGIN_RATE_PER_MINUTE_EMAIL, settings.LOGIN_BURST_EMAIL)
+register_by_ip = RateLimiter("register_ip", settings.REGISTER_RATE_PER_MINUTE_IP, settings.REGISTER_BURST_IP)
+register_by_email = RateLimiter("register_email", settings.REGISTER_RATE_PER_MINUTE_EMAIL, settings.REGISTER_BURST_EMAIL)
+_limiters = (login_by_ip, login_by_email, register_by_ip, register_by_email)
+
+def rate_limit_status() -> dict:
+    return {
+        "enabled": settings.RATE_LIMIT_ENABLED,
+        "backend": type(_backend).__name__,
+        **_backend.stats(),
+        "rejected": {limiter.name: limiter.rejected for limiter in _limiters},
+    }
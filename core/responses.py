@@ -0,0 +1,8 @@
+import orjson
+from starlette.responses import JSONResponse
+
+class FastJSONResponse(JSONResponse):
+    # Returned directly from list routes so FastAPI skips jsonable_encoder;
+    # orjson handles datetimes itself, in the same ISO format
+    def render(self, content) -> bytes:
+        return orjson.dumps(content, option=orjson.OPT_NON_STR_KEYS)
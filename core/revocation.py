@@ -0,0 +1,37 @@
+import threading
+
+class TokenRevocations:
+    # user id -> lowest token version still accepted. Only users revoked
+    # within the last token lifetime are held, so this stays small and a
+    # check is one dict lookup.
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._min_version: dict[int, int] = {}
+        self.rejected = 0
+        self.refreshed_at: float | None = None
+
+    def revoke(self, user_id: int, version: int) -> None:
+        with self._lock:
+            if version > self._min_version.get(user_id, 0):
+                self._min_version[user_id] = version
+
+    def replace(self, entries: dict[int, int]) -> None:
+        with self._lock:
+            self._min_version = dict(entries)
+
+    def is_revoked(self, user_id: int | None, version: int) -> bool:
+        # No lock: this runs on every request and a dict lookup is atomic
+        if user_id is None or version >= self._min_version.get(user_id, 0):
+            return False
+        self.rejected += 1
+        return True
+
+    def status(self) -> dict:
+        with self._lock:
+            return {
+                "users": len(self._min_version),
+                "rejected": self.rejected,
+                "refreshed_at": self.refreshed_at,
+            }
+
+token_revocations = TokenRevocations()
@@ -1,20 +1,19 @@
+import hashlib
+import time
 from datetime import datetime, timedelta, timezone
 from fastapi import Depends, HTTPException
 from fastapi.security import HTTPBearer,HTTPAuthorizationCredentials
 from jose import jwt, JWTError
-from passlib.context import CryptContext
 
 from models.enums import Role
 from core.config import settings
+from core.hashing import hash_password, verify_password
+from core.cache import TTLCache
+from core.revocation import token_revocations
 
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
 bearer_scheme = HTTPBearer()
-
-def hash_password(password: str) -> str:
-    return pwd_context.hash(password)
-
-def verify_password(password: str, password_hash: str) -> bool:
-    return pwd_context.verify(password, password_hash)
+# Verified claims keyed by token digest; entries expire at the token's own exp
+claims_cache = TTLCache(maxsize=settings.JWT_CACHE_SIZE, clock=time.time)
 
 def create_access_token(data: dict) -> str:
     to_encode = data.copy()
@@ -26,17 +25,27 @@ def create_access_token(data: dict) -> str:
     return token
 
 def decode_access_token(token: str) -> dict:
+    key = hashlib.sha256(token.encode()).digest()
+    payload = claims_cache.get(key)
+    if payload is not None:
+        return dict(payload)
     try:
         payload = jwt.decode(token, settings.SECRET_KEY, algorithms=[settings.ALGORITHM])
-        return payload
     except JWTError:
         raise HTTPException(status_code=401, detail="Invalid or expired token")
+    exp = payload.get("exp")
+    if isinstance(exp, (int, float)):
+        claims_cache.set(key, dict(payload), expires_at=exp)
+    return payload
     
 def get_current_user(credentials: HTTPAuthorizationCredentials = Depends(bearer_scheme)) -> dict:
     token = credentials.credentials
     payload = decode_access_token(token)
     if payload.get("sub") is None:
         raise HTTPException(status_code=401, detail="Invalid token payload")
+    # Tokens issued before the "ver" claim existed count as version 0
+    if token_revocations.is_revoked(payload.get("user_id"), payload.get("ver", 0)):
+        raise HTTPException(status_code=401, detail="Token has been revoked")
     return payload
 
 def role_required(*allowed_roles: Role):
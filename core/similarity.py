@@ -0,0 +1,117 @@
+import hashlib
+import random
+import re
+import threading
+import time
+from array import array
+from collections import OrderedDict
+
+_WORD = re.compile(r"[a-z0-9]{2,}")
+
+def _shingles(text: str) -> set[bytes]:
+    # Words plus word pairs: pairs keep "printer jammed" apart from "jammed printer"
+    words = _WORD.findall(text.lower())
+    shingles = {w.encode() for w in words}
+    shingles.update(f"{a} {b}".encode() for a, b in zip(words, words[1:]))
+    return shingles
+
+def _hash64(shingle: bytes) -> int:
+    return int.from_bytes(hashlib.blake2b(shingle, digest_size=8).digest(), "little")
+
+class MinHashLSH:
+    # MinHash signatures banded into LSH buckets. A lookup hashes the new text
+    # once and only compares against tickets sharing at least one band, so its
+    # cost does not grow with the number of indexed tickets. With 16 bands of
+    # 4 rows, pairs above ~0.5 Jaccard similarity almost always collide.
+    def __init__(self, num_perm: int = 64, bands: int = 16, max_items: int = 50000, seed: int = 1):
+        if num_perm % bands:
+            raise ValueError("num_perm must be a multiple of bands")
+        rng = random.Random(seed)
+        # XOR with a random mask reorders uniformly hashed values, standing in
+        # for a permutation while keeping the per-shingle work in C (map/min)
+        self._masks = [rng.getrandbits(64) for _ in range(num_perm)]
+        self._bands = bands
+        self._rows = num_perm // bands
+        self._max_items = max_items
+        self._lock = threading.Lock()
+        self._signatures: OrderedDict[int, array] = OrderedDict()
+        self._buckets: dict[int, set[int]] = {}
+        self.lookups = 0
+        self.lookup_seconds = 0.0
+
+    def signature(self, text: str) -> array | None:
+        hashes = [_hash64(s) for s in _shingles(text)]
+        if not hashes:
+            return None
+        return array("Q", [min(map(mask.__xor__, hashes)) for mask in self._masks])
+
+    def _band_keys(self, sig: array) -> list[int]:
+        rows = self._rows
+        return [hash((b, tuple(sig[b * rows:(b + 1) * rows]))) for b in range(self._bands)]
+
+    def _remove_locked(self, item_id: int) -> None:
+        sig = self._signatures.pop(item_id, None)
+        if sig is None:
+            return
+        for key in self._band_keys(sig):
+            bucket = self._buckets.get(key)
+            if bucket is not None:
+                bucket.discard(item_id)
+                if not bucket:
+                    del self._buckets[key]
+
+    def add(self, item_id: int, sig: array | None) -> None:
+        with self._lock:
+            self._remove_locked(item_id)
+            if sig is None:
+                return
+            self._signatures[item_id] = sig
+            for key in self._band_keys(sig):
+                self._buckets.setdefault(key, set()).add(item_id)
+            # Oldest entries go first; outage duplicates cluster in time
+            while len(self._signatures) > self._max_items:
+                self._remove_locked(next(iter(self._signatures)))
+
+    def remove(self, item_id: int) -> None:
+        with self._lock:
+            self._remove_locked(item_id)
+
+    def get_signature(self, item_id: int) -> array | None:
+        with self._lock:
+            return self._signatures.get(item_id)
+
+    def query(self, sig: array | None, threshold: float, exclude: int | None = None) -> list[tuple[int, float]]:
+        if sig is None:
+            return []
+        start = time.perf_counter()
+        with self._lock:
+            candidates: set[int] = set()
+            for key in self._band_keys(sig):
+                candidates.update(self._buckets.get(key, ()))
+            candidates.discard(exclude)
+            signatures = [(c, self._signatures[c]) for c in candidates]
+        matches = []
+        size = len(sig)
+        for item_id, other in signatures:
+            # Share of equal MinHash slots estimates the Jaccard similarity
+            similarity = sum(map(int.__eq__, sig, other)) / size
+            if similarity >= threshold:
+                matches.append((item_id, round(similarity, 3)))
+        matches.sort(key=lambda m: (-m[1], -m[0]))
+        self.lookups += 1
+        self.lookup_seconds += time.perf_counter() - start
+        return matches
+
+    def clear(self) -> None:
+        with self._lock:
+            self._signatures.clear()
+            self._buckets.clear()
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "tickets": len(self._signatures),
+                "buckets": len(self._buckets),
+                "lookups": self.lookups,
+                "avg_lookup_us": round(self.lookup_seconds / self.lookups * 1e6, 1) if self.lookups else 0.0,
+            }
@@ -0,0 +1,103 @@
+import math
+
+class TDigest:
+    # Merging t-digest (Dunning): a handful of weighted centroids that answer
+    # quantile queries with small relative error, most accurate in the tails.
+    # Digests merge losslessly enough that per-day sketches can be combined
+    # into any longer range.
+    def __init__(self, compression: float = 200):
+        self.compression = compression
+        self._centroids: list[tuple[float, float]] = []
+        self._buffer: list[tuple[float, float]] = []
+        self.count = 0.0
+        self.min = math.inf
+        self.max = -math.inf
+
+    def add(self, value: float, weight: float = 1.0) -> None:
+        self._buffer.append((value, weight))
+        self.count += weight
+        self.min = min(self.min, value)
+        self.max = max(self.max, value)
+        if len(self._buffer) >= self.compression * 5:
+            self._compress()
+
+    def merge(self, other: "TDigest") -> None:
+        if not other.count:
+            return
+        self._buffer.extend(other._centroids)
+        self._buffer.extend(other._buffer)
+        self.count += other.count
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+        # Merging in bulk rather than pairwise keeps the error from compounding
+        if len(self._buffer) >= self.compression * 5:
+            self._compress()
+
+    def _q_limit(self, q: float) -> float:
+        # k1 scale function: centroids near q=0 and q=1 stay small
+        k = self.compression / (2 * math.pi) * math.asin(2 * q - 1) + 1
+        if k >= self.compression / 4:
+            return 1.0
+        return (math.sin(k * 2 * math.pi / self.compression) + 1) / 2
+
+    def _compress(self) -> None:
+        if not self._buffer:
+            return
+        items = sorted(self._centroids + self._buffer)
+        self._buffer = []
+        merged: list[tuple[float, float]] = []
+        q0 = 0.0
+        limit = self._q_limit(q0)
+        mean, weight = items[0]
+        for m, w in items[1:]:
+            if q0 + (weight + w) / self.count <= limit:
+                weight += w
+                mean += (m - mean) * w / weight
+            else:
+                merged.append((mean, weight))
+                q0 += weight / self.count
+                limit = self._q_limit(q0)
+                mean, weight = m, w
+        merged.append((mean, weight))
+        self._centroids = merged
+
+    def quantile(self, q: float) -> float | None:
+        self._compress()
+        centroids = self._centroids
+        if not centroids:
+            return None
+        if len(centroids) == 1 or q <= 0:
+            return centroids[0][0] if q > 0 else self.min
+        if q >= 1:
+            return self.max
+        target = q * self.count
+        cumulative = 0.0
+        prev_mean, prev_center = self.min, 0.0
+        for mean, weight in centroids:
+            center = cumulative + weight / 2
+            if target < center:
+                span = center - prev_center
+                return prev_mean + (mean - prev_mean) * ((target - prev_center) / span if span else 0)
+            prev_mean, prev_center = mean, center
+            cumulative += weight
+        span = self.count - prev_center
+        return prev_mean + (self.max - prev_mean) * ((target - prev_center) / span if span else 0)
+
+    def to_dict(self) -> dict:
+        self._compress()
+        return {
+            "compression": self.compression,
+            "min": self.min,
+            "max": self.max,
+            "centroids": [[round(m, 3), w] for m, w in self._centroids],
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "TDigest":
+        digest = cls(data.get("compression", 200))
+        digest._centroids = [(m, w) for m, w in data["centroids"]]
+        digest.count = sum(w for _, w in digest._centroids)
+        if digest._centroids:
+            digest.min = data["min"]
+            digest.max = data["max"]
+        return digest
@@ -1,9 +1,12 @@
 from sqlalchemy import create_engine
+from sqlalchemy.engine import make_url
 from sqlalchemy.orm import sessionmaker,declarative_base
+from starlette.concurrency import run_in_threadpool
 
 from core.config import settings
+from db.pool import engine_options, TimedQueuePool, TimedAsyncAdaptedQueuePool
 
-engine = create_engine(settings.DATABASE_URL,future=True)
+engine = create_engine(settings.DATABASE_URL,future=True,**engine_options(TimedQueuePool))
 
 SessionLocal = sessionmaker(
     bind=engine,
@@ -12,9 +15,46 @@ SessionLocal = sessionmaker(
 )
 Base=declarative_base()
 
-def get_db():
+def _async_database_url() -> str:
+    if settings.ASYNC_DATABASE_URL:
+        return settings.ASYNC_DATABASE_URL
+    url = make_url(settings.DATABASE_URL)
+    if url.get_backend_name() != "postgresql":
+        raise RuntimeError("ASYNC_DATABASE_URL must be set for non-PostgreSQL databases")
+    return url.set(drivername="postgresql+asyncpg").render_as_string(hide_password=False)
+
+async_engine = None
+AsyncSessionLocal = None
+if settings.ASYNC_DB:
+    # asyncio support needs greenlet and an async driver, so only load it when enabled
+    from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker
+
+    async_engine = create_async_engine(
+        _async_database_url(),
+        **engine_options(TimedAsyncAdaptedQueuePool)
+    )
+    AsyncSessionLocal = async_sessionmaker(
+        bind=async_engine,
+        autoflush=False
+    )
+
+def get_sync_db():
     db = SessionLocal()
     try:
         yield db
     finally:
         db.close()
+
+async def get_async_db():
+    async with AsyncSessionLocal() as db:
+        yield db
+
+get_db = get_async_db if settings.ASYNC_DB else get_sync_db
+
+async def run_db(db, fn, *args, **kwargs):
+    # Services are written against a sync Session. On the async path they run
+    # inside AsyncSession.run_sync, where every query awaits the driver on the
+    # event loop; otherwise they go to the threadpool as plain def routes did.
+    if settings.ASYNC_DB:
+        return await db.run_sync(fn, *args, **kwargs)
+    return await run_in_threadpool(fn, db, *args, **kwargs)
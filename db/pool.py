@@ -0,0 +1,93 @@
+import threading
+import time
+from collections import deque
+
+from sqlalchemy import exc
+from sqlalchemy.pool import QueuePool, AsyncAdaptedQueuePool, NullPool
+
+from core.config import settings
+
+class PoolStats:
+    def __init__(self, window: int = 1000):
+        self._lock = threading.Lock()
+        self._recent = deque(maxlen=window)
+        self.checkouts = 0
+        self.timeouts = 0
+        self.total_wait = 0.0
+        self.max_wait = 0.0
+
+    def record(self, seconds: float, timed_out: bool = False) -> None:
+        with self._lock:
+            self.checkouts += 1
+            self.total_wait += seconds
+            self.max_wait = max(self.max_wait, seconds)
+            self._recent.append(seconds)
+            if timed_out:
+                self.timeouts += 1
+
+    def snapshot(self) -> dict:
+        with self._lock:
+            recent = sorted(self._recent)
+            checkouts = self.checkouts
+            data = {
+                "checkouts": checkouts,
+                "timeouts": self.timeouts,
+                "avg_wait_ms": round(self.total_wait / checkouts * 1000, 3) if checkouts else 0.0,
+                "max_wait_ms": round(self.max_wait * 1000, 3),
+            }
+        if recent:
+            data["p95_wait_ms"] = round(recent[min(len(recent) - 1, int(len(recent) * 0.95))] * 1000, 3)
+        else:
+            data["p95_wait_ms"] = 0.0
+        return data
+
+class _TimedCheckout:
+    # Times every checkout, including waits for a free slot and pre-ping,
+    # so pool saturation is visible instead of hiding in request latency.
+    stats: PoolStats
+
+    def connect(self):
+        start = time.perf_counter()
+        timed_out = False
+        try:
+            return super().connect()
+        except exc.TimeoutError:
+            timed_out = True
+            raise
+        finally:
+            self.stats.record(time.perf_counter() - start, timed_out)
+
+class TimedQueuePool(_TimedCheckout, QueuePool):
+    stats = PoolStats()
+
+class TimedAsyncAdaptedQueuePool(_TimedCheckout, AsyncAdaptedQueuePool):
+    stats = PoolStats()
+
+def engine_options(pool_class) -> dict:
+    if settings.DB_NULL_POOL:
+        # An external pooler such as PgBouncer owns the connections
+        return {"poolclass": NullPool, "pool_pre_ping": settings.DB_POOL_PRE_PING}
+    return {
+        "poolclass": pool_class,
+        "pool_size": settings.DB_POOL_SIZE,
+        "max_overflow": settings.DB_MAX_OVERFLOW,
+        "pool_timeout": settings.DB_POOL_TIMEOUT,
+        "pool_recycle": settings.DB_POOL_RECYCLE,
+        "pool_pre_ping": settings.DB_POOL_PRE_PING,
+    }
+
+def pool_status(engine) -> dict:
+    pool = engine.pool
+    if isinstance(pool, NullPool):
+        return {"mode": "null"}
+    data = {
+        "mode": "queue",
+        "size": pool.size(),
+        "checked_out": pool.checkedout(),
+        "idle": pool.checkedin(),
+        "overflow": pool.overflow(),
+        "max_overflow": settings.DB_MAX_OVERFLOW,
+    }
+    if isinstance(pool, _TimedCheckout):
+        data["wait"] = pool.stats.snapshot()
+    return data
@@ -1,8 +1,53 @@
+from contextlib import asynccontextmanager
 from fastapi import FastAPI
+from starlette.concurrency import run_in_threadpool
 from core.config import settings
+from core.hashing import shutdown_hash_pool
+from core.jobs import PeriodicJob, register_job, start_jobs, stop_jobs
+from services.outbox_service import outbox_enabled, dispatch_outbox, purge_outbox
+from services.similarity_service import build_similarity_index
+from services.stats_service import reconcile_ticket_stats
+from services.sla_service import rollup_sla
+from services.assignment_service import build_agent_loads
+from services.revocation_service import load_revocations, refresh_revocations, purge_revocations
 from api.router import router as api_router
 
-app = FastAPI(title=settings.APP_NAME)
+if outbox_enabled():
+    register_job(PeriodicJob("outbox_dispatch", settings.OUTBOX_POLL_SECONDS, dispatch_outbox))
+    register_job(PeriodicJob("outbox_purge", 3600, purge_outbox))
+register_job(PeriodicJob(
+    "ticket_stats_reconcile",
+    settings.STATS_RECONCILE_SECONDS,
+    reconcile_ticket_stats,
+    initial_delay=settings.STATS_RECONCILE_SECONDS,
+))
+register_job(PeriodicJob("sla_rollup", settings.SLA_ROLLUP_SECONDS, rollup_sla))
+register_job(PeriodicJob(
+    "token_revocations_refresh",
+    settings.REVOCATION_REFRESH_SECONDS,
+    refresh_revocations,
+    initial_delay=settings.REVOCATION_REFRESH_SECONDS,
+))
+register_job(PeriodicJob("token_revocations_purge", 3600, purge_revocations, initial_delay=3600))
+register_job(PeriodicJob(
+    "agent_loads_resync",
+    settings.AUTO_ASSIGN_RESYNC_SECONDS,
+    build_agent_loads,
+    initial_delay=settings.AUTO_ASSIGN_RESYNC_SECONDS,
+))
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    if settings.SIMILARITY_ENABLED:
+        await run_in_threadpool(build_similarity_index)
+    await run_in_threadpool(build_agent_loads)
+    await run_in_threadpool(load_revocations)
+    start_jobs()
+    yield
+    await stop_jobs()
+    shutdown_hash_pool()
+
+app = FastAPI(title=settings.APP_NAME, lifespan=lifespan)
 app.include_router(api_router)
 
 @app.get("/")
@@ -1,7 +1,10 @@
-from sqlalchemy import Column, Integer, Text, DateTime, ForeignKey
+from sqlalchemy import Column, Integer, Text, DateTime, ForeignKey, Index, Computed
+from sqlalchemy.dialects.postgresql import TSVECTOR
+from sqlalchemy.orm import deferred
 from datetime import datetime,timezone
 
 from db.db import Base
+from models.ticket import SEARCH_CONFIG
 
 class TicketComment(Base):
     __tablename__ = "ticket_comments"
@@ -11,3 +14,12 @@ class TicketComment(Base):
     user_id = Column(Integer, ForeignKey("users.id"), nullable=False)
     comment = Column(Text, nullable=False)
     created_at = Column(DateTime, default=datetime.now(timezone.utc))
+    search_vector = deferred(Column(
+        TSVECTOR,
+        Computed(f"to_tsvector('{SEARCH_CONFIG}', comment)", persisted=True),
+    ))
+
+    __table_args__ = (
+        Index("ix_ticket_comments_ticket_id_id", "ticket_id", "id"),
+        Index("ix_ticket_comments_search_vector", search_vector, postgresql_using="gin"),
+    )
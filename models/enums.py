@@ -17,3 +17,6 @@ class TicketStatus(str, Enum):
     IN_PROGRESS = "in_progress"
     RESOLVED = "resolved"
     CLOSED = "closed"
+
+# Statuses that count as an agent's active work
+OPEN_WORK_STATUSES = (TicketStatus.ASSIGNED, TicketStatus.IN_PROGRESS)
@@ -0,0 +1,27 @@
+from sqlalchemy import Column, Integer, String, Text, DateTime, JSON, Index, and_
+
+from db.db import Base
+
+class OutboxEvent(Base):
+    __tablename__ = "outbox_events"
+
+    id = Column(Integer, primary_key=True)
+    event_type = Column(String(50), nullable=False)
+    ticket_id = Column(Integer, nullable=False)
+    payload = Column(JSON, nullable=False)
+    attempts = Column(Integer, nullable=False, default=0)
+    last_error = Column(Text, nullable=True)
+
+    created_at = Column(DateTime, nullable=False)
+    available_at = Column(DateTime, nullable=False)
+    delivered_at = Column(DateTime, nullable=True)
+    failed_at = Column(DateTime, nullable=True)
+
+    __table_args__ = (
+        Index(
+            "ix_outbox_events_pending",
+            available_at, id,
+            postgresql_where=and_(delivered_at.is_(None), failed_at.is_(None)),
+        ),
+        Index("ix_outbox_events_delivered_at", delivered_at),
+    )
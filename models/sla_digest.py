@@ -0,0 +1,23 @@
+from sqlalchemy import Column, BigInteger, String, Date, JSON
+
+from db.db import Base
+
+class SlaDigest(Base):
+    # One t-digest of durations per day, metric, status and grouping value
+    __tablename__ = "sla_digests"
+
+    day = Column(Date, primary_key=True)
+    metric = Column(String(20), primary_key=True)
+    status = Column(String(20), primary_key=True)
+    # "all", "priority" or "agent"; group_value is "" for "all"
+    dimension = Column(String(10), primary_key=True)
+    group_value = Column(String(20), primary_key=True)
+    count = Column(BigInteger, nullable=False)
+    digest = Column(JSON, nullable=False)
+
+class RollupWatermark(Base):
+    # Highest source row id each rollup has folded in
+    __tablename__ = "rollup_watermarks"
+
+    name = Column(String(50), primary_key=True)
+    position = Column(BigInteger, nullable=False, default=0)
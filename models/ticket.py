@@ -1,9 +1,12 @@
-from sqlalchemy import Column, Integer, String, Text, DateTime, ForeignKey
+from sqlalchemy import Column, Integer, String, Text, DateTime, ForeignKey, Index, Computed, func
 from sqlalchemy import Enum as SqlEnum
-from datetime import datetime, timezone
+from sqlalchemy.dialects.postgresql import TSVECTOR
+from sqlalchemy.orm import deferred
 
 from db.db import Base
-from models.enums import TicketPriority, TicketStatus
+from models.enums import TicketPriority, TicketStatus, OPEN_WORK_STATUSES
+
+SEARCH_CONFIG = "english"
 
 class Ticket(Base):
     __tablename__ = "tickets"
@@ -31,5 +34,28 @@ class Ticket(Base):
     created_by = Column(Integer, ForeignKey("users.id"), nullable=False)
     assigned_to = Column(Integer, ForeignKey("users.id"), nullable=True)
 
-    created_at = Column(DateTime, default=datetime.now(timezone.utc))
-    updated_at = Column(DateTime, default=datetime.now(timezone.utc))
+    created_at = Column(DateTime, server_default=func.now())
+    updated_at = Column(DateTime, server_default=func.now())
+
+    # Maintained by Postgres on every write; deferred so normal loads skip it
+    search_vector = deferred(Column(
+        TSVECTOR,
+        Computed(
+            f"setweight(to_tsvector('{SEARCH_CONFIG}', coalesce(title, '')), 'A') || "
+            f"setweight(to_tsvector('{SEARCH_CONFIG}', coalesce(description, '')), 'B')",
+            persisted=True,
+        ),
+    ))
+
+    __table_args__ = (
+        Index("ix_tickets_created_by_id", "created_by", "id"),
+        Index("ix_tickets_assigned_to_status", "assigned_to", "status"),
+        Index("ix_tickets_status_priority_created_at", "status", "priority", "created_at"),
+        Index("ix_tickets_updated_at_id", "updated_at", "id"),
+        Index(
+            "ix_tickets_agent_inbox",
+            assigned_to, priority.desc(), created_at, id,
+            postgresql_where=status.in_(OPEN_WORK_STATUSES),
+        ),
+        Index("ix_tickets_search_vector", search_vector, postgresql_using="gin"),
+    )
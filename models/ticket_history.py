@@ -0,0 +1,23 @@
+from sqlalchemy import Column, Integer, String, DateTime, Float, ForeignKey, Index
+
+from db.db import Base
+
+class TicketStatusHistory(Base):
+    # Append-only, written by a trigger on tickets; see the migration
+    __tablename__ = "ticket_status_history"
+
+    id = Column(Integer, primary_key=True)
+    ticket_id = Column(Integer, ForeignKey("tickets.id"), nullable=False)
+    # NULL for the row recording the ticket's creation
+    from_status = Column(String(20), nullable=True)
+    to_status = Column(String(20), nullable=False)
+    priority = Column(String(20), nullable=False)
+    assignee_id = Column(Integer, nullable=True)
+    changed_at = Column(DateTime, nullable=False)
+    # Time spent in from_status, and ticket age when to_status was reached
+    in_status_seconds = Column(Float, nullable=True)
+    age_seconds = Column(Float, nullable=False)
+
+    __table_args__ = (
+        Index("ix_ticket_status_history_ticket_id_id", "ticket_id", "id"),
+    )
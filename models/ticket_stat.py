@@ -0,0 +1,18 @@
+from sqlalchemy import Column, Integer, SmallInteger, BigInteger, String
+
+from db.db import Base
+
+# Writers spread over this many rows per counter so concurrent ticket
+# writes do not queue on a single hot row
+STATS_SHARDS = 8
+
+class TicketStat(Base):
+    # Maintained by statement-level triggers on tickets; see the migration
+    __tablename__ = "ticket_stats"
+
+    status = Column(String(20), primary_key=True)
+    priority = Column(String(20), primary_key=True)
+    # 0 stands for unassigned so the column can be part of the key
+    assignee_id = Column(Integer, primary_key=True)
+    shard = Column(SmallInteger, primary_key=True)
+    count = Column(BigInteger, nullable=False, default=0)
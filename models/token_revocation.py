@@ -0,0 +1,17 @@
+from sqlalchemy import Column, Integer, DateTime, ForeignKey, Index, func
+
+from db.db import Base
+
+class TokenRevocation(Base):
+    # Append-only log of token_version bumps, read incrementally by every
+    # worker; rows older than a token's lifetime no longer matter and are purged
+    __tablename__ = "token_revocations"
+
+    id = Column(Integer, primary_key=True)
+    user_id = Column(Integer, ForeignKey("users.id"), nullable=False)
+    token_version = Column(Integer, nullable=False)
+    created_at = Column(DateTime, nullable=False, server_default=func.now())
+
+    __table_args__ = (
+        Index("ix_token_revocations_created_at", "created_at"),
+    )
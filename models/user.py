@@ -1,4 +1,4 @@
-from sqlalchemy import Column,String,Integer,Boolean,DateTime,Enum
+from sqlalchemy import Column,String,Integer,Boolean,DateTime,Enum,Index,func
 from datetime import datetime,timezone
 from sqlalchemy import Enum as SqlEnum
 from models.enums import Role
@@ -16,7 +16,10 @@ class User(Base):
     SqlEnum(Role, name="role", values_callable=lambda x: [e.value for e in x]),
     nullable=False)
     is_active = Column(Boolean, default=True)
+    # Tokens carry this as "ver"; bumping it revokes every token issued before
+    token_version = Column(Integer, nullable=False, default=0, server_default="0")
     created_at = Column(DateTime, default=datetime.now(timezone.utc))
 
-
-
+    __table_args__ = (
+        Index("ix_users_email_lower", func.lower(email)),
+    )
@@ -7,6 +7,13 @@ class TicketCreate(BaseModel):
     description: str = Field(min_length=2)
     priority: TicketPriority
 
+class TicketImport(TicketCreate):
+    created_by: int
+    status: TicketStatus = TicketStatus.OPEN
+    assigned_to: int | None = None
+    created_at: datetime | None = None
+    updated_at: datetime | None = None
+
 class TicketUpdate(BaseModel):
     title: str | None = Field(default=None, min_length=1)
     description: str | None = Field(default=None, min_length=2)
@@ -18,6 +25,21 @@ class TicketAssign(BaseModel):
 class TicketStatusUpdate(BaseModel):
     status: TicketStatus
 
+class TicketBulkAssign(BaseModel):
+    ticket_ids: list[int] = Field(min_length=1, max_length=1000)
+    agent_id: int
+
+class TicketBulkStatusUpdate(BaseModel):
+    ticket_ids: list[int] = Field(min_length=1, max_length=1000)
+    status: TicketStatus
+
+class TicketFilters(BaseModel):
+    status: TicketStatus | None = None
+    priority: TicketPriority | None = None
+    assigned_to: int | None = None
+    created_from: datetime | None = None
+    created_to: datetime | None = None
+
 class TicketOut(BaseModel):
     id: int
     title: str
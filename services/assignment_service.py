@@ -0,0 +1,54 @@
+from core.config import settings
+from core.loadbalance import AgentLoadHeap
+from db.db import SessionLocal
+from models.ticket import Ticket
+from models.user import User
+from models.enums import Role, OPEN_WORK_STATUSES
+
+agent_loads = AgentLoadHeap()
+
+_OPEN_WORK = {s.value for s in OPEN_WORK_STATUSES}
+
+def priority_weight(priority: str) -> float:
+    return settings.AUTO_ASSIGN_WEIGHTS.get(priority, 1.0)
+
+def build_agent_loads() -> None:
+    # Startup and periodic resync: other workers assign too, and their
+    # changes only reach this process's heap through the database
+    with SessionLocal() as db:
+        agent_ids = [
+            row.id for row in
+            db.query(User.id).filter(User.role == Role.AGENT, User.is_active.is_not(False))
+        ]
+        tickets = {
+            row.id: (row.assigned_to, priority_weight(row.priority.value))
+            for row in (
+                db.query(Ticket.id, Ticket.assigned_to, Ticket.priority)
+                .filter(Ticket.status.in_(OPEN_WORK_STATUSES), Ticket.assigned_to.is_not(None))
+                .yield_per(1000)
+            )
+        }
+    agent_loads.rebuild(agent_ids, tickets)
+
+def track_ticket(data: dict) -> None:
+    # Called after every committed ticket change: open work counts towards
+    # its agent, anything resolved, closed or unassigned stops counting
+    if data["status"] in _OPEN_WORK and data["assigned_to"] is not None:
+        agent_loads.track(data["id"], data["assigned_to"], priority_weight(data["priority"]))
+    else:
+        agent_loads.track(data["id"], None)
+
+def agent_changed(user: dict) -> None:
+    if user["role"] == Role.AGENT.value and user["is_active"] is not False:
+        agent_loads.add_agent(user["id"])
+    else:
+        agent_loads.remove_agent(user["id"])
+
+def claim_agent(ticket_id: int, priority: str) -> int | None:
+    return agent_loads.claim(ticket_id, priority_weight(priority))
+
+def release_claim(ticket_id: int) -> None:
+    agent_loads.track(ticket_id, None)
+
+def assignment_status() -> dict:
+    return {"on_create": settings.AUTO_ASSIGN_ON_CREATE, **agent_loads.stats()}
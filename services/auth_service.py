@@ -1,3 +1,4 @@
+from sqlalchemy import func
 from sqlalchemy.orm import Session
 from fastapi import HTTPException
 
@@ -6,7 +7,7 @@ from models.enums import Role
 from core.security import hash_password, verify_password, create_access_token
 
 def register_employee(db: Session, name: str, email: str, password: str) -> dict:
-    existing = db.query(User).filter(User.email == email).first()
+    existing = db.query(User).filter(func.lower(User.email) == email.lower()).first()
     if existing:
         raise HTTPException(status_code=400, detail="Email already registered")
 
@@ -29,7 +30,7 @@ def register_employee(db: Session, name: str, email: str, password: str) -> dict
     }
 
 def login_user(db: Session, email: str, password: str) -> dict:
-    user = db.query(User).filter(User.email == email).first()
+    user = db.query(User).filter(func.lower(User.email) == email.lower()).first()
 
     if not user:
         raise HTTPException(status_code=401, detail="Invalid email or password")
@@ -38,7 +39,7 @@ def login_user(db: Session, email: str, password: str) -> dict:
     if not verify_password(password, user.password_hash):
         raise HTTPException(status_code=401, detail="Invalid email or password")
 
-    payload = {"sub": user.email, "role": user.role.value, "user_id": user.id}
+    payload = {"sub": user.email, "role": user.role.value, "user_id": user.id, "ver": user.token_version}
     token = create_access_token(payload)
     return {"access_token": token, "token_type": "bearer"}
 
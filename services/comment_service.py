@@ -1,4 +1,5 @@
 from fastapi import HTTPException
+from sqlalchemy import func, select
 from sqlalchemy.orm import Session
 from datetime import datetime, timezone
 
@@ -6,6 +7,9 @@ from models.comment import TicketComment
 from models.ticket import Ticket
 from models.enums import Role, TicketStatus
 from schemas.comment import CommentCreate
+from core.etag import comments_etag
+from core.events import hub
+from services.outbox_service import enqueue_events
 
 
 def _now():
@@ -63,22 +67,60 @@ def add_comment(db: Session, current_user: dict, ticket_id: int, payload: Commen
         created_at=_now(),
     )
     db.add(comment)
+    db.flush()
+    data = _comment_dict(comment)
+    enqueue_events(db, "comment.created", [data], ticket_key="ticket_id")
     db.commit()
-    db.refresh(comment)
-    return _comment_dict(comment)
+    hub.publish("comment.created", ticket_id, ticket.created_by, ticket.assigned_to, data)
+    return data
 
 
-def list_comments(db: Session, current_user: dict, ticket_id: int) -> list[dict]:
+def get_comments_etag(db: Session, current_user: dict, ticket_id: int) -> str:
+    # One narrow query: access columns plus the newest comment id, which
+    # changes whenever the (append-only) comment list does
+    last_comment_id = (
+        select(func.max(TicketComment.id))
+        .where(TicketComment.ticket_id == ticket_id)
+        .scalar_subquery()
+    )
+    row = (
+        db.query(Ticket.created_by, Ticket.assigned_to, last_comment_id.label("last_comment_id"))
+        .filter(Ticket.id == ticket_id)
+        .first()
+    )
+    if not row:
+        raise HTTPException(status_code=404, detail="Ticket not found")
+    if not _can_access_ticket(current_user, row):
+        raise HTTPException(status_code=403, detail="Not allowed to view comments for this ticket")
+    return comments_etag(ticket_id, row.last_comment_id)
+
+
+def list_comments(
+    db: Session,
+    current_user: dict,
+    ticket_id: int,
+    limit: int,
+    after_id: int | None = None,
+    before_id: int | None = None,
+) -> dict:
     ticket = _get_ticket_or_404(db, ticket_id)
     if not _can_access_ticket(current_user, ticket):
         raise HTTPException(status_code=403, detail="Not allowed to view comments for this ticket")
-    comments = (
-        db.query(TicketComment)
-        .filter(TicketComment.ticket_id == ticket_id)
-        .order_by(TicketComment.id.asc())
-        .all()
-    )
+    query = db.query(TicketComment).filter(TicketComment.ticket_id == ticket_id)
+    if after_id is not None:
+        query = query.filter(TicketComment.id > after_id)
+    if before_id is not None:
+        query = query.filter(TicketComment.id < before_id)
+    # Both directions seek on (ticket_id, id); paging backward walks the index
+    # in reverse and flips the page so comments always come oldest first.
+    backward = before_id is not None and after_id is None
+    order = TicketComment.id.desc() if backward else TicketComment.id.asc()
+    comments = query.order_by(order).limit(limit + 1).all()
+    has_more = len(comments) > limit
+    comments = comments[:limit]
+    if backward:
+        comments.reverse()
     data: list[dict] = []
     for c in comments:
         data.append(_comment_dict(c))
-    return data
+    return {"comments": data, "has_more": has_more}
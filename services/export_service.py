@@ -0,0 +1,85 @@
+import csv
+import io
+import json
+from datetime import datetime
+from typing import Iterator
+
+from db.db import SessionLocal
+from models.ticket import Ticket
+from models.comment import TicketComment
+from services.ticket_service import _ticket_dict
+from services.comment_service import _comment_dict
+
+EXPORT_BATCH_SIZE = 1000
+
+TICKET_FIELDS = [
+    "id", "title", "description", "priority", "status",
+    "created_by", "assigned_to", "created_at", "updated_at",
+]
+COMMENT_FIELDS = ["id", "ticket_id", "user_id", "comment", "created_at"]
+
+def _json_default(value):
+    if isinstance(value, datetime):
+        return value.isoformat()
+    raise TypeError(f"Cannot serialize {type(value).__name__}")
+
+def _csv_value(value):
+    if value is None:
+        return ""
+    if isinstance(value, datetime):
+        return value.isoformat()
+    return value
+
+def _encode(rows: Iterator[dict], fields: list[str], fmt: str) -> Iterator[str]:
+    # Rows are flushed once per server-side cursor batch, so neither the
+    # worker nor the response ever holds more than one batch in memory.
+    buffer = io.StringIO()
+    writer = csv.writer(buffer) if fmt == "csv" else None
+    if writer is not None:
+        writer.writerow(fields)
+    pending = 0
+    for row in rows:
+        if writer is not None:
+            writer.writerow([_csv_value(row[f]) for f in fields])
+        else:
+            buffer.write(json.dumps(row, default=_json_default))
+            buffer.write("\n")
+        pending += 1
+        if pending >= EXPORT_BATCH_SIZE:
+            yield buffer.getvalue()
+            buffer.seek(0)
+            buffer.truncate()
+            pending = 0
+    if buffer.tell():
+        yield buffer.getvalue()
+
+def _stream_tickets(updated_since: datetime | None) -> Iterator[dict]:
+    db = SessionLocal()
+    try:
+        query = db.query(Ticket)
+        if updated_since is not None:
+            query = query.filter(Ticket.updated_at >= updated_since)
+        query = query.order_by(Ticket.updated_at.asc(), Ticket.id.asc())
+        for t in query.yield_per(EXPORT_BATCH_SIZE):
+            yield _ticket_dict(t)
+    finally:
+        db.close()
+
+def _stream_comments(updated_since: datetime | None) -> Iterator[dict]:
+    # Comments are append-only, so created_at doubles as their watermark
+    db = SessionLocal()
+    try:
+        query = db.query(TicketComment)
+        if updated_since is not None:
+            query = query.filter(TicketComment.created_at >= updated_since)
+        query = query.order_by(TicketComment.created_at.asc(), TicketComment.id.asc())
+        for c in query.yield_per(EXPORT_BATCH_SIZE):
+            yield _comment_dict(c)
+    finally:
+        db.close()
+
+def export_tickets(fmt: str, updated_since: datetime | None = None) -> Iterator[str]:
+    return _encode(_stream_tickets(updated_since), TICKET_FIELDS, fmt)
+
+def export_comments(fmt: str, updated_since: datetime | None = None) -> Iterator[str]:
+    return _encode(_stream_comments(updated_since), COMMENT_FIELDS, fmt)
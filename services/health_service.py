@@ -0,0 +1,8 @@
+import time
+from sqlalchemy import text
+from sqlalchemy.orm import Session
+
+def db_round_trip_ms(db: Session) -> float:
+    start = time.perf_counter()
+    db.execute(text("SELECT 1"))
+    return round((time.perf_counter() - start) * 1000, 3)
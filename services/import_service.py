@@ -0,0 +1,191 @@
+import csv
+import io
+import json
+import re
+import time
+from datetime import datetime, timezone
+from typing import IO, Callable, Iterable, Iterator
+
+from pydantic import ValidationError
+from sqlalchemy import insert
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.orm import Session
+
+from db.db import SessionLocal
+from models.ticket import Ticket
+from models.user import User
+from models.enums import Role, OPEN_WORK_STATUSES
+from schemas.ticket import TicketImport
+
+IMPORT_CHUNK_SIZE = 1000
+IMPORT_MAX_ERRORS = 1000
+
+def _now():
+    return datetime.now(timezone.utc)
+
+# Uploads are decoded with surrogateescape, so a byte that is not UTF-8 turns
+# into a lone surrogate the parser can report for its row instead of a
+# UnicodeDecodeError halfway through an import whose earlier chunks committed
+_UNDECODABLE = re.compile("[\udc80-\udcff]")
+_INVALID_UTF8 = "Invalid UTF-8"
+
+def open_text(binary: IO[bytes]) -> IO[str]:
+    return io.TextIOWrapper(binary, encoding="utf-8", errors="surrogateescape", newline="")
+
+def _undecodable(row: dict) -> bool:
+    # csv puts cells past the header in a list under the None key
+    for value in row.values():
+        for cell in value if isinstance(value, list) else [value]:
+            if isinstance(cell, str) and _UNDECODABLE.search(cell):
+                return True
+    return False
+
+def _parse(lines: Iterable[str], fmt: str) -> Iterator[tuple[int, dict | None, str | None]]:
+    if fmt == "csv":
+        reader = csv.DictReader(lines)
+        for row in reader:
+            if _undecodable(row):
+                yield reader.line_num, None, _INVALID_UTF8
+                continue
+            # empty CSV cells mean "not provided", not empty strings
+            yield reader.line_num, {k: v for k, v in row.items() if v not in ("", None)}, None
+        return
+    for line_no, line in enumerate(lines, start=1):
+        if not line.strip():
+            continue
+        if _UNDECODABLE.search(line):
+            yield line_no, None, _INVALID_UTF8
+            continue
+        try:
+            row = json.loads(line)
+        except ValueError as exc:
+            yield line_no, None, f"Invalid JSON: {exc}"
+            continue
+        if not isinstance(row, dict):
+            yield line_no, None, "Each line must be a JSON object"
+            continue
+        yield line_no, row, None
+
+def _validation_message(exc: ValidationError) -> str:
+    return "; ".join(
+        f"{'.'.join(str(part) for part in err['loc'])}: {err['msg']}" for err in exc.errors()
+    )
+
+def _row_error(row: dict, roles: dict[int, Role]) -> str | None:
+    missing = [f for f in ("created_by", "assigned_to") if row[f] is not None and row[f] not in roles]
+    if missing:
+        return f"Unknown user id in {', '.join(missing)}"
+    # The same invariants the API keeps: open work always has an agent on it
+    if row["status"] in OPEN_WORK_STATUSES and row["assigned_to"] is None:
+        return f"Status {row['status'].value} requires assigned_to"
+    if row["assigned_to"] is not None and roles[row["assigned_to"]] != Role.AGENT:
+        return "assigned_to must be an agent"
+    return None
+
+# psycopg2 refuses some values (NUL bytes) with a plain ValueError before the
+# statement reaches the server
+_INSERT_ERRORS = (SQLAlchemyError, ValueError)
+
+def _database_error(exc: Exception) -> str:
+    reason = str(getattr(exc, "orig", None) or exc).strip().splitlines()
+    return f"Rejected by the database: {reason[0] if reason else exc.__class__.__name__}"
+
+def _insert_rows_one_by_one(db: Session, rows: list[tuple[int, dict]], errors: list[dict]) -> int:
+    # Only runs after a chunk failed, so every bad row gets its own error
+    # while the good rows around it still go in
+    inserted = 0
+    for line_no, row in rows:
+        try:
+            db.execute(insert(Ticket), [row])
+            db.commit()
+        except _INSERT_ERRORS as exc:
+            db.rollback()
+            errors.append({"line": line_no, "error": _database_error(exc)})
+            continue
+        inserted += 1
+    return inserted
+
+def _insert_chunk(db: Session, chunk: list[tuple[int, dict]], errors: list[dict]) -> int:
+    # One lookup per chunk catches unknown users and non-agent assignees
+    # before they fail the whole INSERT
+    user_ids = {row["created_by"] for _, row in chunk}
+    user_ids.update(row["assigned_to"] for _, row in chunk if row["assigned_to"] is not None)
+    roles = dict(db.query(User.id, User.role).filter(User.id.in_(user_ids)).all())
+    rows = []
+    for line_no, row in chunk:
+        error = _row_error(row, roles)
+        if error is not None:
+            errors.append({"line": line_no, "error": error})
+            continue
+        rows.append((line_no, row))
+    if not rows:
+        return 0
+    try:
+        # executemany: SQLAlchemy batches these into multi-row INSERTs
+        db.execute(insert(Ticket), [row for _, row in rows])
+        db.commit()
+    except _INSERT_ERRORS:
+        db.rollback()
+        return _insert_rows_one_by_one(db, rows, errors)
+    return len(rows)
+
+def import_tickets(
+    db: Session,
+    lines: Iterable[str],
+    fmt: str,
+    progress: Callable[[dict], None] | None = None,
+) -> dict:
+    started = time.perf_counter()
+    report = {"rows": 0, "inserted": 0, "failed": 0}
+    errors: list[dict] = []
+    chunk: list[tuple[int, dict]] = []
+
+    def flush() -> None:
+        report["inserted"] += _insert_chunk(db, chunk, errors)
+        chunk.clear()
+        if progress is not None:
+            elapsed = time.perf_counter() - started
+            progress({**report, "rows_per_second": round(report["inserted"] / elapsed, 1) if elapsed else 0.0})
+
+    for line_no, raw, parse_error in _parse(lines, fmt):
+        report["rows"] += 1
+        if parse_error is not None:
+            errors.append({"line": line_no, "error": parse_error})
+            continue
+        try:
+            row = TicketImport.model_validate(raw)
+        except ValidationError as exc:
+            errors.append({"line": line_no, "error": _validation_message(exc)})
+            continue
+        created_at = row.created_at or _now()
+        chunk.append((line_no, {
+            "title": row.title,
+            "description": row.description,
+            "priority": row.priority,
+            "status": row.status,
+            "created_by": row.created_by,
+            "assigned_to": row.assigned_to,
+            "created_at": created_at,
+            "updated_at": row.updated_at or created_at,
+        }))
+        if len(chunk) >= IMPORT_CHUNK_SIZE:
+            flush()
+    if chunk:
+        flush()
+
+    elapsed = time.perf_counter() - started
+    report["failed"] = report["rows"] - report["inserted"]
+    report["seconds"] = round(elapsed, 3)
+    report["rows_per_second"] = round(report["inserted"] / elapsed, 1) if elapsed else 0.0
+    # Row checks report as rows are read, database rejections once per chunk
+    errors.sort(key=lambda e: e["line"])
+    report["errors"] = errors[:IMPORT_MAX_ERRORS]
+    report["errors_truncated"] = len(errors) > IMPORT_MAX_ERRORS
+    return report
+
+def run_import(lines: Iterable[str], fmt: str) -> dict:
+    # Owns its session so the API can hand the whole import to a worker
+    # thread, keeping parsing and validation off the event loop on either
+    # database stack
+    with SessionLocal() as db:
+        return import_tickets(db, lines, fmt)
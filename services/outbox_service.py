@@ -0,0 +1,161 @@
+import json
+import random
+import urllib.request
+from datetime import datetime, timedelta, timezone
+
+from fastapi.encoders import jsonable_encoder
+from sqlalchemy import select, update, delete, insert, func
+from sqlalchemy.orm import Session
+
+from core.config import settings
+from db.db import SessionLocal
+from models.outbox import OutboxEvent
+
+def _now() -> datetime:
+    # Naive UTC, matching the other DateTime columns
+    return datetime.now(timezone.utc).replace(tzinfo=None)
+
+def outbox_enabled() -> bool:
+    return bool(settings.OUTBOX_WEBHOOK_URL)
+
+def enqueue_events(db: Session, event_type: str, items: list[dict], ticket_key: str = "id") -> None:
+    # Called before the caller commits, so the events exist if and only if
+    # the change they describe does. Delivery happens later, off the request.
+    if not outbox_enabled() or not items:
+        return
+    now = _now()
+    rows = [
+        {
+            "event_type": event_type,
+            "ticket_id": item[ticket_key],
+            "payload": jsonable_encoder(item),
+            "attempts": 0,
+            "created_at": now,
+            "available_at": now,
+        }
+        for item in items
+    ]
+    db.execute(insert(OutboxEvent), rows)
+
+def _pending():
+    return (OutboxEvent.delivered_at.is_(None), OutboxEvent.failed_at.is_(None))
+
+def _lease() -> timedelta:
+    # Long enough for every row of a full batch to run into the delivery
+    # timeout, so a slow batch is not claimed again while it is still going
+    seconds = settings.OUTBOX_BATCH_SIZE * settings.OUTBOX_TIMEOUT_SECONDS + settings.OUTBOX_LEASE_MARGIN_SECONDS
+    return timedelta(seconds=seconds)
+
+def _claim(db: Session) -> list[OutboxEvent]:
+    # SKIP LOCKED lets several dispatchers claim disjoint batches. The claim
+    # is a lease: rows are pushed into the future and committed before any
+    # delivery starts, so no transaction stays open across network calls and
+    # a dispatcher that dies mid-batch only delays its rows until the lease ends.
+    now = _now()
+    batch = (
+        select(OutboxEvent.id)
+        .where(*_pending(), OutboxEvent.available_at <= now)
+        .order_by(OutboxEvent.available_at, OutboxEvent.id)
+        .limit(settings.OUTBOX_BATCH_SIZE)
+        .with_for_update(skip_locked=True)
+    )
+    stmt = (
+        update(OutboxEvent)
+        .where(OutboxEvent.id.in_(batch))
+        .values(
+            available_at=now + _lease(),
+            attempts=OutboxEvent.attempts + 1,
+        )
+        .returning(OutboxEvent)
+        .execution_options(synchronize_session=False)
+    )
+    events = list(db.execute(stmt).scalars())
+    db.commit()
+    return sorted(events, key=lambda e: e.id)
+
+def _deliver(event: OutboxEvent) -> None:
+    body = json.dumps({
+        "id": event.id,
+        "type": event.event_type,
+        "ticket_id": event.ticket_id,
+        "occurred_at": event.created_at.isoformat(),
+        "data": event.payload,
+    }).encode()
+    request = urllib.request.Request(
+        settings.OUTBOX_WEBHOOK_URL,
+        data=body,
+        method="POST",
+        headers={
+            "Content-Type": "application/json",
+            # Delivery is at-least-once; receivers dedupe on this key
+            "Idempotency-Key": str(event.id),
+        },
+    )
+    with urllib.request.urlopen(request, timeout=settings.OUTBOX_TIMEOUT_SECONDS) as response:
+        response.read()
+
+def _backoff(attempts: int) -> timedelta:
+    delay = min(settings.OUTBOX_BACKOFF_MAX_SECONDS, 2 ** attempts)
+    return timedelta(seconds=delay * random.uniform(0.5, 1.0))
+
+def dispatch_outbox() -> bool:
+    with SessionLocal() as db:
+        events = _claim(db)
+        if not events:
+            return False
+        delivered: list[int] = []
+        released: list[int] = []
+        for event in events:
+            # The timeout bounds each socket operation rather than a whole
+            # delivery, so a batch can still outrun its lease; rows it has no
+            # time left for go back instead of racing the next claim
+            if _now() + timedelta(seconds=settings.OUTBOX_TIMEOUT_SECONDS) > event.available_at:
+                released.append(event.id)
+                continue
+            try:
+                _deliver(event)
+            # Anything a delivery raises (http.client errors on a truncated
+            # response, say) is one failed attempt, never a lost batch
+            except Exception as e:
+                now = _now()
+                values = {"last_error": f"{type(e).__name__}: {e}"[:1000]}
+                if event.attempts >= settings.OUTBOX_MAX_ATTEMPTS:
+                    values["failed_at"] = now
+                else:
+                    values["available_at"] = now + _backoff(event.attempts)
+                db.execute(update(OutboxEvent).where(OutboxEvent.id == event.id).values(**values))
+            else:
+                delivered.append(event.id)
+        if released:
+            # Only while the lease is still ours; a dispatcher that already
+            # claimed these rows again has moved available_at on
+            db.execute(
+                update(OutboxEvent)
+                .where(OutboxEvent.id.in_(released), OutboxEvent.available_at == events[0].available_at)
+                .values(available_at=_now(), attempts=OutboxEvent.attempts - 1)
+            )
+        if delivered:
+            db.execute(
+                update(OutboxEvent)
+                .where(OutboxEvent.id.in_(delivered))
+                .values(delivered_at=_now(), last_error=None)
+            )
+        db.commit()
+        return len(events) == settings.OUTBOX_BATCH_SIZE
+
+def purge_outbox() -> bool:
+    cutoff = _now() - timedelta(hours=settings.OUTBOX_RETENTION_HOURS)
+    with SessionLocal() as db:
+        db.execute(delete(OutboxEvent).where(OutboxEvent.delivered_at < cutoff))
+        db.commit()
+    return False
+
+def outbox_status(db: Session) -> dict:
+    pending, oldest = (
+        db.query(func.count(OutboxEvent.id), func.min(OutboxEvent.created_at))
+        .filter(*_pending())
+        .one()
+    )
+    failed = db.query(func.count(OutboxEvent.id)).filter(OutboxEvent.failed_at.is_not(None)).scalar()
+    lag = round((_now() - oldest).total_seconds(), 3) if oldest is not None else 0.0
+    return {"pending": pending, "failed": failed, "lag_seconds": lag}
@@ -0,0 +1,69 @@
+import time
+from datetime import timedelta
+
+from sqlalchemy import delete, func, select, update
+from sqlalchemy.orm import Session
+
+from core.config import settings
+from core.revocation import token_revocations
+from db.db import SessionLocal
+from models.token_revocation import TokenRevocation
+from models.user import User
+
+# Database time of the last refresh; each refresh re-reads from a little
+# before it, so a revocation whose transaction committed late is still seen
+_refreshed_until = None
+
+def _retention() -> timedelta:
+    # Once every token issued before a bump has expired, the bump is moot
+    return timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES, seconds=settings.REVOCATION_GRACE_SECONDS)
+
+def revoke_user_tokens(db: Session, user_id: int) -> int:
+    # Caller commits, then passes the result to apply_revocation
+    version = db.execute(
+        update(User)
+        .where(User.id == user_id)
+        .values(token_version=User.token_version + 1)
+        .returning(User.token_version)
+    ).scalar_one()
+    db.add(TokenRevocation(user_id=user_id, token_version=version))
+    return version
+
+def apply_revocation(user_id: int, version: int) -> None:
+    token_revocations.revoke(user_id, version)
+
+def _read_since(db: Session, since) -> list:
+    query = select(TokenRevocation.user_id, func.max(TokenRevocation.token_version))
+    if since is not None:
+        query = query.where(TokenRevocation.created_at >= since)
+    return db.execute(query.group_by(TokenRevocation.user_id)).all()
+
+def load_revocations() -> None:
+    global _refreshed_until
+    with SessionLocal() as db:
+        now = db.scalar(select(func.localtimestamp()))
+        rows = _read_since(db, now - _retention())
+    token_revocations.replace(dict(rows))
+    token_revocations.refreshed_at = time.time()
+    _refreshed_until = now
+
+def refresh_revocations() -> None:
+    global _refreshed_until
+    if _refreshed_until is None:
+        load_revocations()
+        return
+    with SessionLocal() as db:
+        now = db.scalar(select(func.localtimestamp()))
+        rows = _read_since(db, _refreshed_until - timedelta(seconds=settings.REVOCATION_GRACE_SECONDS))
+    for user_id, version in rows:
+        token_revocations.revoke(user_id, version)
+    token_revocations.refreshed_at = time.time()
+    _refreshed_until = now
+
+def purge_revocations() -> None:
+    with SessionLocal() as db:
+        now = db.scalar(select(func.localtimestamp()))
+        db.execute(delete(TokenRevocation).where(TokenRevocation.created_at < now - _retention()))
+        db.commit()
+    # Drops entries for users whose old tokens have all expired
+    load_revocations()
@@ -0,0 +1,105 @@
+import html
+
+from fastapi import HTTPException
+from sqlalchemy import Float, select, union_all, tuple_, func, cast
+from sqlalchemy.dialects.postgresql import REGCONFIG
+from sqlalchemy.orm import Session
+
+from models.ticket import Ticket, SEARCH_CONFIG
+from models.comment import TicketComment
+from core.pagination import encode_cursor, decode_cursor
+from services.ticket_service import _ticket_dict, _access_condition
+
+# Control characters mark the matches so the text around them can be
+# HTML-escaped before the markers become <mark> tags
+_START, _STOP = "\x02", "\x03"
+_TITLE_OPTIONS = f"HighlightAll=true, StartSel={_START}, StopSel={_STOP}"
+_SNIPPET_OPTIONS = f"MaxFragments=2, MaxWords=25, MinWords=8, StartSel={_START}, StopSel={_STOP}"
+
+def _highlight(text: str | None) -> str | None:
+    if text is None:
+        return None
+    return html.escape(text).replace(_START, "<mark>").replace(_STOP, "</mark>")
+
+def _headline(column, tsquery, options: str):
+    return func.ts_headline(cast(SEARCH_CONFIG, REGCONFIG), column, tsquery, options)
+
+def _rank(vector, tsquery):
+    # ts_rank_cd returns real; as float8 the value read back into a cursor
+    # compares equal to the stored one, so rows tied on rank are not lost
+    return cast(func.ts_rank_cd(vector, tsquery), Float).label("rank")
+
+def search_tickets(db: Session, current_user: dict, q: str, limit: int, cursor: str | None = None) -> dict:
+    tsquery = func.websearch_to_tsquery(cast(SEARCH_CONFIG, REGCONFIG), q)
+    scope = _access_condition(current_user)
+
+    # Both branches are GIN lookups, scoped to what the caller may see, and
+    # only matching ids are ranked; no ticket text is read until the page is known.
+    ticket_hits = (
+        select(Ticket.id.label("ticket_id"), _rank(Ticket.search_vector, tsquery))
+        .where(Ticket.search_vector.op("@@")(tsquery))
+    )
+    comment_hits = (
+        select(TicketComment.ticket_id, _rank(TicketComment.search_vector, tsquery))
+        .join(Ticket, Ticket.id == TicketComment.ticket_id)
+        .where(TicketComment.search_vector.op("@@")(tsquery))
+    )
+    if scope is not None:
+        ticket_hits = ticket_hits.where(scope)
+        comment_hits = comment_hits.where(scope)
+    hits = union_all(ticket_hits, comment_hits).subquery()
+    ranked = (
+        select(hits.c.ticket_id, func.max(hits.c.rank).label("rank"))
+        .group_by(hits.c.ticket_id)
+        .subquery()
+    )
+    page = select(ranked.c.ticket_id, ranked.c.rank).order_by(ranked.c.rank.desc(), ranked.c.ticket_id.desc())
+    if cursor is not None:
+        position = decode_cursor(cursor)
+        try:
+            last = (float(position["rank"]), int(position["id"]))
+        except (KeyError, TypeError, ValueError):
+            raise HTTPException(status_code=400, detail="Invalid cursor")
+        page = page.where(tuple_(ranked.c.rank, ranked.c.ticket_id) < tuple_(*last))
+    rows = db.execute(page.limit(limit + 1)).all()
+
+    next_cursor = None
+    if len(rows) > limit:
+        rows = rows[:limit]
+        next_cursor = encode_cursor({"rank": rows[-1].rank, "id": rows[-1].ticket_id})
+    ids = [row.ticket_id for row in rows]
+    if not ids:
+        return {"results": [], "next_cursor": None}
+
+    # Highlighting is the expensive part, so it only runs for the page rows
+    tickets = {}
+    for ticket, title, snippet in db.query(
+        Ticket,
+        _headline(Ticket.title, tsquery, _TITLE_OPTIONS),
+        _headline(Ticket.description, tsquery, _SNIPPET_OPTIONS),
+    ).filter(Ticket.id.in_(ids)):
+        tickets[ticket.id] = (ticket, title, snippet)
+    best_comment = (
+        select(TicketComment.id)
+        .where(TicketComment.ticket_id.in_(ids), TicketComment.search_vector.op("@@")(tsquery))
+        .order_by(TicketComment.ticket_id, func.ts_rank_cd(TicketComment.search_vector, tsquery).desc())
+        .distinct(TicketComment.ticket_id)
+    )
+    comments = dict(db.execute(
+        select(TicketComment.ticket_id, _headline(TicketComment.comment, tsquery, _SNIPPET_OPTIONS))
+        .where(TicketComment.id.in_(best_comment))
+    ).all())
+
+    results: list[dict] = []
+    for row in rows:
+        ticket, title, snippet = tickets[row.ticket_id]
+        results.append({
+            "ticket": _ticket_dict(ticket),
+            "rank": row.rank,
+            "highlights": {
+                "title": _highlight(title),
+                "description": _highlight(snippet),
+                "comment": _highlight(comments.get(row.ticket_id)),
+            },
+        })
+    return {"results": results, "next_cursor": next_cursor}
@@ -0,0 +1,42 @@
+from datetime import datetime, timedelta, timezone
+
+from core.config import settings
+from core.similarity import MinHashLSH
+from db.db import SessionLocal
+from models.ticket import Ticket
+from models.enums import TicketStatus
+
+similarity_index = MinHashLSH(max_items=settings.SIMILARITY_MAX_TICKETS)
+
+def _text(title: str, description: str) -> str:
+    return f"{title}\n{description}"
+
+def build_similarity_index() -> None:
+    # Startup only: later changes arrive through index_ticket
+    cutoff = datetime.now(timezone.utc).replace(tzinfo=None) - timedelta(days=settings.SIMILARITY_WINDOW_DAYS)
+    similarity_index.clear()
+    with SessionLocal() as db:
+        rows = (
+            db.query(Ticket.id, Ticket.title, Ticket.description)
+            .filter(Ticket.status != TicketStatus.CLOSED, Ticket.created_at >= cutoff)
+            .order_by(Ticket.id)
+            .yield_per(1000)
+        )
+        for row in rows:
+            similarity_index.add(row.id, similarity_index.signature(_text(row.title, row.description)))
+
+def index_ticket(data: dict, text_changed: bool = False) -> None:
+    if not settings.SIMILARITY_ENABLED:
+        return
+    if data["status"] == TicketStatus.CLOSED.value:
+        similarity_index.remove(data["id"])
+    elif text_changed or similarity_index.get_signature(data["id"]) is None:
+        similarity_index.add(data["id"], similarity_index.signature(_text(data["title"], data["description"])))
+
+def similar_ticket_ids(ticket_id: int, title: str, description: str) -> list[tuple[int, float]]:
+    if not settings.SIMILARITY_ENABLED:
+        return []
+    sig = similarity_index.get_signature(ticket_id)
+    if sig is None:
+        sig = similarity_index.signature(_text(title, description))
+    return similarity_index.query(sig, settings.SIMILARITY_THRESHOLD, exclude=ticket_id)
@@ -0,0 +1,133 @@
+from datetime import date, datetime, timedelta, timezone
+
+from fastapi import HTTPException
+from sqlalchemy import func, select, tuple_
+from sqlalchemy.orm import Session
+
+from core.config import settings
+from core.tdigest import TDigest
+from db.db import SessionLocal
+from models.ticket_history import TicketStatusHistory
+from models.sla_digest import SlaDigest, RollupWatermark
+
+_WATERMARK = "sla_digests"
+# Arbitrary application-wide key for pg_advisory_xact_lock
+_ROLLUP_LOCK = 7_318_002
+PERCENTILES = (0.5, 0.9, 0.99)
+
+def _samples(row: TicketStatusHistory):
+    # time_in_status: how long tickets sat in a status before leaving it
+    # time_to_reach: ticket age when it entered a status (e.g. time to resolve)
+    day = row.changed_at.date()
+    if row.in_status_seconds is not None and row.from_status is not None:
+        yield day, "time_in_status", row.from_status, row.in_status_seconds
+    if row.from_status is not None:
+        yield day, "time_to_reach", row.to_status, row.age_seconds
+
+def _keys(row: TicketStatusHistory, day: date, metric: str, status: str):
+    yield (day, metric, status, "all", "")
+    yield (day, metric, status, "priority", row.priority)
+    if row.assignee_id is not None:
+        yield (day, metric, status, "agent", str(row.assignee_id))
+
+def rollup_sla() -> bool:
+    # Folds new history rows into per-day digests. Rows are only taken once
+    # they are older than the grace period, so a transaction that committed a
+    # lower id late is not skipped by the watermark.
+    with SessionLocal() as db:
+        db.execute(select(func.pg_advisory_xact_lock(_ROLLUP_LOCK)))
+        # changed_at is stamped by the trigger, so compare against the database clock
+        cutoff = db.scalar(select(func.localtimestamp())) - timedelta(seconds=settings.SLA_ROLLUP_GRACE_SECONDS)
+        watermark = db.get(RollupWatermark, _WATERMARK)
+        if watermark is None:
+            watermark = RollupWatermark(name=_WATERMARK, position=0)
+            db.add(watermark)
+        rows = (
+            db.query(TicketStatusHistory)
+            .filter(TicketStatusHistory.id > watermark.position)
+            .order_by(TicketStatusHistory.id)
+            .limit(settings.SLA_ROLLUP_BATCH)
+            .all()
+        )
+        batch: dict[tuple, TDigest] = {}
+        processed = 0
+        for row in rows:
+            if row.changed_at > cutoff:
+                break
+            for day, metric, status, seconds in _samples(row):
+                for key in _keys(row, day, metric, status):
+                    digest = batch.get(key)
+                    if digest is None:
+                        digest = batch[key] = TDigest(settings.SLA_DIGEST_COMPRESSION)
+                    digest.add(max(seconds, 0.0))
+            watermark.position = row.id
+            processed += 1
+        if batch:
+            columns = (SlaDigest.day, SlaDigest.metric, SlaDigest.status, SlaDigest.dimension, SlaDigest.group_value)
+            existing = {
+                (d.day, d.metric, d.status, d.dimension, d.group_value): d
+                for d in db.query(SlaDigest).filter(tuple_(*columns).in_(list(batch)))
+            }
+            for key, digest in batch.items():
+                current = existing.get(key)
+                if current is None:
+                    day, metric, status, dimension, group_value = key
+                    db.add(SlaDigest(
+                        day=day, metric=metric, status=status, dimension=dimension,
+                        group_value=group_value, count=int(digest.count), digest=digest.to_dict(),
+                    ))
+                else:
+                    merged = TDigest.from_dict(current.digest)
+                    merged.merge(digest)
+                    current.count = int(merged.count)
+                    current.digest = merged.to_dict()
+        db.commit()
+    return processed == settings.SLA_ROLLUP_BATCH
+
+def get_sla_report(
+    db: Session,
+    metric: str,
+    group_by: str,
+    date_from: date | None,
+    date_to: date | None,
+) -> dict:
+    date_to = date_to or datetime.now(timezone.utc).date()
+    date_from = date_from or date_to - timedelta(days=30)
+    if date_from > date_to:
+        raise HTTPException(status_code=400, detail="date_from must not be after date_to")
+    dimension = "all" if group_by == "none" else group_by
+    # At most one digest per day and group is read, however many tickets
+    # changed status in the range
+    rows = (
+        db.query(SlaDigest.status, SlaDigest.group_value, SlaDigest.digest)
+        .filter(
+            SlaDigest.day >= date_from,
+            SlaDigest.day <= date_to,
+            SlaDigest.metric == metric,
+            SlaDigest.dimension == dimension,
+        )
+        .all()
+    )
+    merged: dict[tuple[str, str], TDigest] = {}
+    for status, group_value, data in rows:
+        digest = merged.get((status, group_value))
+        if digest is None:
+            digest = merged[(status, group_value)] = TDigest(settings.SLA_DIGEST_COMPRESSION)
+        digest.merge(TDigest.from_dict(data))
+    groups: list[dict] = []
+    for (status, group_value), digest in sorted(merged.items()):
+        entry = {"status": status, "count": int(digest.count)}
+        if dimension == "priority":
+            entry["priority"] = group_value
+        elif dimension == "agent":
+            entry["agent_id"] = int(group_value)
+        for q in PERCENTILES:
+            entry[f"p{int(q * 100)}_seconds"] = round(digest.quantile(q), 3)
+        groups.append(entry)
+    return {
+        "metric": metric,
+        "group_by": group_by,
+        "date_from": date_from,
+        "date_to": date_to,
+        "groups": groups,
+    }
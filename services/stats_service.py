@@ -0,0 +1,108 @@
+from sqlalchemy import String, and_, cast, delete, func, select
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.orm import Session
+
+from db.db import SessionLocal
+from models.ticket import Ticket
+from models.ticket_stat import TicketStat
+from models.enums import TicketStatus, TicketPriority
+
+def get_ticket_stats(db: Session) -> dict:
+    # Reads the counter table only: its size depends on statuses, priorities
+    # and agents, never on how many tickets exist
+    rows = (
+        db.query(TicketStat.status, TicketStat.priority, TicketStat.assignee_id, func.sum(TicketStat.count))
+        .group_by(TicketStat.status, TicketStat.priority, TicketStat.assignee_id)
+        .all()
+    )
+    by_status = {s.value: 0 for s in TicketStatus}
+    by_priority = {p.value: 0 for p in TicketPriority}
+    by_assignee: dict[int, dict] = {}
+    total = 0
+    for status, priority, assignee_id, count in rows:
+        count = int(count)
+        if not count:
+            continue
+        total += count
+        by_status[status] = by_status.get(status, 0) + count
+        by_priority[priority] = by_priority.get(priority, 0) + count
+        if assignee_id:
+            entry = by_assignee.setdefault(assignee_id, {"assignee_id": assignee_id, "total": 0, "by_status": {}})
+            entry["total"] += count
+            entry["by_status"][status] = entry["by_status"].get(status, 0) + count
+    return {
+        "total": total,
+        "by_status": by_status,
+        "by_priority": by_priority,
+        "unassigned": total - sum(e["total"] for e in by_assignee.values()),
+        "by_assignee": sorted(by_assignee.values(), key=lambda e: e["assignee_id"]),
+    }
+
+# Arbitrary application-wide key for pg_advisory_xact_lock
+_RECONCILE_LOCK = 7_318_001
+
+def _stats_drift(db: Session) -> dict[tuple, int]:
+    # One statement, so both sides come from the same snapshot and the drift
+    # is exact as of that moment
+    assignee = func.coalesce(Ticket.assigned_to, 0)
+    actual = (
+        select(
+            cast(Ticket.status, String).label("status"),
+            cast(Ticket.priority, String).label("priority"),
+            assignee.label("assignee_id"),
+            func.count(Ticket.id).label("n"),
+        )
+        .group_by(Ticket.status, Ticket.priority, assignee)
+        .subquery()
+    )
+    recorded = (
+        select(TicketStat.status, TicketStat.priority, TicketStat.assignee_id, func.sum(TicketStat.count).label("n"))
+        .group_by(TicketStat.status, TicketStat.priority, TicketStat.assignee_id)
+        .subquery()
+    )
+    diff = func.coalesce(actual.c.n, 0) - func.coalesce(recorded.c.n, 0)
+    stmt = (
+        select(
+            func.coalesce(actual.c.status, recorded.c.status),
+            func.coalesce(actual.c.priority, recorded.c.priority),
+            func.coalesce(actual.c.assignee_id, recorded.c.assignee_id),
+            diff,
+        )
+        .select_from(actual.join(
+            recorded,
+            and_(
+                actual.c.status == recorded.c.status,
+                actual.c.priority == recorded.c.priority,
+                actual.c.assignee_id == recorded.c.assignee_id,
+            ),
+            full=True,
+        ))
+        .where(diff != 0)
+    )
+    return {(status, priority, assignee_id): int(n) for status, priority, assignee_id, n in db.execute(stmt)}
+
+def _apply_drift(db: Session, drift: dict[tuple, int]) -> None:
+    rows = [
+        {"status": s, "priority": p, "assignee_id": a, "shard": 0, "count": n}
+        for (s, p, a), n in sorted(drift.items())
+    ]
+    stmt = insert(TicketStat).values(rows)
+    db.execute(stmt.on_conflict_do_update(
+        index_elements=["status", "priority", "assignee_id", "shard"],
+        set_={"count": TicketStat.count + stmt.excluded.count},
+    ))
+
+def reconcile_ticket_stats() -> bool:
+    # Corrections are deltas, which commute with the triggers' own deltas for
+    # writes committed after the drift was measured, so tickets are never
+    # locked. The advisory lock only keeps two workers from applying the
+    # same correction twice.
+    with SessionLocal() as db:
+        db.execute(select(func.pg_advisory_xact_lock(_RECONCILE_LOCK)))
+        drift = _stats_drift(db)
+        if drift:
+            _apply_drift(db, drift)
+        # Shard rows that netted out to zero carry no information
+        db.execute(delete(TicketStat).where(TicketStat.count == 0))
+        db.commit()
+    return False
@@ -1,14 +1,21 @@
 from fastapi import HTTPException
-from sqlalchemy.orm import Session
-from datetime import datetime, timezone
+from sqlalchemy import tuple_, and_, or_, select, update, exists, func, false, true, cast, String
+from sqlalchemy.orm import Session, Query, aliased
+from datetime import datetime
 
 from models.ticket import Ticket
 from models.user import User
-from models.enums import Role, TicketStatus
-from schemas.ticket import TicketCreate, TicketUpdate
-
-def _now():
-    return datetime.now(timezone.utc)
+from models.enums import Role, TicketStatus, TicketPriority, OPEN_WORK_STATUSES
+from schemas.ticket import TicketCreate, TicketUpdate, TicketFilters
+from core.config import settings
+from core.pagination import encode_cursor, decode_cursor
+from core.fields import parse_fields
+from core.etag import ticket_etag
+from core.events import publish_ticket_event
+from services.outbox_service import enqueue_events
+from services.similarity_service import index_ticket, similar_ticket_ids
+from services.user_service import get_cached_user, user_cache
+from services.assignment_service import track_ticket, claim_agent, release_claim, agent_loads
 
 def _ticket_dict(ticket: Ticket) -> dict:
     return {
@@ -23,6 +30,35 @@ def _ticket_dict(ticket: Ticket) -> dict:
         "updated_at": ticket.updated_at,
     }
 
+# List queries select these as plain tuples, with enums read as strings, so
+# rows go straight to dicts without building ORM objects
+_TICKET_FIELDS = {
+    "id": Ticket.id,
+    "title": Ticket.title,
+    "description": Ticket.description,
+    "priority": cast(Ticket.priority, String).label("priority"),
+    "status": cast(Ticket.status, String).label("status"),
+    "created_by": Ticket.created_by,
+    "assigned_to": Ticket.assigned_to,
+    "created_at": Ticket.created_at,
+    "updated_at": Ticket.updated_at,
+}
+# description can run to kilobytes and list views do not show it, so lists
+# leave it out unless asked for with ?fields=
+_TICKET_LIST_FIELDS = tuple(f for f in _TICKET_FIELDS if f != "description")
+
+def _ticket_fields(fields: str | None) -> tuple[str, ...]:
+    return parse_fields(fields, _TICKET_FIELDS, _TICKET_LIST_FIELDS)
+
+def _ticket_rows(db: Session, fields: tuple[str, ...], keys: tuple[str, ...] = ()) -> Query:
+    # Requested columns come first; pagination keys the caller did not ask
+    # for are appended and dropped again by zip() in _rows_to_dicts
+    names = tuple(dict.fromkeys(fields + keys))
+    return db.query(*(_TICKET_FIELDS[name] for name in names))
+
+def _rows_to_dicts(rows, fields: tuple[str, ...]) -> list[dict]:
+    return [dict(zip(fields, row)) for row in rows]
+
 def _get_ticket_or_404(db: Session, ticket_id: int) -> Ticket:
     ticket = db.query(Ticket).filter(Ticket.id == ticket_id).first()
     if not ticket:
@@ -43,6 +79,50 @@ def _can_access_ticket(current_user: dict, ticket: Ticket) -> bool:
         return True
     return False
 
+def _access_condition(current_user: dict):
+    # _can_access_ticket as a SQL predicate, so listings can scope in the
+    # query. None means unrestricted.
+    role = current_user.get("role")
+    user_id = current_user.get("user_id")
+    if role is None or user_id is None:
+        return false()
+    if role == Role.ADMIN.value:
+        return None
+    if role == Role.AGENT.value:
+        return or_(Ticket.created_by == user_id, Ticket.assigned_to == user_id)
+    return Ticket.created_by == user_id
+
+def _ticket_changed(event: str, data: dict, text_changed: bool = False) -> None:
+    # After commit only, so in-process consumers never see a rolled-back change
+    publish_ticket_event(event, data)
+    index_ticket(data, text_changed)
+    track_ticket(data)
+
+def _likely_duplicates(db: Session, current_user: dict, ticket: dict) -> list[dict]:
+    matches = similar_ticket_ids(ticket["id"], ticket["title"], ticket["description"])
+    if not matches:
+        return []
+    # The index only knows signatures; a primary-key read of the few
+    # candidates applies visibility and drops anything closed since
+    scores = dict(matches[:200])
+    rows = (
+        db.query(Ticket.id, Ticket.title, Ticket.status, Ticket.created_by, Ticket.assigned_to, Ticket.created_at)
+        .filter(Ticket.id.in_(list(scores)), Ticket.status != TicketStatus.CLOSED)
+        .all()
+    )
+    visible = [r for r in rows if _can_access_ticket(current_user, r)]
+    visible.sort(key=lambda r: (-scores[r.id], -r.id))
+    data: list[dict] = []
+    for r in visible[:settings.SIMILARITY_MAX_RESULTS]:
+        data.append({
+            "ticket_id": r.id,
+            "title": r.title,
+            "status": r.status.value,
+            "similarity": scores[r.id],
+            "created_at": r.created_at,
+        })
+    return data
+
 def create_ticket(db: Session, current_user: dict, payload: TicketCreate) -> dict:
     if current_user.get("role") != Role.EMPLOYEE.value:
         raise HTTPException(status_code=403, detail="Only employees can create tickets")
@@ -57,30 +137,183 @@ def create_ticket(db: Session, current_user: dict, payload: TicketCreate) -> dic
         status=TicketStatus.OPEN,
         created_by=user_id,
         assigned_to=None,
-        created_at=_now(),
-        updated_at=_now(),
     )
     db.add(ticket)
-    db.commit()
-    db.refresh(ticket)
-    return _ticket_dict(ticket)
+    # created_at/updated_at are server defaults, fetched by the INSERT's RETURNING
+    db.flush()
+    agent_id = None
+    if settings.AUTO_ASSIGN_ON_CREATE:
+        agent_id = claim_agent(ticket.id, ticket.priority.value)
+        if agent_id is not None:
+            # The heap can lag a demotion made on another worker, so the
+            # assignment only applies while the role still checks out
+            is_agent = exists().where(User.id == agent_id, User.role == Role.AGENT)
+            stmt = (
+                update(Ticket)
+                .where(Ticket.id == ticket.id, is_agent)
+                .values(assigned_to=agent_id, status=TicketStatus.ASSIGNED)
+                .returning(Ticket)
+                .execution_options(synchronize_session=False, populate_existing=True)
+            )
+            if db.execute(stmt).scalar_one_or_none() is None:
+                agent_loads.remove_agent(agent_id)
+                release_claim(ticket.id)
+                agent_id = None
+    data = _ticket_dict(ticket)
+    enqueue_events(db, "ticket.created", [data])
+    try:
+        db.commit()
+    except Exception:
+        if agent_id is not None:
+            release_claim(ticket.id)
+        raise
+    _ticket_changed("ticket.created", data)
+    return {**data, "likely_duplicates": _likely_duplicates(db, current_user, data)}
+
+def _apply_filters(query: Query, filters: TicketFilters) -> Query:
+    if filters.status is not None:
+        query = query.filter(Ticket.status == filters.status)
+    if filters.priority is not None:
+        query = query.filter(Ticket.priority == filters.priority)
+    if filters.assigned_to is not None:
+        query = query.filter(Ticket.assigned_to == filters.assigned_to)
+    if filters.created_from is not None:
+        query = query.filter(Ticket.created_at >= filters.created_from)
+    if filters.created_to is not None:
+        query = query.filter(Ticket.created_at < filters.created_to)
+    return query
+
+def _paginate(query: Query, fields: tuple[str, ...], limit: int, cursor: str | None, sort: str) -> dict:
+    # Keyset pagination: each page seeks past the last row of the previous one,
+    # so page cost stays flat no matter how deep the client has scrolled.
+    if sort == "updated_at":
+        query = query.order_by(Ticket.updated_at.desc(), Ticket.id.desc())
+    else:
+        query = query.order_by(Ticket.id.asc())
+    if cursor is not None:
+        position = decode_cursor(cursor)
+        if position.get("sort") != sort:
+            raise HTTPException(status_code=400, detail="Invalid cursor")
+        try:
+            last_id = int(position["id"])
+            if sort == "updated_at":
+                last_updated = datetime.fromisoformat(position["updated_at"])
+        except (KeyError, TypeError, ValueError):
+            raise HTTPException(status_code=400, detail="Invalid cursor")
+        if sort == "updated_at":
+            query = query.filter(
+                tuple_(Ticket.updated_at, Ticket.id) < tuple_(last_updated, last_id)
+            )
+        else:
+            query = query.filter(Ticket.id > last_id)
+    tickets = query.limit(limit + 1).all()
+    data = _rows_to_dicts(tickets[:limit], fields)
+    next_cursor = None
+    if len(tickets) > limit:
+        last = tickets[limit - 1]
+        position = {"sort": sort, "id": last.id}
+        if sort == "updated_at":
+            position["updated_at"] = last.updated_at.isoformat()
+        next_cursor = encode_cursor(position)
+    return {"tickets": data, "next_cursor": next_cursor}
 
-def get_my_tickets(db: Session, current_user: dict) -> list[dict]:
+def get_my_tickets(
+    db: Session,
+    current_user: dict,
+    filters: TicketFilters,
+    limit: int,
+    cursor: str | None = None,
+    sort: str = "id",
+    fields: str | None = None,
+) -> dict:
     user_id = current_user.get("user_id")
     if user_id is None:
         raise HTTPException(status_code=401, detail="Invalid token payload")
-    tickets = db.query(Ticket).filter(Ticket.created_by == user_id).all()
-    data: list[dict] = []
-    for t in tickets:
-        data.append(_ticket_dict(t))
-    return data
+    selected = _ticket_fields(fields)
+    query = _ticket_rows(db, selected, ("id", sort)).filter(Ticket.created_by == user_id)
+    return _paginate(_apply_filters(query, filters), selected, limit, cursor, sort)
 
-def get_all_tickets(db: Session) -> list[dict]:
-    tickets = db.query(Ticket).order_by(Ticket.id.asc()).all()
-    data: list[dict] = []
-    for t in tickets:
-        data.append(_ticket_dict(t))
-    return data
+def get_all_tickets(
+    db: Session,
+    filters: TicketFilters,
+    limit: int,
+    cursor: str | None = None,
+    sort: str = "id",
+    fields: str | None = None,
+) -> dict:
+    selected = _ticket_fields(fields)
+    query = _ticket_rows(db, selected, ("id", sort))
+    return _paginate(_apply_filters(query, filters), selected, limit, cursor, sort)
+
+def get_agent_inbox(
+    db: Session,
+    current_user: dict,
+    status: TicketStatus | None,
+    limit: int,
+    cursor: str | None = None,
+    fields: str | None = None,
+) -> dict:
+    user_id = current_user.get("user_id")
+    if user_id is None:
+        raise HTTPException(status_code=401, detail="Invalid token payload")
+    selected = _ticket_fields(fields)
+    if status is not None and status not in OPEN_WORK_STATUSES:
+        raise HTTPException(status_code=400, detail="Inbox only lists assigned or in_progress tickets")
+    statuses = [status] if status is not None else list(OPEN_WORK_STATUSES)
+    # Served by the partial ix_tickets_agent_inbox index, which only holds open
+    # work, so closed history never enters the scan. Critical first, then oldest.
+    query = (
+        _ticket_rows(db, selected, ("priority", "created_at", "id"))
+        .filter(Ticket.assigned_to == user_id, Ticket.status.in_(statuses))
+        .order_by(Ticket.priority.desc(), Ticket.created_at.asc(), Ticket.id.asc())
+    )
+    if cursor is not None:
+        position = decode_cursor(cursor)
+        try:
+            last_priority = TicketPriority(position["priority"])
+            last_created = datetime.fromisoformat(position["created_at"])
+            last_id = int(position["id"])
+        except (KeyError, TypeError, ValueError):
+            raise HTTPException(status_code=400, detail="Invalid cursor")
+        query = query.filter(or_(
+            Ticket.priority < last_priority,
+            and_(
+                Ticket.priority == last_priority,
+                tuple_(Ticket.created_at, Ticket.id) > tuple_(last_created, last_id),
+            ),
+        ))
+    tickets = query.limit(limit + 1).all()
+    data = _rows_to_dicts(tickets[:limit], selected)
+    next_cursor = None
+    if len(tickets) > limit:
+        last = tickets[limit - 1]
+        next_cursor = encode_cursor({
+            "priority": last.priority,
+            "created_at": last.created_at.isoformat(),
+            "id": last.id,
+        })
+    return {"tickets": data, "next_cursor": next_cursor}
+
+def get_ticket_etag(db: Session, current_user: dict, ticket_id: int) -> str:
+    # Reads only what the access check and the version need, so a 304 costs
+    # one narrow lookup and never builds the ticket payload.
+    ticket = (
+        db.query(Ticket.created_by, Ticket.assigned_to, Ticket.updated_at)
+        .filter(Ticket.id == ticket_id)
+        .first()
+    )
+    if not ticket:
+        raise HTTPException(status_code=404, detail="Ticket not found")
+    if not _can_access_ticket(current_user, ticket):
+        raise HTTPException(status_code=403, detail="Not allowed to view this ticket")
+    return ticket_etag(ticket_id, ticket.updated_at)
+
+def get_ticket_duplicates(db: Session, current_user: dict, ticket_id: int) -> dict:
+    ticket = _get_ticket_or_404(db, ticket_id)
+    if not _can_access_ticket(current_user, ticket):
+        raise HTTPException(status_code=403, detail="Not allowed to view this ticket")
+    data = _ticket_dict(ticket)
+    return {"ticket_id": ticket_id, "duplicates": _likely_duplicates(db, current_user, data)}
 
 def get_ticket_by_id(db: Session, current_user: dict, ticket_id: int) -> dict:
     ticket = _get_ticket_or_404(db, ticket_id)
@@ -88,103 +321,397 @@ def get_ticket_by_id(db: Session, current_user: dict, ticket_id: int) -> dict:
         raise HTTPException(status_code=403, detail="Not allowed to view this ticket")
     return _ticket_dict(ticket)
 
-def update_ticket(db: Session, current_user: dict, ticket_id: int, payload: TicketUpdate) -> dict:
+def _get_ticket_or_412(db: Session, ticket_id: int, versions: list[datetime | None] | None) -> Ticket:
     ticket = _get_ticket_or_404(db, ticket_id)
-    # access: only owner OR admin can edit
+    if versions is not None and ticket.updated_at not in versions:
+        raise HTTPException(status_code=412, detail="Precondition failed: ticket has changed")
+    return ticket
+
+def _changed_concurrently() -> HTTPException:
+    return HTTPException(status_code=409, detail="Ticket changed concurrently")
+
+def _cas_update(
+    db: Session,
+    ticket_id: int,
+    conditions: list,
+    values: dict,
+    event: str,
+    versions: list[datetime | None] | None = None,
+) -> dict | None:
+    # Check-and-set in one statement: the row only changes if it still matches
+    # the expected state, so concurrent writers cannot both pass the check.
+    if versions is not None:
+        # None is the version of a ticket whose updated_at was never set
+        version = Ticket.updated_at.in_([v for v in versions if v is not None])
+        if None in versions:
+            version = or_(version, Ticket.updated_at.is_(None))
+        conditions = [*conditions, version]
+    cas = (
+        update(Ticket)
+        .where(Ticket.id == ticket_id, *conditions)
+        .values(updated_at=func.now(), **values)
+        .returning(*Ticket.__table__.c)
+        .cte("cas")
+    )
+    # The outer SELECT reads the row as the statement's snapshot saw it, before
+    # any writer the UPDATE had to wait for, so a miss can be told apart from a
+    # request that was never going to apply
+    before = select(and_(*conditions).label("matched")).where(Ticket.id == ticket_id).subquery("before")
+    updated = aliased(Ticket, cas)
+    stmt = (
+        select(before.c.matched, updated)
+        .select_from(before)
+        .outerjoin(cas, true())
+        .execution_options(populate_existing=True)
+    )
+    row = db.execute(stmt).first()
+    if row is None:
+        return None
+    matched, ticket = row
+    if ticket is None:
+        if matched:
+            # The expected state held until another writer changed it first
+            raise _changed_concurrently()
+        return None
+    data = _ticket_dict(ticket)
+    enqueue_events(db, event, [data])
+    db.commit()
+    _ticket_changed(event, data, "title" in values or "description" in values)
+    return data
+
+def update_ticket(
+    db: Session,
+    current_user: dict,
+    ticket_id: int,
+    payload: TicketUpdate,
+    versions: list[datetime | None] | None = None,
+) -> dict:
     role = current_user.get("role")
     user_id = current_user.get("user_id")
-
     if role is None or user_id is None:
         raise HTTPException(status_code=401, detail="Invalid token payload")
-    if role != Role.ADMIN.value and ticket.created_by != user_id:
-        raise HTTPException(status_code=403, detail="Only owner or admin can edit ticket")
-    # Closed tickets cannot be edited
-    if ticket.status == TicketStatus.CLOSED:
-        raise HTTPException(status_code=400, detail="Closed tickets cannot be edited")
+    # access: only owner OR admin can edit, and closed tickets cannot be edited
+    conditions = [Ticket.status != TicketStatus.CLOSED]
+    if role != Role.ADMIN.value:
+        conditions.append(Ticket.created_by == user_id)
+    values = {}
     # Priority cannot be changed after assignment
     if payload.priority is not None:
-        if ticket.status != TicketStatus.OPEN:
-            raise HTTPException(status_code=400, detail="Priority cannot be changed after assignment")
-        ticket.priority = payload.priority
+        conditions.append(Ticket.status == TicketStatus.OPEN)
+        values["priority"] = payload.priority
     # Update title|description if provided
     if payload.title is not None:
-        ticket.title = payload.title
+        values["title"] = payload.title
     if payload.description is not None:
-        ticket.description = payload.description
-    ticket.updated_at = _now()
-    db.commit()
-    db.refresh(ticket)
-    return _ticket_dict(ticket)
-
-def assign_ticket(db: Session, current_user: dict, ticket_id: int, agent_id: int) -> dict:
-    if current_user.get("role") != Role.ADMIN.value:
-        raise HTTPException(status_code=403, detail="Only admin can assign tickets")
-    ticket = _get_ticket_or_404(db, ticket_id)
+        values["description"] = payload.description
+    data = _cas_update(db, ticket_id, conditions, values, "ticket.updated", versions)
+    if data is not None:
+        return data
+    ticket = _get_ticket_or_412(db, ticket_id, versions)
+    if role != Role.ADMIN.value and ticket.created_by != user_id:
+        raise HTTPException(status_code=403, detail="Only owner or admin can edit ticket")
     if ticket.status == TicketStatus.CLOSED:
         raise HTTPException(status_code=400, detail="Closed tickets cannot be edited")
-    if current_user.get("user_id") == ticket.created_by:
-        raise HTTPException(status_code=403, detail="Ticket creator cannot assign ticket")
-    agent = db.query(User).filter(User.id == agent_id).first()
+    if payload.priority is not None and ticket.status != TicketStatus.OPEN:
+        raise HTTPException(status_code=400, detail="Priority cannot be changed after assignment")
+    raise _changed_concurrently()
+
+def _assign_error(ticket, admin_id: int) -> HTTPException | None:
+    if ticket.status == TicketStatus.CLOSED:
+        return HTTPException(status_code=400, detail="Closed tickets cannot be edited")
+    if admin_id == ticket.created_by:
+        return HTTPException(status_code=403, detail="Ticket creator cannot assign ticket")
+    if ticket.status != TicketStatus.OPEN:
+        return HTTPException(status_code=400, detail="Ticket can be assigned only when status is open")
+    return None
+
+def _get_agent_or_error(db: Session, agent_id: int) -> dict:
+    # Only needs the role, so the user cache usually answers without a query
+    agent = get_cached_user(db, agent_id)
     if not agent:
         raise HTTPException(status_code=404, detail="Agent not found")
-    if agent.role.value != Role.AGENT.value:
+    if agent["role"] != Role.AGENT.value:
         raise HTTPException(status_code=400, detail="User is not an agent")
-    if ticket.status != TicketStatus.OPEN:
-        raise HTTPException(status_code=400, detail="Ticket can be assigned only when status is open")
-    ticket.assigned_to = agent_id
-    ticket.status = TicketStatus.ASSIGNED
-    ticket.updated_at = _now()
-    db.commit()
-    db.refresh(ticket)
-    return _ticket_dict(ticket)
+    return agent
 
-def update_ticket_status(db: Session, current_user: dict, ticket_id: int, new_status: TicketStatus) -> dict:
-    ticket = _get_ticket_or_404(db, ticket_id)
+def assign_ticket(
+    db: Session,
+    current_user: dict,
+    ticket_id: int,
+    agent_id: int,
+    versions: list[datetime | None] | None = None,
+) -> dict:
+    if current_user.get("role") != Role.ADMIN.value:
+        raise HTTPException(status_code=403, detail="Only admin can assign tickets")
+    admin_id = current_user.get("user_id")
+    is_agent = exists().where(User.id == agent_id, User.role == Role.AGENT)
+    data = _cas_update(
+        db,
+        ticket_id,
+        [Ticket.status == TicketStatus.OPEN, Ticket.created_by != admin_id, is_agent],
+        {"assigned_to": agent_id, "status": TicketStatus.ASSIGNED},
+        "ticket.assigned",
+        versions,
+    )
+    if data is not None:
+        return data
+    ticket = _get_ticket_or_412(db, ticket_id, versions)
     if ticket.status == TicketStatus.CLOSED:
         raise HTTPException(status_code=400, detail="Closed tickets cannot be edited")
-    role = current_user.get("role")
-    user_id = current_user.get("user_id")
-    if role is None or user_id is None:
-        raise HTTPException(status_code=401, detail="Invalid token payload")
-    allowed_next = {
-        TicketStatus.OPEN: TicketStatus.ASSIGNED,
-        TicketStatus.ASSIGNED: TicketStatus.IN_PROGRESS,
-        TicketStatus.IN_PROGRESS: TicketStatus.RESOLVED,
-        TicketStatus.RESOLVED: TicketStatus.CLOSED,
-    }
-    expected_next = allowed_next.get(ticket.status)
+    if admin_id == ticket.created_by:
+        raise HTTPException(status_code=403, detail="Ticket creator cannot assign ticket")
+    # The guard read the role from the database; the cache may still say agent
+    user_cache.delete(agent_id)
+    _get_agent_or_error(db, agent_id)
+    raise _assign_error(ticket, admin_id) or _changed_concurrently()
+
+_ALLOWED_NEXT = {
+    TicketStatus.OPEN: TicketStatus.ASSIGNED,
+    TicketStatus.ASSIGNED: TicketStatus.IN_PROGRESS,
+    TicketStatus.IN_PROGRESS: TicketStatus.RESOLVED,
+    TicketStatus.RESOLVED: TicketStatus.CLOSED,
+}
+_PREVIOUS = {nxt: cur for cur, nxt in _ALLOWED_NEXT.items()}
+
+def _transition_error(ticket, role: str, user_id: int, new_status: TicketStatus) -> HTTPException | None:
+    if ticket.status == TicketStatus.CLOSED:
+        return HTTPException(status_code=400, detail="Closed tickets cannot be edited")
+    expected_next = _ALLOWED_NEXT.get(ticket.status)
     if expected_next is None:
-        raise HTTPException(status_code=400, detail="Invalid current ticket status")
+        return HTTPException(status_code=400, detail="Invalid current ticket status")
     if new_status != expected_next:
-        raise HTTPException(status_code=400, detail="Invalid status transition")
+        return HTTPException(status_code=400, detail="Invalid status transition")
     # assigned -> in_progress : only assigned agent
     if new_status == TicketStatus.IN_PROGRESS:
         if role != Role.AGENT.value:
-            raise HTTPException(status_code=403, detail="Only agent can move ticket to in_progress")
+            return HTTPException(status_code=403, detail="Only agent can move ticket to in_progress")
         if ticket.assigned_to is None or ticket.assigned_to != user_id:
-            raise HTTPException(status_code=403, detail="Agent can update only assigned tickets")
+            return HTTPException(status_code=403, detail="Agent can update only assigned tickets")
     # in_progress -> resolved : agent(assigned) OR admin
     if new_status == TicketStatus.RESOLVED:
         if role == Role.AGENT.value:
             if ticket.assigned_to is None or ticket.assigned_to != user_id:
-                raise HTTPException(status_code=403, detail="Agent can resolve only assigned tickets")
+                return HTTPException(status_code=403, detail="Agent can resolve only assigned tickets")
         elif role != Role.ADMIN.value:
-            raise HTTPException(status_code=403, detail="Only agent or admin can resolve ticket")
+            return HTTPException(status_code=403, detail="Only agent or admin can resolve ticket")
     # resolved -> closed : agent(assigned) OR admin
     if new_status == TicketStatus.CLOSED:
         if role == Role.AGENT.value:
             if ticket.assigned_to is None or ticket.assigned_to != user_id:
-                raise HTTPException(status_code=403, detail="Agent can close only assigned tickets")
+                return HTTPException(status_code=403, detail="Agent can close only assigned tickets")
         elif role != Role.ADMIN.value:
-            raise HTTPException(status_code=403, detail="Only agent or admin can close ticket")
-    ticket.status = new_status
-    ticket.updated_at = _now()
-    db.commit()
-    db.refresh(ticket)
-    return _ticket_dict(ticket)
+            return HTTPException(status_code=403, detail="Only agent or admin can close ticket")
+    return None
 
-def close_ticket(db: Session, current_user: dict, ticket_id: int) -> dict:
-    ticket = _get_ticket_or_404(db, ticket_id)
+def _transition_guard(role: str, user_id: int, new_status: TicketStatus):
+    # SQL form of _transition_error: the WHERE clause a row must satisfy to
+    # move to new_status. None means the role can never make this move.
+    previous = _PREVIOUS.get(new_status)
+    if previous is None:
+        return None
+    condition = Ticket.status == previous
+    if new_status == TicketStatus.IN_PROGRESS:
+        if role != Role.AGENT.value:
+            return None
+        condition = and_(condition, Ticket.assigned_to == user_id)
+    if new_status in (TicketStatus.RESOLVED, TicketStatus.CLOSED):
+        if role == Role.AGENT.value:
+            condition = and_(condition, Ticket.assigned_to == user_id)
+        elif role != Role.ADMIN.value:
+            return None
+    return condition
+
+def _transition(
+    db: Session,
+    current_user: dict,
+    ticket_id: int,
+    new_status: TicketStatus,
+    versions: list[datetime | None] | None = None,
+    explain=_transition_error,
+) -> dict:
+    role = current_user.get("role")
+    user_id = current_user.get("user_id")
+    if role is None or user_id is None:
+        raise HTTPException(status_code=401, detail="Invalid token payload")
+    guard = _transition_guard(role, user_id, new_status)
+    if guard is not None:
+        data = _cas_update(db, ticket_id, [guard], {"status": new_status}, "ticket.status_changed", versions)
+        if data is not None:
+            return data
+    # Only the failure path reads the ticket, to report why the update did not apply
+    ticket = _get_ticket_or_412(db, ticket_id, versions)
+    raise explain(ticket, role, user_id, new_status) or _changed_concurrently()
+
+def update_ticket_status(
+    db: Session,
+    current_user: dict,
+    ticket_id: int,
+    new_status: TicketStatus,
+    versions: list[datetime | None] | None = None,
+) -> dict:
+    return _transition(db, current_user, ticket_id, new_status, versions)
+
+def _close_error(ticket, role: str, user_id: int, new_status: TicketStatus) -> HTTPException | None:
     if ticket.status != TicketStatus.RESOLVED:
-        raise HTTPException(status_code=400, detail="Ticket must be resolved before closing")
-    return update_ticket_status(db, current_user, ticket_id, TicketStatus.CLOSED)
+        return HTTPException(status_code=400, detail="Ticket must be resolved before closing")
+    return _transition_error(ticket, role, user_id, new_status)
+
+def close_ticket(
+    db: Session,
+    current_user: dict,
+    ticket_id: int,
+    versions: list[datetime | None] | None = None,
+) -> dict:
+    return _transition(db, current_user, ticket_id, TicketStatus.CLOSED, versions, explain=_close_error)
+
+def _unique_ids(ticket_ids: list[int]) -> list[int]:
+    return list(dict.fromkeys(ticket_ids))
+
+def _bulk_results(db: Session, ticket_ids: list[int], updated: dict[int, dict], explain) -> list[dict]:
+    # Rows the UPDATE skipped are read back once to report why each one failed
+    failed_ids = [tid for tid in ticket_ids if tid not in updated]
+    failed = {}
+    if failed_ids:
+        for t in db.query(Ticket).filter(Ticket.id.in_(failed_ids)).all():
+            failed[t.id] = t
+    results: list[dict] = []
+    for tid in ticket_ids:
+        if tid in updated:
+            results.append({"ticket_id": tid, "success": True, "ticket": updated[tid]})
+            continue
+        ticket = failed.get(tid)
+        if ticket is None:
+            error = HTTPException(status_code=404, detail="Ticket not found")
+        else:
+            error = explain(ticket)
+            if error is None:
+                error = HTTPException(status_code=409, detail="Ticket changed concurrently")
+        results.append({
+            "ticket_id": tid,
+            "success": False,
+            "status_code": error.status_code,
+            "detail": error.detail,
+        })
+    return results
+
+def bulk_assign_tickets(db: Session, current_user: dict, ticket_ids: list[int], agent_id: int) -> dict:
+    if current_user.get("role") != Role.ADMIN.value:
+        raise HTTPException(status_code=403, detail="Only admin can assign tickets")
+    admin_id = current_user.get("user_id")
+    if admin_id is None:
+        raise HTTPException(status_code=401, detail="Invalid token payload")
+    _get_agent_or_error(db, agent_id)
+    ticket_ids = _unique_ids(ticket_ids)
+    # The cached role only answers the common case; the UPDATE re-checks it so
+    # an agent demoted since it was cached never receives tickets
+    is_agent = exists().where(User.id == agent_id, User.role == Role.AGENT)
+    stmt = (
+        update(Ticket)
+        .where(
+            Ticket.id.in_(ticket_ids),
+            Ticket.status == TicketStatus.OPEN,
+            Ticket.created_by != admin_id,
+            is_agent,
+        )
+        .values(assigned_to=agent_id, status=TicketStatus.ASSIGNED, updated_at=func.now())
+        .returning(Ticket)
+        .execution_options(synchronize_session=False)
+    )
+    updated = {t.id: _ticket_dict(t) for t in db.execute(stmt).scalars()}
+    if not updated:
+        # Either no ticket qualified or the cached role was stale: a fresh
+        # read reports a demoted agent instead of blaming every ticket
+        user_cache.delete(agent_id)
+        _get_agent_or_error(db, agent_id)
+    results = _bulk_results(db, ticket_ids, updated, lambda t: _assign_error(t, admin_id))
+    enqueue_events(db, "ticket.assigned", list(updated.values()))
+    db.commit()
+    for data in updated.values():
+        _ticket_changed("ticket.assigned", data)
+    return {"updated": len(updated), "failed": len(results) - len(updated), "results": results}
+
+def bulk_update_ticket_status(db: Session, current_user: dict, ticket_ids: list[int], new_status: TicketStatus) -> dict:
+    role = current_user.get("role")
+    user_id = current_user.get("user_id")
+    if role is None or user_id is None:
+        raise HTTPException(status_code=401, detail="Invalid token payload")
+    # A status change alone would leave assigned tickets without an assignee
+    if new_status == TicketStatus.ASSIGNED:
+        raise HTTPException(status_code=400, detail="Use /bulk/assign to assign tickets")
+    ticket_ids = _unique_ids(ticket_ids)
+    guard = _transition_guard(role, user_id, new_status)
+    updated: dict[int, dict] = {}
+    if guard is not None:
+        stmt = (
+            update(Ticket)
+            .where(Ticket.id.in_(ticket_ids), guard)
+            .values(status=new_status, updated_at=func.now())
+            .returning(Ticket)
+            .execution_options(synchronize_session=False)
+        )
+        updated = {t.id: _ticket_dict(t) for t in db.execute(stmt).scalars()}
+    results = _bulk_results(
+        db, ticket_ids, updated, lambda t: _transition_error(t, role, user_id, new_status)
+    )
+    enqueue_events(db, "ticket.status_changed", list(updated.values()))
+    db.commit()
+    for data in updated.values():
+        _ticket_changed("ticket.status_changed", data)
+    return {"updated": len(updated), "failed": len(results) - len(updated), "results": results}
+
+def auto_assign_backlog(db: Session, current_user: dict, limit: int) -> dict:
+    if current_user.get("role") != Role.ADMIN.value:
+        raise HTTPException(status_code=403, detail="Only admin can assign tickets")
+    admin_id = current_user.get("user_id")
+    if admin_id is None:
+        raise HTTPException(status_code=401, detail="Invalid token payload")
+    # Most urgent first; SKIP LOCKED lets concurrent passes split the backlog
+    backlog = (
+        db.query(Ticket.id, Ticket.priority)
+        .filter(Ticket.status == TicketStatus.OPEN, Ticket.created_by != admin_id)
+        .order_by(Ticket.priority.desc(), Ticket.created_at.asc(), Ticket.id.asc())
+        .limit(limit)
+        .with_for_update(skip_locked=True)
+        .all()
+    )
+    by_agent: dict[int, list[int]] = {}
+    for row in backlog:
+        agent_id = claim_agent(row.id, row.priority.value)
+        if agent_id is None:
+            break
+        by_agent.setdefault(agent_id, []).append(row.id)
+
+    # One UPDATE per agent rather than per ticket. The role check guards
+    # against an agent demoted since the heap last saw it.
+    updated: dict[int, dict] = {}
+    for agent_id, ticket_ids in by_agent.items():
+        is_agent = exists().where(User.id == agent_id, User.role == Role.AGENT)
+        stmt = (
+            update(Ticket)
+            .where(Ticket.id.in_(ticket_ids), Ticket.status == TicketStatus.OPEN, is_agent)
+            .values(assigned_to=agent_id, status=TicketStatus.ASSIGNED, updated_at=func.now())
+            .returning(Ticket)
+            .execution_options(synchronize_session=False)
+        )
+        rows = {t.id: _ticket_dict(t) for t in db.execute(stmt).scalars()}
+        if not rows:
+            agent_loads.remove_agent(agent_id)
+        updated.update(rows)
+    claimed = [tid for ticket_ids in by_agent.values() for tid in ticket_ids]
+    enqueue_events(db, "ticket.assigned", list(updated.values()))
+    try:
+        db.commit()
+    except Exception:
+        for tid in claimed:
+            release_claim(tid)
+        raise
+    for tid in claimed:
+        if tid not in updated:
+            release_claim(tid)
+    results: list[dict] = []
+    for row in backlog:
+        data = updated.get(row.id)
+        if data is not None:
+            _ticket_changed("ticket.assigned", data)
+            results.append({"ticket_id": row.id, "agent_id": data["assigned_to"]})
+    return {"assigned": len(results), "skipped": len(backlog) - len(results), "results": results}
@@ -1,9 +1,15 @@
 from fastapi import HTTPException
+from sqlalchemy import func, cast, String
 from sqlalchemy.orm import Session
 
 from models.user import User
 from models.enums import Role
+from core.config import settings
+from core.cache import TTLCache
 from core.security import hash_password
+from core.fields import parse_fields
+from services.assignment_service import agent_changed
+from services.revocation_service import revoke_user_tokens, apply_revocation
 
 #Based on admin things like listing,user with role,view users and everything like this 
 def user_dict(user: User) -> dict:
@@ -16,21 +22,49 @@ def user_dict(user: User) -> dict:
         "created_at": user.created_at,
     }
 
+# Plain-tuple projection for listings; see _TICKET_FIELDS in ticket_service
+_USER_FIELDS = {
+    "id": User.id,
+    "name": User.name,
+    "email": User.email,
+    "role": cast(User.role, String).label("role"),
+    "is_active": User.is_active,
+    "created_at": User.created_at,
+}
+
+# id -> user_dict, never the password hash. Writes in this process refresh
+# the entry after commit; the TTL bounds staleness from other workers.
+user_cache = TTLCache(maxsize=settings.USER_CACHE_SIZE, ttl=settings.USER_CACHE_TTL_SECONDS)
+
+def _user_written(data: dict) -> dict:
+    user_cache.set(data["id"], dict(data))
+    agent_changed(data)
+    return data
+
+def get_cached_user(db: Session, user_id: int) -> dict | None:
+    data = user_cache.get(user_id)
+    if data is None:
+        row = db.query(*_USER_FIELDS.values()).filter(User.id == user_id).first()
+        if row is None:
+            return None
+        data = dict(zip(_USER_FIELDS, row))
+        user_cache.set(user_id, data)
+    return dict(data)
+
 def get_user_by_id(db: Session, user_id: int) -> dict:
-    user = db.query(User).filter(User.id == user_id).first()
-    if not user:
+    user = get_cached_user(db, user_id)
+    if user is None:
         raise HTTPException(status_code=404, detail="User not found")
-    return user_dict(user)
+    return user
 
-def list_users(db: Session) -> list[dict]:
-    users = db.query(User).order_by(User.id.asc()).all()
-    data: list[dict] = []
-    for u in users:
-        data.append(user_dict(u))
+def list_users(db: Session, fields: str | None = None) -> list[dict]:
+    selected = parse_fields(fields, _USER_FIELDS, tuple(_USER_FIELDS))
+    users = db.query(*(_USER_FIELDS[f] for f in selected)).order_by(User.id.asc()).all()
+    data = [dict(zip(selected, u)) for u in users]
     return { 'Data' : data}
 
 def create_user_by_admin(db: Session, name: str, email: str, password: str, role: Role) -> dict:
-    existing = db.query(User).filter(User.email == email).first()
+    existing = db.query(User).filter(func.lower(User.email) == email.lower()).first()
     if existing:
         raise HTTPException(status_code=400, detail="Email already registered")
     user = User(
@@ -43,24 +77,33 @@ def create_user_by_admin(db: Session, name: str, email: str, password: str, role
     db.add(user)
     db.commit()
     db.refresh(user)
-    return user_dict(user)
+    return _user_written(user_dict(user))
 
 def update_user_role(db: Session, user_id: int, role: Role) -> dict:
     user = db.query(User).filter(User.id == user_id).first()
     if not user:
         raise HTTPException(status_code=404, detail="User not found")
-    user.role = role
+    version = None
+    if user.role != role:
+        user.role = role
+        # Tokens still carry the old role, so they stop working now
+        version = revoke_user_tokens(db, user_id)
     db.commit()
+    if version is not None:
+        apply_revocation(user_id, version)
     db.refresh(user)
-    return user_dict(user)
+    return _user_written(user_dict(user))
 
 def admin_pwd_update(db: Session,user_id: int,new_password:str):
     user = db.query(User).filter(User.id == user_id).first()
-    if not user_id:
+    if not user:
         raise HTTPException(status_code=404, detail="User not found")
     user.password_hash = hash_password(new_password)
+    version = revoke_user_tokens(db, user_id)
     db.commit()
+    apply_revocation(user_id, version)
     db.refresh(user)
+    _user_written(user_dict(user))
     return {"user_id": user_id}
 
 
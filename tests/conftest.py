@@ -0,0 +1,69 @@
+import os
+
+import pytest
+
+# Settings are read at import time, so point the app at the test database
+# before anything from it is imported. Without TEST_DATABASE_URL the
+# database tests are skipped; the placeholder URL is never connected to.
+TEST_DATABASE_URL = os.environ.get("TEST_DATABASE_URL")
+os.environ["DATABASE_URL"] = TEST_DATABASE_URL or "postgresql+psycopg2://localhost/helpdesk_test"
+os.environ.setdefault("SECRET_KEY", "test-secret")
+os.environ["ASYNC_DB"] = "false"
+
+import importlib
+import pkgutil
+from pathlib import Path
+
+from sqlalchemy import text
+
+from core.security import hash_password
+from db.db import Base, SessionLocal, engine
+from models.user import User
+from models.enums import Role
+from services.assignment_service import agent_loads
+from services.user_service import user_cache
+
+# Every model module, so create_all builds the full schema
+for module in pkgutil.iter_modules([str(Path(__file__).resolve().parent.parent / "models")]):
+    importlib.import_module(f"models.{module.name}")
+
+@pytest.fixture(scope="session")
+def database():
+    if not TEST_DATABASE_URL:
+        pytest.skip("TEST_DATABASE_URL is not set")
+    if engine.dialect.name != "postgresql":
+        pytest.skip("TEST_DATABASE_URL must point at PostgreSQL")
+    Base.metadata.drop_all(engine)
+    Base.metadata.create_all(engine)
+    yield engine
+    Base.metadata.drop_all(engine)
+
+@pytest.fixture
+def db(database):
+    tables = ", ".join(table.name for table in Base.metadata.sorted_tables)
+    with database.begin() as conn:
+        conn.execute(text(f"TRUNCATE {tables} RESTART IDENTITY CASCADE"))
+    # Ids restart with every test, so nothing cached may outlive one
+    user_cache.clear()
+    agent_loads.rebuild([], {})
+    session = SessionLocal()
+    yield session
+    session.close()
+
+@pytest.fixture
+def users(db):
+    # current_user payloads as get_current_user builds them, by role name
+    created = {}
+    password_hash = hash_password("password")
+    for name, role in [
+        ("employee", Role.EMPLOYEE),
+        ("admin", Role.ADMIN),
+        ("agent", Role.AGENT),
+        ("agent2", Role.AGENT),
+    ]:
+        user = User(name=name, email=f"{name}@example.com", password_hash=password_hash, role=role, is_active=True)
+        db.add(user)
+        db.flush()
+        created[name] = {"user_id": user.id, "role": role.value}
+    db.commit()
+    return created
@@ -0,0 +1,36 @@
+import io
+import json
+
+import pytest
+
+from models.ticket import Ticket
+from services import import_service
+from services.import_service import import_tickets, open_text
+
+def _upload(data: bytes):
+    return open_text(io.BytesIO(data))
+
+@pytest.fixture
+def small_chunks(monkeypatch):
+    # Several chunks commit before the bad line is read, as in a large upload
+    monkeypatch.setattr(import_service, "IMPORT_CHUNK_SIZE", 2)
+
+def test_invalid_utf8_is_reported_for_its_row(db, users, small_chunks):
+    creator = users["employee"]["user_id"]
+    lines = [json.dumps({"title": f"Ticket {i}", "description": "Printer jams", "priority": "low", "created_by": creator}).encode() for i in range(6)]
+    lines[4] = b'{"title": "Caf\xe9 printer", "description": "Printer jams", "priority": "low", "created_by": %d}' % creator
+    report = import_tickets(db, _upload(b"\n".join(lines) + b"\n"), "ndjson")
+
+    assert report["inserted"] == 5
+    assert report["errors"] == [{"line": 5, "error": "Invalid UTF-8"}]
+    assert db.query(Ticket).count() == 5
+
+def test_invalid_utf8_in_csv_is_reported_for_its_row(db, users, small_chunks):
+    creator = users["employee"]["user_id"]
+    rows = [b"title,description,priority,created_by"]
+    rows += [b"Ticket %d,Printer jams,low,%d" % (i, creator) for i in range(4)]
+    rows[3] = b"Caf\xe9 printer,Printer jams,low,%d" % creator
+    report = import_tickets(db, _upload(b"\r\n".join(rows) + b"\r\n"), "csv")
+
+    assert report["inserted"] == 3
+    assert report["errors"] == [{"line": 4, "error": "Invalid UTF-8"}]
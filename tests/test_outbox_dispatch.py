@@ -0,0 +1,94 @@
+import json
+import threading
+import time
+from datetime import timedelta
+from http.server import ThreadingHTTPServer
+
+import pytest
+from sqlalchemy import update
+
+from cli.webhook_receiver import _Handler
+from core.config import settings
+from models.enums import TicketPriority
+from models.outbox import OutboxEvent
+from schemas.ticket import TicketCreate
+from services import outbox_service
+from services.outbox_service import _now, dispatch_outbox
+from services.ticket_service import create_ticket
+
+@pytest.fixture
+def receiver(monkeypatch):
+    # The stand-in receiver from cli/, on a free port, with its own counters
+    handler = type("Receiver", (_Handler,), {"fail_every": 0, "received": 0})
+    server = ThreadingHTTPServer(("127.0.0.1", 0), handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    monkeypatch.setattr(settings, "OUTBOX_WEBHOOK_URL", f"http://127.0.0.1:{server.server_port}/")
+    yield handler
+    server.shutdown()
+    server.server_close()
+
+def _create_tickets(db, users, count: int) -> list[int]:
+    payload = TicketCreate(title="Printer jam", description="Floor 3 printer jams", priority=TicketPriority.HIGH)
+    return [create_ticket(db, users["employee"], payload)["id"] for _ in range(count)]
+
+def _deliveries(capsys) -> list[dict]:
+    return [json.loads(line) for line in capsys.readouterr().out.splitlines()]
+
+def _events(db) -> list[OutboxEvent]:
+    db.expire_all()
+    return db.query(OutboxEvent).order_by(OutboxEvent.id).all()
+
+def test_dispatch_delivers_each_event_once(db, users, receiver, capsys):
+    ticket_ids = _create_tickets(db, users, 5)
+    assert dispatch_outbox() is False
+    deliveries = _deliveries(capsys)
+    events = _events(db)
+    assert [d["ticket_id"] for d in deliveries] == ticket_ids
+    assert [d["idempotency_key"] for d in deliveries] == [str(e.id) for e in events]
+    assert all(e.delivered_at is not None and e.attempts == 1 for e in events)
+    assert dispatch_outbox() is False
+    assert _deliveries(capsys) == []
+
+def test_failed_deliveries_are_retried(db, users, receiver, capsys):
+    receiver.fail_every = 2
+    _create_tickets(db, users, 4)
+    dispatch_outbox()
+    failed = [e for e in _events(db) if e.delivered_at is None]
+    assert len(failed) == 2
+    assert all("503" in e.last_error and e.available_at > _now() for e in failed)
+
+    receiver.fail_every = 0
+    db.execute(update(OutboxEvent).values(available_at=_now()))
+    db.commit()
+    dispatch_outbox()
+    assert all(e.delivered_at is not None for e in _events(db))
+    assert [e.attempts for e in _events(db) if e.id in {f.id for f in failed}] == [2, 2]
+    assert len(_deliveries(capsys)) == 4
+
+def test_claim_lease_covers_a_full_batch_of_timeouts(db, users, receiver):
+    _create_tickets(db, users, 1)
+    claimed_at = _now()
+    with outbox_service.SessionLocal() as session:
+        [event] = outbox_service._claim(session)
+    lease = timedelta(seconds=settings.OUTBOX_BATCH_SIZE * settings.OUTBOX_TIMEOUT_SECONDS)
+    assert event.available_at > claimed_at + lease
+
+def test_batch_that_outruns_its_lease_hands_back_the_rest(db, users, receiver, monkeypatch, capsys):
+    monkeypatch.setattr(settings, "OUTBOX_BATCH_SIZE", 3)
+    monkeypatch.setattr(settings, "OUTBOX_TIMEOUT_SECONDS", 0.5)
+    monkeypatch.setattr(settings, "OUTBOX_LEASE_MARGIN_SECONDS", 0)
+    deliver = outbox_service._deliver
+
+    def slow_deliver(event):
+        # Each delivery uses up most of the lease a row was given
+        time.sleep(0.6)
+        deliver(event)
+
+    monkeypatch.setattr(outbox_service, "_deliver", slow_deliver)
+    _create_tickets(db, users, 3)
+    dispatch_outbox()
+    events = _events(db)
+    assert [e.delivered_at is not None for e in events] == [True, True, False]
+    assert events[2].attempts == 0 and events[2].available_at <= _now()
+    assert len(_deliveries(capsys)) == 2
@@ -0,0 +1,115 @@
+from contextlib import contextmanager
+from itertools import cycle
+
+import pytest
+from fastapi import HTTPException
+from sqlalchemy import event, insert, text
+
+from db.db import engine
+from models.comment import TicketComment
+from models.enums import Role, TicketPriority, TicketStatus
+from models.ticket import Ticket
+from models.user import User
+from schemas.ticket import TicketFilters
+from services.auth_service import login_user
+from services.comment_service import list_comments
+from services.ticket_service import get_agent_inbox, get_all_tickets, get_my_tickets
+
+TICKETS = 20000
+CREATORS = 500
+AGENTS = 200
+
+@pytest.fixture
+def seeded(db, users):
+    # Shaped like a helpdesk that has run for a while: most tickets are
+    # closed, open work is a thin slice spread over many creators and agents
+    def add_users(prefix: str, role: Role, count: int) -> list[int]:
+        rows = [
+            {"name": f"{prefix}-{i}", "email": f"{prefix}-{i}@example.com", "password_hash": "x", "role": role}
+            for i in range(count)
+        ]
+        return list(db.scalars(insert(User).returning(User.id), rows))
+
+    creators = [users["employee"]["user_id"], *add_users("employee", Role.EMPLOYEE, CREATORS)]
+    agents = [users["agent"]["user_id"], users["agent2"]["user_id"], *add_users("agent", Role.AGENT, AGENTS)]
+    creator, agent, priority = cycle(creators), cycle(agents), cycle(TicketPriority)
+    rows = []
+    for i in range(TICKETS):
+        status = TicketStatus.CLOSED
+        if i % 100 == 0:
+            status = TicketStatus.OPEN
+        elif i % 100 in (1, 2):
+            status = TicketStatus.IN_PROGRESS
+        rows.append({
+            "title": f"Ticket {i}",
+            "description": "Printer on floor 3 jams",
+            "priority": next(priority),
+            "status": status,
+            "created_by": next(creator),
+            "assigned_to": None if status == TicketStatus.OPEN else next(agent),
+        })
+    db.execute(insert(Ticket), rows)
+    db.execute(insert(TicketComment), [
+        {"ticket_id": i % 2000 + 1, "user_id": users["employee"]["user_id"], "comment": f"Comment {i}"}
+        for i in range(TICKETS)
+    ])
+    db.commit()
+    with engine.connect() as conn:
+        conn.execution_options(isolation_level="AUTOCOMMIT").execute(text("ANALYZE"))
+    return users
+
+@contextmanager
+def _captured():
+    statements = []
+
+    def capture(conn, cursor, statement, parameters, context, executemany):
+        if statement.lstrip().upper().startswith("SELECT"):
+            statements.append((statement, parameters))
+
+    event.listen(engine, "before_cursor_execute", capture)
+    try:
+        yield statements
+    finally:
+        event.remove(engine, "before_cursor_execute", capture)
+
+def _plans(call) -> list[str]:
+    with _captured() as statements:
+        try:
+            call()
+        except HTTPException:
+            pass
+    plans = []
+    with engine.connect() as conn:
+        for statement, parameters in statements:
+            rows = conn.exec_driver_sql(f"EXPLAIN {statement}", parameters)
+            plans.append("\n".join(row[0] for row in rows))
+    return plans
+
+def _assert_uses(plans: list[str], index: str) -> None:
+    assert any(index in plan for plan in plans), "\n\n".join(plans)
+
+def test_agent_inbox_uses_partial_inbox_index(db, seeded):
+    plans = _plans(lambda: get_agent_inbox(db, seeded["agent"], None, 50))
+    _assert_uses(plans, "ix_tickets_agent_inbox")
+
+def test_my_tickets_uses_creator_index(db, seeded):
+    plans = _plans(lambda: get_my_tickets(db, seeded["employee"], TicketFilters(), 50))
+    _assert_uses(plans, "ix_tickets_created_by_id")
+
+def test_status_filter_uses_status_index(db, seeded):
+    filters = TicketFilters(status=TicketStatus.OPEN, priority=TicketPriority.HIGH)
+    plans = _plans(lambda: get_all_tickets(db, filters, 50))
+    _assert_uses(plans, "ix_tickets_status_priority_created_at")
+
+def test_comment_list_uses_ticket_index(db, seeded):
+    plans = _plans(lambda: list_comments(db, seeded["admin"], 1, 50))
+    _assert_uses(plans, "ix_ticket_comments_ticket_id_id")
+
+def test_login_uses_lower_email_index(db, seeded):
+    plans = _plans(lambda: login_user(db, "Employee@Example.com", "wrong password"))
+    _assert_uses(plans, "ix_users_email_lower")
+
+def test_assignee_filter_uses_assignee_index(db, seeded):
+    filters = TicketFilters(assigned_to=seeded["agent"]["user_id"], status=TicketStatus.CLOSED)
+    plans = _plans(lambda: get_all_tickets(db, filters, 50))
+    _assert_uses(plans, "ix_tickets_assigned_to_status")
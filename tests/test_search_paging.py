@@ -0,0 +1,36 @@
+from sqlalchemy import insert
+
+from models.comment import TicketComment
+from models.enums import TicketPriority, TicketStatus
+from models.ticket import Ticket
+from services.search_service import search_tickets
+
+def _walk(db, current_user, q: str, limit: int) -> list[int]:
+    seen, cursor = [], None
+    while True:
+        page = search_tickets(db, current_user, q, limit, cursor)
+        seen.extend(result["ticket"]["id"] for result in page["results"])
+        cursor = page["next_cursor"]
+        if cursor is None:
+            return seen
+
+def test_paging_walks_every_row_of_a_rank_tie(db, users):
+    # Identical text ranks identically, so the pages split inside the tie
+    # and only the id half of the cursor can tell the rows apart
+    ids = list(db.scalars(insert(Ticket).returning(Ticket.id), [
+        {
+            "title": "Printer jam",
+            "description": "The printer on floor 3 jams on every print job",
+            "priority": TicketPriority.HIGH,
+            "status": TicketStatus.OPEN,
+            "created_by": users["employee"]["user_id"],
+        }
+        for _ in range(7)
+    ]))
+    db.execute(insert(TicketComment), [
+        {"ticket_id": ids[0], "user_id": users["employee"]["user_id"], "comment": "Still jams"},
+    ])
+    db.commit()
+
+    assert _walk(db, users["admin"], "jams", 2) == sorted(ids, reverse=True)
+    assert _walk(db, users["admin"], "printer jam", 3) == sorted(ids, reverse=True)
@@ -0,0 +1,98 @@
+import threading
+import time
+
+import pytest
+from fastapi import HTTPException
+from sqlalchemy import select, text
+
+from db.db import SessionLocal, engine
+from models.enums import TicketPriority, TicketStatus
+from models.ticket import Ticket
+from schemas.ticket import TicketCreate
+from services.ticket_service import assign_ticket, create_ticket, update_ticket_status
+
+THREADS = 12
+
+def _wait_for_lock_waiters(conn, count: int) -> None:
+    for _ in range(500):
+        # pg_stat_activity is read once per transaction unless the snapshot is dropped
+        conn.execute(text("SELECT pg_stat_clear_snapshot()"))
+        waiting = conn.execute(text(
+            "SELECT count(*) FROM pg_stat_activity"
+            " WHERE datname = current_database() AND wait_event_type = 'Lock'"
+        )).scalar_one()
+        if waiting >= count:
+            return
+        time.sleep(0.01)
+    raise AssertionError(f"only {waiting} of {count} writers blocked on the ticket")
+
+def _race(ticket_id: int, call) -> list[int]:
+    # The ticket stays row-locked until every writer has started its UPDATE
+    # and is queued behind the lock, so all of them checked the same state
+    # and only the first in the queue can still find it when the lock goes
+    codes: list[int] = []
+    lock = threading.Lock()
+
+    def worker(i: int) -> None:
+        with SessionLocal() as db:
+            try:
+                call(db, i)
+                code = 200
+            except HTTPException as exc:
+                code = exc.status_code
+        with lock:
+            codes.append(code)
+
+    threads = [threading.Thread(target=worker, args=(i,)) for i in range(THREADS)]
+    with engine.connect() as holder:
+        holder.execute(select(Ticket.id).where(Ticket.id == ticket_id).with_for_update())
+        for thread in threads:
+            thread.start()
+        _wait_for_lock_waiters(holder, THREADS)
+        holder.rollback()
+    for thread in threads:
+        thread.join()
+    return sorted(codes)
+
+def _current(ticket_id: int):
+    with SessionLocal() as db:
+        return db.query(Ticket.status, Ticket.assigned_to).filter(Ticket.id == ticket_id).one()
+
+@pytest.fixture
+def ticket_id(db, users):
+    payload = TicketCreate(title="Printer jam", description="Floor 3 printer jams", priority=TicketPriority.HIGH)
+    return create_ticket(db, users["employee"], payload)["id"]
+
+def test_concurrent_assign_has_one_winner(db, users, ticket_id):
+    agents = [users["agent"]["user_id"], users["agent2"]["user_id"]]
+    codes = _race(ticket_id, lambda s, i: assign_ticket(s, users["admin"], ticket_id, agents[i % 2]))
+    assert codes == [200] + [409] * (THREADS - 1)
+    ticket = _current(ticket_id)
+    assert ticket.status == TicketStatus.ASSIGNED
+    assert ticket.assigned_to in agents
+
+def test_concurrent_status_transition_has_one_winner(db, users, ticket_id):
+    assign_ticket(db, users["admin"], ticket_id, users["agent"]["user_id"])
+    codes = _race(ticket_id, lambda s, i: update_ticket_status(s, users["agent"], ticket_id, TicketStatus.IN_PROGRESS))
+    assert codes == [200] + [409] * (THREADS - 1)
+    assert _current(ticket_id).status == TicketStatus.IN_PROGRESS
+
+def test_concurrent_resolve_by_agent_and_admin_has_one_winner(db, users, ticket_id):
+    assign_ticket(db, users["admin"], ticket_id, users["agent"]["user_id"])
+    update_ticket_status(db, users["agent"], ticket_id, TicketStatus.IN_PROGRESS)
+    actors = [users["agent"], users["admin"]]
+    codes = _race(ticket_id, lambda s, i: update_ticket_status(s, actors[i % 2], ticket_id, TicketStatus.RESOLVED))
+    assert codes == [200] + [409] * (THREADS - 1)
+    assert _current(ticket_id).status == TicketStatus.RESOLVED
+
+def test_repeated_requests_are_rejected_not_conflicts(db, users, ticket_id):
+    # Nothing raced these: the ticket was already past the requested state
+    # when the request arrived, so it is the usual 400
+    assign_ticket(db, users["admin"], ticket_id, users["agent"]["user_id"])
+    with pytest.raises(HTTPException) as exc:
+        assign_ticket(db, users["admin"], ticket_id, users["agent"]["user_id"])
+    assert exc.value.status_code == 400
+    update_ticket_status(db, users["agent"], ticket_id, TicketStatus.IN_PROGRESS)
+    with pytest.raises(HTTPException) as exc:
+        update_ticket_status(db, users["agent"], ticket_id, TicketStatus.IN_PROGRESS)
+    assert exc.value.status_code == 400
@@ -0,0 +1,32 @@
+from datetime import datetime
+
+import pytest
+from fastapi import HTTPException
+from sqlalchemy import update
+
+from core.etag import if_match_versions, ticket_etag
+from models.enums import TicketPriority
+from models.ticket import Ticket
+from schemas.ticket import TicketCreate, TicketUpdate
+from services.ticket_service import create_ticket, get_ticket_etag, update_ticket
+
+def test_etag_round_trips_through_if_match():
+    for updated_at in (None, datetime(2026, 1, 2, 3, 4, 5, 6)):
+        assert if_match_versions(ticket_etag(7, updated_at), 7) == [updated_at]
+
+def test_ticket_without_updated_at_gets_a_usable_etag(db, users):
+    payload = TicketCreate(title="Printer jam", description="Floor 3 printer jams", priority=TicketPriority.HIGH)
+    ticket_id = create_ticket(db, users["employee"], payload)["id"]
+    db.execute(update(Ticket).where(Ticket.id == ticket_id).values(updated_at=None))
+    db.commit()
+
+    etag = get_ticket_etag(db, users["employee"], ticket_id)
+    assert etag == f'"t{ticket_id}-0"'
+    versions = if_match_versions(etag, ticket_id)
+    data = update_ticket(db, users["employee"], ticket_id, TicketUpdate(title="Printer jam on floor 3"), versions)
+    assert data["updated_at"] is not None
+
+    # The write stamped updated_at, so the unstamped tag is now stale
+    with pytest.raises(HTTPException) as exc:
+        update_ticket(db, users["employee"], ticket_id, TicketUpdate(title="Printer fixed"), versions)
+    assert exc.value.status_code == 412